@@ -6,3 +6,7 @@ class AuthorizationConfig(AppConfig):
     name = "apps.authorization"
     label = "authorization"
     verbose_name = "Authorization (RBAC)"
+
+    def ready(self) -> None:
+        # Conecta la invalidación del cache de permisos por rol.
+        from apps.authorization import signals  # noqa: F401
@@ -29,9 +29,10 @@ class ConciliacionView(APIView):
     Solo accesible para usuarios cuyo rol incluya "conciliacion.run".
 
     El token JWT identifica *quién* es el usuario.
-    La base de datos decide *qué puede hacer* consultando su rol en tiempo real.
-    Cambiar el rol del usuario en DB surte efecto en el siguiente request,
-    sin necesidad de revocar ni renovar tokens.
+    La base de datos decide *qué puede hacer* a través de su rol (tabla rol →
+    permisos cacheada por worker). Cambiar el rol del usuario surte efecto sin
+    revocar ni renovar tokens, con una demora de a lo sumo
+    ``RBAC_PERMISSIONS_TTL`` (30 s) en los workers que no hicieron el cambio.
     """
     permission_classes = [IsAuthenticated, HasPermission("conciliacion.run")]
 
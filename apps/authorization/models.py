@@ -46,8 +46,9 @@ class Role(models.Model):
     Diseño deliberado:
     - Un usuario tiene exactamente UN rol (ForeignKey en User).
     - Un rol puede tener N permisos (ManyToMany).
-    - Cambiar el rol de un usuario surte efecto inmediato en la próxima
-      verificación de permisos, sin necesidad de renovar tokens.
+    - Cambiar el rol de un usuario o sus permisos surte efecto sin renovar
+      tokens: de inmediato en el proceso que hizo el cambio y, en los demás
+      workers, a lo sumo ``RBAC_PERMISSIONS_TTL`` (30 s) después.
     """
 
     name = models.CharField(
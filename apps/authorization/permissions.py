@@ -9,26 +9,53 @@ Uso en views:
     class ConciliacionView(APIView):
         permission_classes = [HasPermission("conciliacion.run")]
 
-    # O combinando con IsAuthenticated explícito:
+    # O exigiendo además autenticación en la misma clase:
     class ReporteView(APIView):
-        permission_classes = [IsAuthenticated, HasPermission("reportes.export")]
+        permission_classes = [AuthenticatedHasPermission("reportes.export")]
 
 Diseño:
   - `HasPermission` es una *factory function* que devuelve una clase DRF.
     Esto permite pasar el código de permiso de forma declarativa en la
     lista `permission_classes`, que DRF instancia en tiempo de request.
-  - Toda la lógica de autorización vive en `services.user_has_permission`.
-    Esta capa solo actúa de adaptador entre DRF y el servicio.
+  - Toda la lógica de autorización vive en `services`. Esta capa solo actúa
+    de adaptador entre DRF y el servicio.
+  - Los permisos del usuario se resuelven una sola vez por request
+    (`request_permissions`) y los comparten todas las clases de permiso
+    de la view.
+  - Las variantes ``Authenticated*`` equivalen a ``[IsAuthenticated, X]`` en
+    una sola clase: DRF recorre una clase de permiso menos por request.
   - Fail-closed: cualquier usuario sin rol o sin el permiso recibe 403.
+  - `RBACView` instancia la cadena de `permission_classes` una sola vez por
+    clase de view. Las clases de permiso de este módulo no guardan estado
+    por request, así que las instancias se comparten sin riesgo.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
+from sys import intern
+
 from rest_framework.permissions import BasePermission
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
-from .services import user_has_permission
+from .services import get_user_permission_set
+
+
+def request_permissions(request: Request) -> frozenset[str]:
+    """
+    Permisos del usuario de *request*, resueltos una sola vez por request.
+
+    Se guardan en el propio request junto con el usuario al que pertenecen;
+    si ``request.user`` cambia (p. ej. ``force_authenticate``), se recalculan.
+    """
+    user = request.user
+    cached = getattr(request, "_rbac_permissions", None)
+    if cached is not None and cached[0] is user:
+        return cached[1]
+    permissions = get_user_permission_set(user)
+    request._rbac_permissions = (user, permissions)
+    return permissions
 
 
 class HasPermission:
@@ -36,9 +63,11 @@ class HasPermission:
     Factory que retorna una clase DRF ``BasePermission`` que valida
     el permiso *permission_code* contra el rol del usuario autenticado.
 
-    El permiso se consulta en base de datos en cada request, lo que
-    garantiza que cambios de rol surtan efecto inmediatamente sin
-    necesidad de renovar tokens JWT.
+    El permiso se evalúa en cada request contra la tabla de permisos por rol
+    cacheada en ``services``, así que los cambios de rol surten efecto sin
+    renovar tokens JWT: de inmediato en el proceso que hizo el cambio y con
+    una demora de a lo sumo ``RBAC_PERMISSIONS_TTL`` (30 s) en los demás
+    workers.
 
     Args:
         permission_code: Código del permiso. Ej: ``"conciliacion.run"``.
@@ -60,17 +89,29 @@ class HasPermission:
     """
 
     def __new__(cls, permission_code: str) -> type[BasePermission]:  # type: ignore[misc]
-        class _HasPermission(BasePermission):
-            _code: str = permission_code
-            message: str = f"Permiso denegado. Se requiere: '{permission_code}'."
+        return _has_permission_class(intern(permission_code))
+
 
-            def has_permission(self, request: Request, view: APIView) -> bool:  # type: ignore[override]
-                return user_has_permission(request.user, self._code)
+# Las factories memoizan la clase generada: el mismo código (o el mismo
+# conjunto de códigos, sin importar el orden) devuelve siempre la misma
+# clase, en lugar de crear una nueva con type() por cada uso. Los códigos se
+# internan igual que en `services`, para que la pertenencia al frozenset de
+# permisos del usuario se resuelva por identidad.
 
-        # Nombres legibles en logs, repr() y Swagger.
-        _HasPermission.__name__ = f"HasPermission({permission_code!r})"
-        _HasPermission.__qualname__ = f"HasPermission({permission_code!r})"
-        return _HasPermission
+
+@lru_cache(maxsize=None)
+def _has_permission_class(permission_code: str) -> type[BasePermission]:
+    class _HasPermission(BasePermission):
+        _code: str = permission_code
+        message: str = f"Permiso denegado. Se requiere: '{permission_code}'."
+
+        def has_permission(self, request: Request, view: APIView) -> bool:  # type: ignore[override]
+            return self._code in request_permissions(request)
+
+    # Nombres legibles en logs, repr() y Swagger.
+    _HasPermission.__name__ = f"HasPermission({permission_code!r})"
+    _HasPermission.__qualname__ = f"HasPermission({permission_code!r})"
+    return _HasPermission
 
 
 class HasAnyPermission:
@@ -87,19 +128,23 @@ class HasAnyPermission:
     """
 
     def __new__(cls, *permission_codes: str) -> type[BasePermission]:  # type: ignore[misc]
-        class _HasAnyPermission(BasePermission):
-            _codes: tuple[str, ...] = permission_codes
-            message: str = "Permiso denegado. No posee ninguno de los permisos requeridos."
+        return _has_any_permission_class(tuple(sorted(map(intern, permission_codes))))
 
-            def has_permission(self, request: Request, view: APIView) -> bool:  # type: ignore[override]
-                return any(
-                    user_has_permission(request.user, code) for code in self._codes
-                )
 
-        label = " | ".join(permission_codes)
-        _HasAnyPermission.__name__ = f"HasAnyPermission({label!r})"
-        _HasAnyPermission.__qualname__ = f"HasAnyPermission({label!r})"
-        return _HasAnyPermission
+@lru_cache(maxsize=None)
+def _has_any_permission_class(permission_codes: tuple[str, ...]) -> type[BasePermission]:
+    class _HasAnyPermission(BasePermission):
+        _codes: tuple[str, ...] = permission_codes
+        _required: frozenset[str] = frozenset(permission_codes)
+        message: str = "Permiso denegado. No posee ninguno de los permisos requeridos."
+
+        def has_permission(self, request: Request, view: APIView) -> bool:  # type: ignore[override]
+            return not self._required.isdisjoint(request_permissions(request))
+
+    label = " | ".join(permission_codes)
+    _HasAnyPermission.__name__ = f"HasAnyPermission({label!r})"
+    _HasAnyPermission.__qualname__ = f"HasAnyPermission({label!r})"
+    return _HasAnyPermission
 
 
 class HasAllPermissions:
@@ -114,16 +159,92 @@ class HasAllPermissions:
     """
 
     def __new__(cls, *permission_codes: str) -> type[BasePermission]:  # type: ignore[misc]
-        class _HasAllPermissions(BasePermission):
-            _codes: tuple[str, ...] = permission_codes
-            message: str = "Permiso denegado. No posee todos los permisos requeridos."
-
-            def has_permission(self, request: Request, view: APIView) -> bool:  # type: ignore[override]
-                return all(
-                    user_has_permission(request.user, code) for code in self._codes
-                )
-
-        label = " & ".join(permission_codes)
-        _HasAllPermissions.__name__ = f"HasAllPermissions({label!r})"
-        _HasAllPermissions.__qualname__ = f"HasAllPermissions({label!r})"
-        return _HasAllPermissions
+        return _has_all_permissions_class(tuple(sorted(map(intern, permission_codes))))
+
+
+@lru_cache(maxsize=None)
+def _has_all_permissions_class(permission_codes: tuple[str, ...]) -> type[BasePermission]:
+    class _HasAllPermissions(BasePermission):
+        _codes: tuple[str, ...] = permission_codes
+        _required: frozenset[str] = frozenset(permission_codes)
+        message: str = "Permiso denegado. No posee todos los permisos requeridos."
+
+        def has_permission(self, request: Request, view: APIView) -> bool:  # type: ignore[override]
+            return self._required.issubset(request_permissions(request))
+
+    label = " & ".join(permission_codes)
+    _HasAllPermissions.__name__ = f"HasAllPermissions({label!r})"
+    _HasAllPermissions.__qualname__ = f"HasAllPermissions({label!r})"
+    return _HasAllPermissions
+
+
+# ---------------------------------------------------------------------------
+# Variantes que además exigen autenticación
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def _authenticated_class(permission_class: type[BasePermission]) -> type[BasePermission]:
+    class _Authenticated(permission_class):  # type: ignore[valid-type, misc]
+        def has_permission(self, request: Request, view: APIView) -> bool:  # type: ignore[override]
+            user = request.user
+            return bool(user and user.is_authenticated) and super().has_permission(request, view)
+
+    _Authenticated.__name__ = f"Authenticated{permission_class.__name__}"
+    _Authenticated.__qualname__ = f"Authenticated{permission_class.__qualname__}"
+    return _Authenticated
+
+
+class AuthenticatedHasPermission:
+    """
+    Equivalente a ``[IsAuthenticated, HasPermission(code)]`` en una sola clase.
+
+    Sin usuario autenticado DRF responde 401, igual que con
+    ``IsAuthenticated`` explícito.
+
+    Example::
+
+        class ConciliacionView(APIView):
+            permission_classes = [AuthenticatedHasPermission("conciliacion.run")]
+    """
+
+    def __new__(cls, permission_code: str) -> type[BasePermission]:  # type: ignore[misc]
+        return _authenticated_class(HasPermission(permission_code))
+
+
+class AuthenticatedHasAnyPermission:
+    """Equivalente a ``[IsAuthenticated, HasAnyPermission(*codes)]``."""
+
+    def __new__(cls, *permission_codes: str) -> type[BasePermission]:  # type: ignore[misc]
+        return _authenticated_class(HasAnyPermission(*permission_codes))
+
+
+class AuthenticatedHasAllPermissions:
+    """Equivalente a ``[IsAuthenticated, HasAllPermissions(*codes)]``."""
+
+    def __new__(cls, *permission_codes: str) -> type[BasePermission]:  # type: ignore[misc]
+        return _authenticated_class(HasAllPermissions(*permission_codes))
+
+
+class RBACView(APIView):
+    """
+    Base para views protegidas con RBAC.
+
+    DRF instancia cada clase de ``permission_classes`` en cada request;
+    aquí la tupla de instancias se construye una vez por subclase y se
+    reutiliza. Solo admite permisos sin estado por instancia (los de este
+    módulo y los de DRF lo son).
+
+    Example::
+
+        class ConciliacionView(RBACView):
+            permission_classes = [IsAuthenticated, HasPermission("conciliacion.run")]
+    """
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _perms(cls) -> tuple[BasePermission, ...]:
+        return tuple(permission() for permission in cls.permission_classes)
+
+    def get_permissions(self) -> tuple[BasePermission, ...]:  # type: ignore[override]
+        return self._perms()
@@ -0,0 +1,381 @@
+"""
+authorization.schemas
+=====================
+Metadata OpenAPI (drf-spectacular) de las views del módulo RBAC.
+
+Separada de views.py para que el import de las views no materialice
+descripciones Markdown ni objetos OpenApiExample/OpenApiResponse:
+
+  - Cada `*_schema()` construye los kwargs de `extend_schema` recién al
+    invocarse y queda memoizada con `functools.cache`.
+  - `config.openapi.documented()` solo las invoca si
+    `settings.OPENAPI_SCHEMA_ENABLED` es True. Con el flag apagado (ej. workers de producción sin /api/schema/)
+    las views quedan sin decorar y nada de esto se construye.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import Any
+
+from drf_spectacular.utils import (
+    OpenApiExample,
+    OpenApiResponse,
+    inline_serializer,
+)
+from rest_framework import serializers as s
+
+
+# ---------------------------------------------------------------------------
+# Shared inline response schemas
+# ---------------------------------------------------------------------------
+
+
+@cache
+def _403_response() -> OpenApiResponse:
+    return OpenApiResponse(
+        description=(
+            "**Permiso denegado (403).**\n\n"
+            "El usuario está autenticado pero su rol no incluye el permiso requerido.\n\n"
+            "Esto ocurre cuando:\n"
+            "- El usuario no tiene rol asignado.\n"
+            "- Su rol existe pero no tiene el permiso necesario.\n\n"
+            "El rol se evalúa en cada request contra la tabla rol → permisos cacheada "
+            "por worker; no se requiere rotación de tokens para que los cambios de rol "
+            "surtan efecto (a lo sumo `RBAC_PERMISSIONS_TTL`, 30 s, entre workers)."
+        ),
+        examples=[
+            OpenApiExample(
+                name="Sin permiso",
+                value={"detail": "Permiso denegado. Se requiere: 'conciliacion.run'."},
+                response_only=True,
+            )
+        ],
+    )
+
+
+@cache
+def _401_response() -> OpenApiResponse:
+    return OpenApiResponse(
+        description=(
+            "**No autenticado (401).**\n\n"
+            "El header `Authorization: Bearer <access_token>` está ausente, "
+            "mal formado o el token ha expirado.\n\n"
+            "Renovar el token con `POST /api/auth/refresh/` y reintentar."
+        ),
+        examples=[
+            OpenApiExample(
+                name="Token ausente o expirado",
+                value={"detail": "Authentication credentials were not provided."},
+                response_only=True,
+            )
+        ],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Schemas por view
+# ---------------------------------------------------------------------------
+
+
+@cache
+def conciliacion_run_schema() -> dict[str, Any]:
+    return dict(
+        tags=["RBAC — Ejemplos de autorización"],
+        summary="Ejecutar conciliación",
+        description=(
+            "Inicia el proceso de conciliación automática.\n\n"
+            "### Autorización requerida\n"
+            "| Permiso | Descripción |\n"
+            "|---------|-------------|\n"
+            "| `conciliacion.run` | Ejecutar el proceso de conciliación automática |\n\n"
+            "### Roles que tienen este permiso (configuración inicial)\n"
+            "| Rol | ¿Tiene acceso? |\n"
+            "|-----|----------------|\n"
+            "| Solo Lectura | ❌ No |\n"
+            "| Analista | ✅ Sí |\n"
+            "| Supervisor | ✅ Sí |\n"
+            "| Administrador | ✅ Sí |\n\n"
+            "### Mecanismo de validación\n"
+            "1. El JWT del header `Authorization` identifica al usuario.\n"
+            "2. `HasPermission('conciliacion.run')` busca el código entre los permisos "
+            "del rol del usuario (tabla rol → permisos cacheada en memoria de cada worker).\n"
+            "3. Si el resultado es `False` → respuesta `403` inmediata, sin ejecutar el handler.\n\n"
+            "> **Cambios de rol sin renovar el JWT:** si el administrador cambia el rol "
+            "o sus permisos, el cambio aplica de inmediato en el worker que lo hizo y, en "
+            "los demás, con una demora de a lo sumo `RBAC_PERMISSIONS_TTL` (30 s por defecto)."
+        ),
+        request=None,
+        responses={
+            200: OpenApiResponse(
+                response=inline_serializer(
+                    name="ConciliacionRunResponse",
+                    fields={"status": s.CharField(help_text="Estado del proceso iniciado.")},
+                ),
+                description="Proceso de conciliación iniciado correctamente.",
+                examples=[
+                    OpenApiExample(
+                        name="Éxito",
+                        value={"status": "conciliacion iniciada"},
+                        response_only=True,
+                    )
+                ],
+            ),
+            401: _401_response(),
+            403: _403_response(),
+        },
+    )
+
+
+@cache
+def conciliacion_detail_schema() -> dict[str, Any]:
+    return dict(
+        tags=["RBAC — Ejemplos de autorización"],
+        summary="Ver conciliaciones",
+        description=(
+            "Retorna la lista de conciliaciones del sistema.\n\n"
+            "### Autorización requerida\n"
+            "| Permiso | Descripción |\n"
+            "|---------|-------------|\n"
+            "| `conciliacion.view` | Ver resultados y estado de conciliaciones |\n\n"
+            "### Roles que tienen este permiso\n"
+            "| Rol | ¿Tiene acceso? |\n"
+            "|-----|----------------|\n"
+            "| Solo Lectura | ✅ Sí |\n"
+            "| Analista | ✅ Sí |\n"
+            "| Supervisor | ✅ Sí |\n"
+            "| Administrador | ✅ Sí |\n\n"
+            "Este endpoint es de **solo lectura**: no modifica estado. "
+            "Disponible para todos los roles básicos del sistema."
+        ),
+        responses={
+            200: OpenApiResponse(
+                response=inline_serializer(
+                    name="ConciliacionListResponse",
+                    fields={
+                        "conciliaciones": s.ListField(
+                            child=s.DictField(),
+                            help_text="Lista de registros de conciliación.",
+                        )
+                    },
+                ),
+                description="Lista de conciliaciones.",
+                examples=[
+                    OpenApiExample(
+                        name="Lista vacía",
+                        value={"conciliaciones": []},
+                        response_only=True,
+                    )
+                ],
+            ),
+            401: _401_response(),
+            403: _403_response(),
+        },
+    )
+
+
+@cache
+def dashboard_schema() -> dict[str, Any]:
+    return dict(
+        tags=["RBAC — Ejemplos de autorización"],
+        summary="Dashboard principal",
+        description=(
+            "Retorna los widgets del panel principal.\n\n"
+            "### Autorización requerida — `HasAnyPermission` (lógica OR)\n"
+            "El usuario necesita **al menos uno** de estos permisos:\n\n"
+            "| Permiso | Descripción |\n"
+            "|---------|-------------|\n"
+            "| `dashboard.view` | Ver el panel de métricas principal |\n"
+            "| `admin.full` | Acceso completo al panel de administración |\n\n"
+            "### Roles que tienen acceso\n"
+            "| Rol | `dashboard.view` | `admin.full` | ¿Acceso? |\n"
+            "|-----|-----------------|--------------|----------|\n"
+            "| Solo Lectura | ✅ | ❌ | ✅ |\n"
+            "| Analista | ✅ | ❌ | ✅ |\n"
+            "| Supervisor | ✅ | ❌ | ✅ |\n"
+            "| Administrador | ✅ | ✅ | ✅ |\n\n"
+            "### Cuándo usar `HasAnyPermission`\n"
+            "Ideal para recursos compartidos entre distintos roles donde "
+            "cada rol llega por un camino diferente de permisos. "
+            "Evita duplicar lógica en múltiples roles."
+        ),
+        responses={
+            200: OpenApiResponse(
+                response=inline_serializer(
+                    name="DashboardResponse",
+                    fields={
+                        "widgets": s.ListField(
+                            child=s.DictField(),
+                            help_text="Lista de widgets del dashboard.",
+                        )
+                    },
+                ),
+                description="Widgets del dashboard.",
+                examples=[
+                    OpenApiExample(
+                        name="Dashboard vacío",
+                        value={"widgets": []},
+                        response_only=True,
+                    )
+                ],
+            ),
+            401: _401_response(),
+            403: OpenApiResponse(
+                description=(
+                    "**Permiso denegado (403).**\n\n"
+                    "El usuario no tiene ni `dashboard.view` ni `admin.full`."
+                ),
+                examples=[
+                    OpenApiExample(
+                        name="Sin permiso",
+                        value={"detail": "Permiso denegado. No posee ninguno de los permisos requeridos."},
+                        response_only=True,
+                    )
+                ],
+            ),
+        },
+    )
+
+
+@cache
+def admin_panel_schema() -> dict[str, Any]:
+    return dict(
+        tags=["RBAC — Ejemplos de autorización"],
+        summary="Panel de administración",
+        description=(
+            "Accede al panel de administración avanzado.\n\n"
+            "### Autorización requerida — `HasAllPermissions` (lógica AND)\n"
+            "El usuario necesita **todos** estos permisos simultáneamente:\n\n"
+            "| Permiso | Descripción |\n"
+            "|---------|-------------|\n"
+            "| `admin.read` | Leer configuración y estado del sistema |\n"
+            "| `admin.write` | Modificar configuración del sistema |\n\n"
+            "Si el usuario tiene solo uno de los dos, recibe `403`.\n\n"
+            "### Cuándo usar `HasAllPermissions`\n"
+            "Útil para operaciones críticas (entorno financiero) donde se quiere "
+            "garantizar que el rol tenga capacidades completas antes de permitir acceso. "
+            "Permite una granularidad máxima en la asignación de permisos por rol.\n\n"
+            "> **Ejemplo:** un rol `Auditor` podría tener `admin.read` pero no `admin.write`, "
+            "pudiendo ver la configuración sin modificarla."
+        ),
+        responses={
+            200: OpenApiResponse(
+                response=inline_serializer(
+                    name="AdminPanelResponse",
+                    fields={"panel": s.CharField(help_text="Estado del panel.")},
+                ),
+                description="Acceso al panel concedido.",
+                examples=[
+                    OpenApiExample(
+                        name="Acceso concedido",
+                        value={"panel": "ok"},
+                        response_only=True,
+                    )
+                ],
+            ),
+            401: _401_response(),
+            403: OpenApiResponse(
+                description=(
+                    "**Permiso denegado (403).**\n\n"
+                    "El usuario no tiene `admin.read` o no tiene `admin.write` (o ninguno)."
+                ),
+                examples=[
+                    OpenApiExample(
+                        name="Sin permisos",
+                        value={"detail": "Permiso denegado. No posee todos los permisos requeridos."},
+                        response_only=True,
+                    )
+                ],
+            ),
+        },
+    )
+
+
+@cache
+def my_permissions_schema() -> dict[str, Any]:
+    return dict(
+        tags=["RBAC — Introspección"],
+        summary="Mis permisos",
+        description=(
+            "Retorna el rol y la lista completa de permisos del usuario autenticado.\n\n"
+            "### Uso típico\n"
+            "El frontend puede llamar a este endpoint tras el login para conocer "
+            "qué secciones mostrar/ocultar en la UI, sin necesidad de hacer múltiples "
+            "requests de comprobación.\n\n"
+            "### Datos retornados\n"
+            "| Campo | Tipo | Descripción |\n"
+            "|-------|------|-------------|\n"
+            "| `role` | `string \\| null` | Nombre del rol asignado al usuario. `null` si no tiene rol. |\n"
+            "| `permissions` | `string[]` | Lista de códigos de permiso del rol. |\n\n"
+            "### Cómo se calculan\n"
+            "`services.get_user_permissions(user)` lee los códigos del rol desde la "
+            "tabla rol → permisos cacheada en memoria de cada worker.\n\n"
+            "> Si el administrador modifica el rol, los permisos actualizados se ven de "
+            "inmediato en el worker que hizo el cambio y, en los demás, con una demora "
+            "de a lo sumo `RBAC_PERMISSIONS_TTL` (30 s por defecto)."
+        ),
+        responses={
+            200: OpenApiResponse(
+                response=inline_serializer(
+                    name="MyPermissionsResponse",
+                    fields={
+                        "role": s.CharField(
+                            allow_null=True,
+                            help_text=(
+                                "Nombre del rol asignado. `null` si el usuario no tiene rol asignado."
+                            ),
+                        ),
+                        "permissions": s.ListField(
+                            child=s.CharField(),
+                            help_text=(
+                                "Lista de códigos de permiso del rol actual. "
+                                "Lista vacía si el usuario no tiene rol."
+                            ),
+                        ),
+                    },
+                ),
+                description="Rol y permisos del usuario autenticado.",
+                examples=[
+                    OpenApiExample(
+                        name="Usuario Analista",
+                        value={
+                            "role": "Analista",
+                            "permissions": [
+                                "conciliacion.run",
+                                "conciliacion.view",
+                                "dashboard.view",
+                                "reportes.view",
+                            ],
+                        },
+                        response_only=True,
+                    ),
+                    OpenApiExample(
+                        name="Usuario Administrador",
+                        value={
+                            "role": "Administrador",
+                            "permissions": [
+                                "admin.full",
+                                "conciliacion.export",
+                                "conciliacion.run",
+                                "conciliacion.view",
+                                "dashboard.view",
+                                "reportes.export",
+                                "reportes.view",
+                                "usuarios.create",
+                                "usuarios.delete",
+                                "usuarios.edit",
+                                "usuarios.view",
+                            ],
+                        },
+                        response_only=True,
+                    ),
+                    OpenApiExample(
+                        name="Usuario sin rol asignado",
+                        value={"role": None, "permissions": []},
+                        response_only=True,
+                    ),
+                ],
+            ),
+            401: _401_response(),
+        },
+    )
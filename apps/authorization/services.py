@@ -13,17 +13,136 @@ Reglas de diseño:
   - Sin lógica de JWT ni de sesiones.
   - Las queries son deliberadamente simples para favorecer cacheado futuro.
   - Todos los casos edge se resuelven devolviendo False (fail-closed).
+
+Cache de permisos por rol:
+  La tabla completa ``role_id → códigos`` se lee de una sola query y se
+  guarda en memoria del proceso; las verificaciones son un lookup en un
+  dict, sin I/O. La clave de la tabla es una generación global que las
+  señales de ``apps.authorization.signals`` incrementan ante cualquier
+  cambio de RBAC (alta/baja de permisos, roles o códigos), por lo que la
+  siguiente request ya ve el estado nuevo sin esperar ningún TTL. Esa
+  invalidación es local al proceso que ejecuta el cambio; para los cambios
+  hechos fuera de él (otro worker, shell, loaddata) la clave incluye además
+  una época de ``settings.RBAC_PERMISSIONS_TTL`` segundos, que acota la
+  desactualización sin agregar I/O por request.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
+from sys import intern
+from time import monotonic
 from typing import TYPE_CHECKING
 
+from django.conf import settings
+
+from apps.authorization.models import Role
+
 if TYPE_CHECKING:
     # Importación solo para type-checking; evita ciclos en runtime.
     from django.contrib.auth.base_user import AbstractBaseUser
 
 
+_EMPTY: frozenset[str] = frozenset()
+
+# Generación vigente de la tabla rol → permisos. Solo crece; cada cambio de
+# RBAC la incrementa y la siguiente consulta relee la tabla completa.
+_GENERATION = 0
+
+
+def invalidate_role_permissions() -> None:
+    """Invalida la tabla de permisos por rol cacheada (llamado desde signals)."""
+    global _GENERATION
+    _GENERATION += 1
+
+
+def _cache_epoch() -> int:
+    """Época vigente del cache; avanza cada RBAC_PERMISSIONS_TTL segundos (0 = nunca)."""
+    ttl = getattr(settings, "RBAC_PERMISSIONS_TTL", 0)
+    return int(monotonic() // ttl) if ttl > 0 else 0
+
+
+@lru_cache(maxsize=1)
+def _role_permission_table(generation: int, epoch: int) -> dict[int, frozenset[str]]:
+    """
+    Códigos de permiso de todos los roles, leídos en una sola query.
+
+    *generation* y *epoch* no se usan en la query: solo forman parte de la
+    clave del cache para que una invalidación o el paso del TTL fuercen la
+    relectura desde DB.
+    """
+    # Códigos internados: las clases de permiso también internan los suyos,
+    # así la búsqueda en el frozenset resuelve por identidad sin comparar
+    # caracteres.
+    table: dict[int, set[str]] = {}
+    rows = Role.permissions.through.objects.values_list("role_id", "permission__code")
+    for role_id, code in rows:
+        table.setdefault(role_id, set()).add(intern(code))
+    return {role_id: frozenset(codes) for role_id, codes in table.items()}
+
+
+def _perms_for_role(role_id: int, generation: int, epoch: int) -> frozenset[str]:
+    """Códigos de permiso del rol *role_id* (vacío si no tiene o no existe)."""
+    return _role_permission_table(generation, epoch).get(role_id, _EMPTY)
+
+
+def _role_permissions(user: "AbstractBaseUser | None") -> frozenset[str]:
+    """Permisos efectivos de *user*; vacío ante cualquier caso fail-closed."""
+    if user is None:
+        return _EMPTY
+
+    # AnonymousUser no tiene is_authenticated como booleano simple en todas
+    # las versiones de Django; comparamos explícitamente.
+    if not getattr(user, "is_authenticated", False):
+        return _EMPTY
+
+    if not getattr(user, "is_active", False):
+        return _EMPTY
+
+    # Se usa el id del FK (sin cargar el Role); el atributo existe solo en
+    # el User concreto del proyecto.
+    role_id = getattr(user, "role_id", None)
+    if role_id is None:
+        return _EMPTY
+
+    return _perms_for_role(role_id, _GENERATION, _cache_epoch())
+
+
+@lru_cache(maxsize=32)
+def _role_id(name: str, epoch: int) -> int:
+    """
+    PK del rol *name*; *epoch* solo forma parte de la clave del cache.
+
+    Un rol inexistente levanta ``Role.DoesNotExist`` en lugar de devolver
+    None: ``lru_cache`` no guarda excepciones, así que la ausencia no queda
+    cacheada y el rol se ve en cuanto se crea.
+    """
+    role_id = Role.objects.filter(name=name).values_list("pk", flat=True).first()
+    if role_id is None:
+        raise Role.DoesNotExist(name)
+    return role_id
+
+
+def get_role_id(name: str) -> int | None:
+    """
+    PK del rol llamado *name*, o None si no existe.
+
+    Cacheado en memoria del proceso con el mismo esquema que la tabla de
+    permisos: las señales de ``Role`` vacían el cache ante cualquier alta,
+    edición o borrado en este proceso, y la época de
+    ``RBAC_PERMISSIONS_TTL`` acota la desactualización ante cambios hechos
+    fuera de él. Solo se cachean roles existentes.
+    """
+    try:
+        return _role_id(name, _cache_epoch())
+    except Role.DoesNotExist:
+        return None
+
+
+# Las señales y los tests vacían el cache a través de la función pública.
+get_role_id.cache_clear = _role_id.cache_clear  # type: ignore[attr-defined]
+
+
 def user_has_permission(user: "AbstractBaseUser | None", permission_code: str) -> bool:
     """
     Verifica si *user* posee el permiso identificado por *permission_code*.
@@ -31,7 +150,8 @@ def user_has_permission(user: "AbstractBaseUser | None", permission_code: str) -
     Lógica de evaluación (fail-closed):
       1. Si el usuario es None, anónimo o inactivo → False.
       2. Si el usuario no tiene rol asignado → False.
-      3. Consulta en DB si el rol del usuario contiene el permiso.
+      3. Comprueba si el permiso está entre los del rol (cacheados en
+         memoria del proceso; ver docstring del módulo).
 
     Args:
         user:            Instancia del modelo User autenticado (o None/AnonymousUser).
@@ -44,25 +164,29 @@ def user_has_permission(user: "AbstractBaseUser | None", permission_code: str) -
         >>> if user_has_permission(request.user, "conciliacion.run"):
         ...     run_conciliacion()
     """
-    if user is None:
-        return False
+    return permission_code in _role_permissions(user)
 
-    # AnonymousUser no tiene is_authenticated como booleano simple en todas
-    # las versiones de Django; comparamos explícitamente.
-    if not getattr(user, "is_authenticated", False):
-        return False
 
-    if not getattr(user, "is_active", False):
-        return False
+def get_user_permission_set(user: "AbstractBaseUser | None") -> frozenset[str]:
+    """
+    Retorna los códigos de permiso de *user* como ``frozenset``.
+
+    Es el mismo conjunto que consulta `user_has_permission`; pensado para
+    quien evalúa varios códigos seguidos (p. ej. las clases de permiso DRF).
+    Vacío ante cualquier caso fail-closed.
+    """
+    return _role_permissions(user)
 
-    # Acceso al FK role; el atributo existe solo en el User concreto del proyecto.
-    role = getattr(user, "role", None)
-    if role is None:
-        return False
 
-    # SELECT EXISTS en la tabla intermedia role_permissions.
-    # No carga los objetos Permission completos; solo comprueba existencia.
-    return role.permissions.filter(code=permission_code).exists()
+@lru_cache(maxsize=256)
+def sorted_permission_codes(codes: frozenset[str]) -> tuple[str, ...]:
+    """
+    *codes* ordenados alfabéticamente, memoizado por conjunto.
+
+    Los conjuntos de permisos son los mismos objetos de la tabla por rol, así
+    que cada rol se ordena una sola vez por generación del cache.
+    """
+    return tuple(sorted(codes))
 
 
 def get_user_permissions(user: "AbstractBaseUser | None") -> list[str]:
@@ -76,20 +200,7 @@ def get_user_permissions(user: "AbstractBaseUser | None") -> list[str]:
         user: Instancia del modelo User autenticado (o None/AnonymousUser).
 
     Returns:
-        Lista de strings con los códigos de permiso. Lista vacía si
-        el usuario no tiene rol o no está autenticado.
+        Lista de strings con los códigos de permiso, ordenada por código.
+        Lista vacía si el usuario no tiene rol o no está autenticado.
     """
-    if user is None:
-        return []
-
-    if not getattr(user, "is_authenticated", False):
-        return []
-
-    if not getattr(user, "is_active", False):
-        return []
-
-    role = getattr(user, "role", None)
-    if role is None:
-        return []
-
-    return list(role.permissions.values_list("code", flat=True))
+    return list(sorted_permission_codes(_role_permissions(user)))
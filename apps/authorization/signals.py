@@ -0,0 +1,52 @@
+"""
+authorization.signals
+=====================
+Invalidación del cache de permisos por rol (ver ``authorization.services``).
+
+Cualquier cambio que altere los códigos efectivos de algún rol incrementa
+la generación de la tabla cacheada, de modo que la siguiente consulta la
+relee completa desde DB:
+  - alta/baja/limpieza de permisos de un rol (``m2m_changed``), desde
+    cualquiera de los dos lados de la relación;
+  - alta o borrado de un rol (los ids pueden reutilizarse, p. ej. en SQLite);
+  - edición o borrado de un Permission (puede afectar a varios roles).
+
+Los cambios de Role vacían además el cache nombre → PK de
+``services.get_role_id``.
+
+La invalidación se repite en ``on_commit``: si otra request cacheó el estado
+previo entre el cambio y el commit, esa tabla también queda descartada.
+"""
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.authorization import services
+from apps.authorization.models import Permission, Role
+
+_M2M_ACTIONS = frozenset({"post_add", "post_remove", "post_clear"})
+
+
+def _invalidate() -> None:
+    services.invalidate_role_permissions()
+    transaction.on_commit(services.invalidate_role_permissions)
+
+
+@receiver(m2m_changed, sender=Role.permissions.through)
+def role_permissions_changed(sender, action, **kwargs):
+    if action in _M2M_ACTIONS:
+        _invalidate()
+
+
+@receiver([post_save, post_delete], sender=Role)
+def role_saved_or_deleted(sender, **kwargs):
+    _invalidate()
+    # Un rol creado, renombrado o borrado cambia la resolución nombre → PK.
+    services.get_role_id.cache_clear()
+    transaction.on_commit(services.get_role_id.cache_clear)
+
+
+@receiver([post_save, post_delete], sender=Permission)
+def permission_saved_or_deleted(sender, **kwargs):
+    _invalidate()
@@ -5,12 +5,29 @@ Pruebas unitarias de las clases de permiso DRF:
   - HasPermission
   - HasAnyPermission
   - HasAllPermissions
+  - AuthenticatedHasPermission / AuthenticatedHasAnyPermission /
+    AuthenticatedHasAllPermissions
+  - request_permissions
+  - RBACView
 """
 
-import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from apps.authorization.permissions import HasAllPermissions, HasAnyPermission, HasPermission
+import pytest
+
+from rest_framework.permissions import IsAuthenticated
+
+from apps.authorization.permissions import (
+    AuthenticatedHasAllPermissions,
+    AuthenticatedHasAnyPermission,
+    AuthenticatedHasPermission,
+    HasAllPermissions,
+    HasAnyPermission,
+    HasPermission,
+    RBACView,
+    request_permissions,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -45,26 +62,28 @@ class TestHasPermission:
         klass = HasPermission("conciliacion.run")
         assert "conciliacion.run" in klass.__name__
 
-    def test_has_permission_returns_true_when_service_returns_true(self):
+    def test_has_permission_returns_true_when_user_has_code(self):
         klass = HasPermission("conciliacion.run")
         instance = klass()
         request = make_request()
 
         with patch(
-            "apps.authorization.permissions.user_has_permission", return_value=True
+            "apps.authorization.permissions.get_user_permission_set",
+            return_value=frozenset({"conciliacion.run"}),
         ) as mock_service:
             result = instance.has_permission(request, MagicMock())
 
         assert result is True
-        mock_service.assert_called_once_with(request.user, "conciliacion.run")
+        mock_service.assert_called_once_with(request.user)
 
-    def test_has_permission_returns_false_when_service_returns_false(self):
+    def test_has_permission_returns_false_when_user_lacks_code(self):
         klass = HasPermission("conciliacion.run")
         instance = klass()
         request = make_request()
 
         with patch(
-            "apps.authorization.permissions.user_has_permission", return_value=False
+            "apps.authorization.permissions.get_user_permission_set",
+            return_value=frozenset({"conciliacion.view"}),
         ):
             result = instance.has_permission(request, MagicMock())
 
@@ -76,6 +95,9 @@ class TestHasPermission:
         assert klass_a is not klass_b
         assert klass_a.__name__ != klass_b.__name__
 
+    def test_same_code_returns_same_class(self):
+        assert HasPermission("conciliacion.run") is HasPermission("conciliacion.run")
+
     def test_message_contains_permission_code(self):
         klass = HasPermission("conciliacion.run")
         instance = klass()
@@ -92,32 +114,27 @@ class TestHasAnyPermission:
     def _make_instance(self, *codes):
         return HasAnyPermission(*codes)()
 
+    def _check(self, instance, user_codes):
+        with patch(
+            "apps.authorization.permissions.get_user_permission_set",
+            return_value=frozenset(user_codes),
+        ):
+            return instance.has_permission(make_request(), MagicMock())
+
     def test_returns_true_if_user_has_first_permission(self):
         instance = self._make_instance("perm.a", "perm.b")
-        request = make_request()
-
-        def side_effect(user, code):
-            return code == "perm.a"
-
-        with patch("apps.authorization.permissions.user_has_permission", side_effect=side_effect):
-            assert instance.has_permission(request, MagicMock()) is True
+        assert self._check(instance, {"perm.a"}) is True
 
     def test_returns_true_if_user_has_second_permission(self):
         instance = self._make_instance("perm.a", "perm.b")
-        request = make_request()
-
-        def side_effect(user, code):
-            return code == "perm.b"
-
-        with patch("apps.authorization.permissions.user_has_permission", side_effect=side_effect):
-            assert instance.has_permission(request, MagicMock()) is True
+        assert self._check(instance, {"perm.b"}) is True
 
     def test_returns_false_if_user_has_none(self):
         instance = self._make_instance("perm.a", "perm.b")
-        request = make_request()
+        assert self._check(instance, {"perm.c"}) is False
 
-        with patch("apps.authorization.permissions.user_has_permission", return_value=False):
-            assert instance.has_permission(request, MagicMock()) is False
+    def test_same_codes_in_any_order_return_same_class(self):
+        assert HasAnyPermission("perm.a", "perm.b") is HasAnyPermission("perm.b", "perm.a")
 
 
 # ---------------------------------------------------------------------------
@@ -129,26 +146,137 @@ class TestHasAllPermissions:
     def _make_instance(self, *codes):
         return HasAllPermissions(*codes)()
 
+    def _check(self, instance, user_codes):
+        with patch(
+            "apps.authorization.permissions.get_user_permission_set",
+            return_value=frozenset(user_codes),
+        ):
+            return instance.has_permission(make_request(), MagicMock())
+
     def test_returns_true_if_user_has_all(self):
         instance = self._make_instance("perm.a", "perm.b")
-        request = make_request()
-
-        with patch("apps.authorization.permissions.user_has_permission", return_value=True):
-            assert instance.has_permission(request, MagicMock()) is True
+        assert self._check(instance, {"perm.a", "perm.b", "perm.c"}) is True
 
     def test_returns_false_if_user_lacks_one(self):
         instance = self._make_instance("perm.a", "perm.b")
-        request = make_request()
-
-        def side_effect(user, code):
-            return code == "perm.a"
-
-        with patch("apps.authorization.permissions.user_has_permission", side_effect=side_effect):
-            assert instance.has_permission(request, MagicMock()) is False
+        assert self._check(instance, {"perm.a"}) is False
 
     def test_returns_false_if_user_has_none(self):
         instance = self._make_instance("perm.a", "perm.b")
-        request = make_request()
+        assert self._check(instance, set()) is False
+
+    def test_same_codes_in_any_order_return_same_class(self):
+        assert HasAllPermissions("perm.a", "perm.b") is HasAllPermissions("perm.b", "perm.a")
+
+    def test_single_code(self):
+        instance = self._make_instance("perm.a")
+        assert self._check(instance, {"perm.a"}) is True
+        assert self._check(instance, {"perm.b"}) is False
+
+
+# ---------------------------------------------------------------------------
+# Tests: variantes Authenticated*
+# ---------------------------------------------------------------------------
+
+class TestAuthenticatedVariants:
+
+    @staticmethod
+    def _check(klass, *, is_authenticated: bool, perms: set[str]) -> bool:
+        request = make_request(SimpleNamespace(is_authenticated=is_authenticated))
+        with patch(
+            "apps.authorization.permissions.get_user_permission_set",
+            return_value=frozenset(perms),
+        ):
+            return klass().has_permission(request, MagicMock())
+
+    def test_single_permission(self):
+        klass = AuthenticatedHasPermission("perm.a")
+        assert self._check(klass, is_authenticated=True, perms={"perm.a"}) is True
+        assert self._check(klass, is_authenticated=True, perms=set()) is False
+
+    def test_any_permission(self):
+        klass = AuthenticatedHasAnyPermission("perm.a", "perm.b")
+        assert self._check(klass, is_authenticated=True, perms={"perm.b"}) is True
+        assert self._check(klass, is_authenticated=True, perms={"perm.c"}) is False
+
+    def test_all_permissions(self):
+        klass = AuthenticatedHasAllPermissions("perm.a", "perm.b")
+        assert self._check(klass, is_authenticated=True, perms={"perm.a", "perm.b"}) is True
+        assert self._check(klass, is_authenticated=True, perms={"perm.a"}) is False
+
+    def test_anonymous_is_denied_without_resolving_permissions(self):
+        klass = AuthenticatedHasPermission("perm.a")
+        request = make_request(SimpleNamespace(is_authenticated=False))
+        with patch(
+            "apps.authorization.permissions.get_user_permission_set",
+        ) as mock_service:
+            assert klass().has_permission(request, MagicMock()) is False
+        mock_service.assert_not_called()
+
+    def test_extends_base_permission_class(self):
+        klass = AuthenticatedHasPermission("perm.a")
+        assert issubclass(klass, HasPermission("perm.a"))
+        assert klass is AuthenticatedHasPermission("perm.a")
+        assert "perm.a" in klass.__name__
+
+
+# ---------------------------------------------------------------------------
+# Tests: request_permissions
+# ---------------------------------------------------------------------------
+
+class TestRequestPermissions:
+
+    def test_resolves_once_per_request_across_classes(self):
+        request = SimpleNamespace(user=MagicMock())
+        checks = [
+            HasPermission("perm.a")(),
+            HasAnyPermission("perm.b", "perm.c")(),
+            HasAllPermissions("perm.a", "perm.b")(),
+        ]
+
+        with patch(
+            "apps.authorization.permissions.get_user_permission_set",
+            return_value=frozenset({"perm.a", "perm.b"}),
+        ) as mock_service:
+            assert all(check.has_permission(request, MagicMock()) for check in checks)
+
+        mock_service.assert_called_once_with(request.user)
+
+    def test_recomputes_when_user_changes(self):
+        request = SimpleNamespace(user=MagicMock())
+
+        with patch(
+            "apps.authorization.permissions.get_user_permission_set",
+            side_effect=[frozenset({"perm.a"}), frozenset()],
+        ):
+            assert request_permissions(request) == frozenset({"perm.a"})
+            request.user = MagicMock()
+            assert request_permissions(request) == frozenset()
+
+
+# ---------------------------------------------------------------------------
+# Tests: RBACView
+# ---------------------------------------------------------------------------
+
+class TestRBACView:
+
+    class _RunView(RBACView):
+        permission_classes = [IsAuthenticated, HasPermission("conciliacion.run")]
+
+    class _ViewView(RBACView):
+        permission_classes = [IsAuthenticated, HasPermission("conciliacion.view")]
+
+    def test_instantiates_permission_classes_in_order(self):
+        perms = self._RunView().get_permissions()
+        assert [type(p) for p in perms] == self._RunView.permission_classes
+
+    def test_reuses_instances_across_requests(self):
+        first = self._RunView().get_permissions()
+        second = self._RunView().get_permissions()
+        assert all(a is b for a, b in zip(first, second))
 
-        with patch("apps.authorization.permissions.user_has_permission", return_value=False):
-            assert instance.has_permission(request, MagicMock()) is False
+    def test_instances_are_per_view_class(self):
+        run_perm = self._RunView().get_permissions()[1]
+        view_perm = self._ViewView().get_permissions()[1]
+        assert run_perm._code == "conciliacion.run"
+        assert view_perm._code == "conciliacion.view"
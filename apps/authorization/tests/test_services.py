@@ -10,9 +10,17 @@ y tests de integración con base de datos para los casos reales.
 """
 
 import pytest
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import MagicMock
 
-from apps.authorization.services import get_user_permissions, user_has_permission
+from apps.authorization import services
+from apps.authorization.models import Permission, Role
+from apps.authorization.services import (
+    get_role_id,
+    get_user_permission_set,
+    get_user_permissions,
+    sorted_permission_codes,
+    user_has_permission,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -21,36 +29,41 @@ pytestmark = pytest.mark.unit
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Tabla en memoria role_id → códigos que reemplaza la query de _perms_for_role
+# en los tests unitarios (sin base de datos).
+_FAKE_ROLES: dict[int, frozenset[str]] = {}
+
+
+@pytest.fixture(autouse=True)
+def _fake_role_permissions(request, monkeypatch):
+    if "django_db" in request.keywords:
+        return
+    _FAKE_ROLES.clear()
+    monkeypatch.setattr(
+        services,
+        "_perms_for_role",
+        lambda role_id, generation, epoch: _FAKE_ROLES.get(role_id, frozenset()),
+    )
+
+
 def make_user(
     is_authenticated: bool = True,
     is_active: bool = True,
-    role=None,
+    role: int | None = None,
 ) -> MagicMock:
     """Crea un mock de User con los atributos mínimos necesarios."""
     user = MagicMock()
     user.is_authenticated = is_authenticated
     user.is_active = is_active
-    user.role = role
+    user.role_id = role
     return user
 
 
-def make_role(*permission_codes: str) -> MagicMock:
-    """Crea un mock de Role cuyo queryset de permissions filtra por códigos."""
-    role = MagicMock()
-    role.permissions.filter.return_value.exists.side_effect = (
-        lambda: True  # se evalúa en has_permission; mock below
-    )
-    # Configuramos filter().exists() para devolver True solo si el código está en la lista.
-    def filter_side_effect(code):
-        exists_mock = MagicMock()
-        exists_mock.exists.return_value = code in permission_codes
-        return exists_mock
-
-    role.permissions.filter.side_effect = filter_side_effect
-
-    # Para get_user_permissions usamos values_list().
-    role.permissions.values_list.return_value = list(permission_codes)
-    return role
+def make_role(*permission_codes: str) -> int:
+    """Registra un rol falso con los códigos dados y devuelve su id."""
+    role_id = len(_FAKE_ROLES) + 1
+    _FAKE_ROLES[role_id] = frozenset(permission_codes)
+    return role_id
 
 
 # ---------------------------------------------------------------------------
@@ -125,3 +138,150 @@ class TestGetUserPermissions:
         user = make_user(role=role)
         result = get_user_permissions(user)
         assert set(result) == set(codes)
+
+    def test_permission_set_matches_list(self):
+        role = make_role("conciliacion.run", "dashboard.view")
+        user = make_user(role=role)
+        assert get_user_permission_set(user) == frozenset(get_user_permissions(user))
+
+    def test_permission_set_empty_for_anonymous_user(self):
+        assert get_user_permission_set(make_user(is_authenticated=False)) == frozenset()
+
+
+# ---------------------------------------------------------------------------
+# Tests: cache de permisos por rol (con base de datos)
+# ---------------------------------------------------------------------------
+
+@pytest.mark.django_db
+class TestRolePermissionCache:
+    """Los cambios de RBAC tienen efecto inmediato pese al cache por rol."""
+
+    @pytest.fixture
+    def role(self):
+        role = Role.objects.create(name="Cache")
+        role.permissions.add(Permission.objects.create(code="conciliacion.run"))
+        return role
+
+    @pytest.fixture
+    def user(self, role):
+        from django.contrib.auth import get_user_model
+
+        return get_user_model().objects.create_user(
+            email="cache@test.com", password="Pass1234!", role=role
+        )
+
+    def test_second_lookup_hits_cache(self, user, django_assert_num_queries):
+        get_user_permissions(user)
+        with django_assert_num_queries(0):
+            assert user_has_permission(user, "conciliacion.run") is True
+
+    def test_all_roles_are_loaded_in_one_query(self, user, django_assert_num_queries):
+        from django.contrib.auth import get_user_model
+
+        other_role = Role.objects.create(name="Otro")
+        other_role.permissions.add(Permission.objects.create(code="dashboard.view"))
+        other = get_user_model().objects.create_user(
+            email="other@test.com", password="Pass1234!", role=other_role
+        )
+        with django_assert_num_queries(1):
+            assert get_user_permissions(user) == ["conciliacion.run"]
+            assert get_user_permissions(other) == ["dashboard.view"]
+
+    def test_added_permission_is_visible_immediately(self, user, role):
+        assert user_has_permission(user, "dashboard.view") is False
+        role.permissions.add(Permission.objects.create(code="dashboard.view"))
+        assert user_has_permission(user, "dashboard.view") is True
+
+    def test_removed_permission_is_revoked_immediately(self, user, role):
+        assert user_has_permission(user, "conciliacion.run") is True
+        role.permissions.clear()
+        assert user_has_permission(user, "conciliacion.run") is False
+
+    def test_reverse_side_change_invalidates(self, user, role):
+        assert get_user_permissions(user) == ["conciliacion.run"]
+        Permission.objects.create(code="admin.panel").roles.add(role)
+        assert get_user_permissions(user) == ["admin.panel", "conciliacion.run"]
+
+    def test_out_of_process_change_is_visible_after_ttl(self, user, role, monkeypatch, settings):
+        settings.RBAC_PERMISSIONS_TTL = 30
+        monkeypatch.setattr(services, "monotonic", lambda: 100.0)
+        permission = Permission.objects.create(code="dashboard.view")
+        assert user_has_permission(user, "dashboard.view") is False
+
+        # Alta directa en la tabla intermedia: no dispara m2m_changed, como
+        # un cambio hecho desde otro proceso.
+        Role.permissions.through.objects.create(role=role, permission=permission)
+        assert user_has_permission(user, "dashboard.view") is False
+
+        monkeypatch.setattr(services, "monotonic", lambda: 130.0)
+        assert user_has_permission(user, "dashboard.view") is True
+
+    def test_renamed_permission_is_visible_immediately(self, user):
+        assert user_has_permission(user, "conciliacion.run") is True
+        perm = Permission.objects.get(code="conciliacion.run")
+        perm.code = "conciliacion.execute"
+        perm.save()
+        assert user_has_permission(user, "conciliacion.run") is False
+        assert user_has_permission(user, "conciliacion.execute") is True
+
+
+# ---------------------------------------------------------------------------
+# Tests: sorted_permission_codes
+# ---------------------------------------------------------------------------
+
+class TestSortedPermissionCodes:
+
+    def test_returns_sorted_tuple(self):
+        codes = frozenset({"reportes.view", "admin.full", "dashboard.view"})
+        assert sorted_permission_codes(codes) == ("admin.full", "dashboard.view", "reportes.view")
+
+    def test_same_set_returns_same_tuple(self):
+        codes = frozenset({"b", "a"})
+        assert sorted_permission_codes(codes) is sorted_permission_codes(frozenset({"a", "b"}))
+
+
+# ---------------------------------------------------------------------------
+# Tests: get_role_id (cache nombre → PK)
+# ---------------------------------------------------------------------------
+
+@pytest.mark.django_db
+class TestGetRoleId:
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        get_role_id.cache_clear()
+        yield
+        get_role_id.cache_clear()
+
+    def test_returns_none_for_missing_role(self):
+        assert get_role_id("Inexistente") is None
+
+    def test_second_lookup_hits_cache(self, django_assert_num_queries):
+        role = Role.objects.create(name="Operador")
+        assert get_role_id("Operador") == role.pk
+        with django_assert_num_queries(0):
+            assert get_role_id("Operador") == role.pk
+
+    def test_created_role_is_visible_immediately(self):
+        assert get_role_id("Operador") is None
+        role = Role.objects.create(name="Operador")
+        assert get_role_id("Operador") == role.pk
+
+    def test_missing_role_is_not_cached(self):
+        assert get_role_id("Operador") is None
+        # bulk_create no dispara post_save, como un alta desde otro proceso.
+        Role.objects.bulk_create([Role(name="Operador")])
+        assert get_role_id("Operador") == Role.objects.get(name="Operador").pk
+
+    def test_out_of_process_change_is_visible_after_ttl(self, monkeypatch, settings):
+        settings.RBAC_PERMISSIONS_TTL = 30
+        monkeypatch.setattr(services, "monotonic", lambda: 100.0)
+        role = Role.objects.create(name="Operador")
+        assert get_role_id("Operador") == role.pk
+
+        # update() no dispara post_save, como un cambio hecho desde otro proceso.
+        Role.objects.filter(pk=role.pk).update(name="Supervisor")
+        assert get_role_id("Operador") == role.pk
+
+        monkeypatch.setattr(services, "monotonic", lambda: 130.0)
+        assert get_role_id("Operador") is None
@@ -0,0 +1,77 @@
+"""
+Tests para playground.views
+===========================
+Endpoints públicos async (adrf): respuesta, Cache-Control y header Vary,
+tanto para el caller anónimo como para el autenticado; matriz de acceso de
+un usuario sin rol.
+"""
+
+import orjson
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+pytestmark = [pytest.mark.api, pytest.mark.django_db]
+
+User = get_user_model()
+
+PUBLIC_URL = "/api/playground/public/"
+
+
+@pytest.fixture
+def jwt_client():
+    user = User.objects.create_user(
+        email="publico@test.com",
+        password="TestPassword123!",  # noqa: S106 # NOSONAR
+        first_name="Pub",
+        last_name="Lico",
+    )
+    client = APIClient()
+    token = RefreshToken.for_user(user).access_token
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return client
+
+
+class TestPublicView:
+    def test_anonymous_get(self):
+        response = APIClient().get(PUBLIC_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        body = orjson.loads(response.content)
+        assert body["authenticated"] == "false"
+        assert body["user"] == "anónimo"
+        assert "Authorization" in response["Vary"]
+        assert "max-age=60" in response["Cache-Control"]
+
+    def test_authenticated_get(self, jwt_client):
+        response = jwt_client.get(PUBLIC_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        body = orjson.loads(response.content)
+        assert body["authenticated"] == "true"
+        assert body["user"] == "publico@test.com"
+        assert "Authorization" in response["Vary"]
+        assert "private" in response["Cache-Control"]
+        assert "max-age" not in response["Cache-Control"]
+
+    def test_authenticated_body_reflects_current_user(self, jwt_client):
+        jwt_client.get(PUBLIC_URL)
+        User.objects.filter(email="publico@test.com").update(email="renombrado@test.com")
+
+        body = orjson.loads(jwt_client.get(PUBLIC_URL).content)
+        assert body["user"] == "renombrado@test.com"
+
+
+class TestAccessMatrixView:
+    def test_user_without_role_has_no_permissions(self, jwt_client):
+        response = jwt_client.get("/api/playground/matriz/")
+
+        assert response.status_code == status.HTTP_200_OK
+        body = orjson.loads(response.content)
+        assert body["user"] == "publico@test.com"
+        assert body["role"] is None
+        assert body["tiene"] == []
+        assert body["no_tiene"] == sorted(body["no_tiene"])
+        assert "admin.full" in body["no_tiene"]
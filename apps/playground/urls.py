@@ -38,51 +38,32 @@ from .views import (
 
 app_name = "playground"
 
-urlpatterns = [
-    # ------------------------------------------------------------------
+# (ruta relativa a "playground/", view, name). Una fila por endpoint; las
+# urlpatterns se generan en un solo paso a partir de esta tabla.
+_ROUTES = (
     # Escenario A — Sin autenticación
-    # ------------------------------------------------------------------
-    path("playground/public/",       PublicView.as_view(),        name="public"),
-    path("playground/quien-llama/",  AnonymousInfoView.as_view(), name="quien-llama"),
-
-    # ------------------------------------------------------------------
+    ("public/",                      PublicView,                "public"),
+    ("quien-llama/",                 AnonymousInfoView,         "quien-llama"),
     # Escenario B — Solo autenticación (cualquier rol)
-    # ------------------------------------------------------------------
-    path("playground/solo-autenticado/", AuthenticatedOnlyView.as_view(), name="solo-autenticado"),
-
-    # ------------------------------------------------------------------
-    # Escenario C — HasPermission (permiso único)
-    # ------------------------------------------------------------------
-    # solo Administrador
-    path("playground/permiso/conciliacion-run/",      PermisoConciliacionRun.as_view(),      name="permiso-conciliacion-run"),
-    # solo Administrador
-    path("playground/permiso/conciliacion-export/",   PermisoConciliacionExport.as_view(),   name="permiso-conciliacion-export"),
-    # solo Administrador
-    path("playground/permiso/reportes-export/",  PermisoReportesExport.as_view(), name="permiso-reportes-export"),
-    # Solo Administrador  (método DELETE)
-    path("playground/permiso/usuarios-delete/",  PermisoUsuariosDelete.as_view(), name="permiso-usuarios-delete"),
-    # Solo Administrador
-    path("playground/permiso/admin/",            PermisoAdminFull.as_view(),      name="permiso-admin"),
-
-    # ------------------------------------------------------------------
-    # Escenario D — HasAnyPermission (lógica OR)
-    # ------------------------------------------------------------------
-    # OR permisivo: Operador y Administrador tienen acceso
-    path("playground/or/todos/",          PermisoOrView.as_view(),           name="or-todos"),
-    # OR restrictivo: solo Administrador
-    path("playground/or/solo-admin/", PermisoOrRestrictivoView.as_view(), name="or-solo-admin"),
-
-    # ------------------------------------------------------------------
-    # Escenario E — HasAllPermissions (lógica AND)
-    # ------------------------------------------------------------------
-    # AND: conciliacion.run AND reportes.export  → solo Administrador
-    path("playground/and/run-export/",    PermisoAndView.as_view(),      name="and-run-export"),
-    # AND: usuarios.create AND usuarios.delete  → solo Admin  (método DELETE)
-    path("playground/and/admin-completo/", PermisoAndAdminView.as_view(), name="and-admin-completo"),
-
-    # ------------------------------------------------------------------
+    ("solo-autenticado/",            AuthenticatedOnlyView,     "solo-autenticado"),
+    # Escenario C — HasPermission (permiso único; todos solo Administrador)
+    ("permiso/conciliacion-run/",    PermisoConciliacionRun,    "permiso-conciliacion-run"),
+    ("permiso/conciliacion-export/", PermisoConciliacionExport, "permiso-conciliacion-export"),
+    ("permiso/reportes-export/",     PermisoReportesExport,     "permiso-reportes-export"),
+    ("permiso/usuarios-delete/",     PermisoUsuariosDelete,     "permiso-usuarios-delete"),  # DELETE
+    ("permiso/admin/",               PermisoAdminFull,          "permiso-admin"),
+    # Escenario D — HasAnyPermission (OR permisivo / OR restrictivo)
+    ("or/todos/",                    PermisoOrView,             "or-todos"),
+    ("or/solo-admin/",               PermisoOrRestrictivoView,  "or-solo-admin"),
+    # Escenario E — HasAllPermissions (AND)
+    ("and/run-export/",              PermisoAndView,            "and-run-export"),
+    ("and/admin-completo/",          PermisoAndAdminView,       "and-admin-completo"),  # DELETE
     # Escenario F — Introspección
-    # ------------------------------------------------------------------
-    path("playground/yo/",     WhoAmIView.as_view(),      name="whoami"),
-    path("playground/matriz/", AccessMatrixView.as_view(), name="access-matrix"),
+    ("yo/",                          WhoAmIView,                "whoami"),
+    ("matriz/",                      AccessMatrixView,          "access-matrix"),
+)
+
+urlpatterns = [
+    path(f"playground/{route}", view.as_view(), name=name)
+    for route, view, name in _ROUTES
 ]
@@ -14,177 +14,133 @@ C. HasPermission       → permiso único requerido (varios niveles de rol)
 D. HasAnyPermission    → lógica OR entre dos permisos
 E. HasAllPermissions   → lógica AND entre dos permisos
 F. Introspección       → quién soy + qué puedo hacer
+
+La metadata OpenAPI de cada endpoint vive en `schemas.py`. Las views
+protegidas heredan de `RBACView`, que instancia sus clases de permiso una
+sola vez por clase de view en lugar de en cada request.
 """
 
 from __future__ import annotations
 
-from typing import Dict
-
-from drf_spectacular.utils import (
-    OpenApiExample,
-    OpenApiResponse,
-    extend_schema,
-    inline_serializer,
-)
-from rest_framework import serializers as s
+import orjson
+from adrf.views import APIView as AsyncAPIView
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control, patch_response_headers, patch_vary_headers
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
-from apps.authorization.permissions import HasAllPermissions, HasAnyPermission, HasPermission
-from apps.authorization.services import get_user_permissions
+from apps.authorization.permissions import (
+    AuthenticatedHasAllPermissions,
+    AuthenticatedHasAnyPermission,
+    AuthenticatedHasPermission,
+    RBACView,
+    request_permissions,
+)
+from apps.authorization.services import sorted_permission_codes
+from config.openapi import documented
+
+from . import schemas
 
 # ---------------------------------------------------------------------------
-# Shared response helpers
+# Helpers de respuesta
 # ---------------------------------------------------------------------------
 
-_401 = OpenApiResponse(
-    description=(
-        "**401 — No autenticado.**\n\n"
-        "El header `Authorization` está ausente, mal formado o el access token expiró.\n\n"
-        "**Solución:** hacer `POST /api/auth/login/`, copiar el campo `access` de la respuesta "
-        "y enviarlo como `Authorization: Bearer <access_token>`."
-    ),
-    examples=[
-        OpenApiExample(
-            "Sin token",
-            value={"detail": "Authentication credentials were not provided."},
-            response_only=True,
-        )
-    ],
-)
+def _granted_prefix(body: dict[str, str]) -> bytes:
+    """
+    Serializa una vez el cuerpo fijo de un endpoint Permiso*, dejando el
+    objeto JSON abierto para completar el único campo variable ("user").
+    """
+    return orjson.dumps(body)[:-1] + b',"user":'
 
-_403 = OpenApiResponse(
-    description=(
-        "**403 — Permiso denegado.**\n\n"
-        "El usuario está autenticado (JWT válido) pero su rol no incluye el permiso requerido.\n\n"
-        "El rol se consulta en DB en cada request. "
-        "Cambiar el rol en el admin surte efecto inmediato."
-    ),
-    examples=[
-        OpenApiExample(
-            "Sin permiso",
-            value={"detail": "Permiso denegado. Se requiere: 'X'."},
-            response_only=True,
-        )
-    ],
-)
 
+def _json(payload: dict) -> HttpResponse:
+    """Respuesta JSON serializada con orjson, sin negociación de renderer de DRF."""
+    return HttpResponse(orjson.dumps(payload), content_type="application/json")
 
-def _ok(name: str, body: dict) -> OpenApiResponse:
-    """Helper: crea un OpenApiResponse 200 con un ejemplo inline."""
-    fields: Dict[str, s.Field] = {k: s.CharField() for k in body}
-    return OpenApiResponse(
-        response=inline_serializer(name=name, fields=fields),
-        description="**200 — Acceso concedido.**",
-        examples=[
-            OpenApiExample("Respuesta exitosa", value=body, response_only=True)
-        ],
+
+def _granted(prefix: bytes, request: Request) -> HttpResponse:
+    """Respuesta 200 de un Permiso*: prefijo prerenderizado + usuario actual."""
+    return HttpResponse(
+        prefix + orjson.dumps(str(request.user)) + b"}",
+        content_type="application/json",
     )
 
 
+async def _role_name(user) -> str | None:
+    """
+    Nombre del rol de *user* desde una view async.
+
+    CustomJWTAuthentication ya trae el rol con select_related; solo si no
+    vino precargado (p. ej. otro autenticador) se lee fuera del event loop.
+    """
+    if user._meta.get_field("role").is_cached(user):
+        role = user.role
+    else:
+        role = await sync_to_async(getattr)(user, "role")
+    return role.name if role else None
+
+
 # ===========================================================================
 # ESCENARIO A — Sin autenticación (endpoints públicos)
 # ===========================================================================
 
-class PublicView(APIView):
-    """Endpoint completamente público, sin autenticación."""
-    permission_classes = [AllowAny]
+# Los dos endpoints públicos son async (adrf): el caller anónimo no toca la
+# DB y la request se resuelve en el event loop sin ocupar un thread.
 
-    @extend_schema(
-        tags=["Playground"],
-        summary="Endpoint público (sin token)",
-        description=(
-            "Responde a **cualquier usuario**, autenticado o no.\n\n"
-            "### ¿Qué demuestra?\n"
-            "Que `permission_classes = [AllowAny]` desactiva por completo la verificación de identidad.\n\n"
-            "### Cómo probarlo\n"
-            "1. **Sin Bearer token** → debería retornar `200` ✅\n"
-            "2. **Con un Bearer token válido** → también retorna `200` ✅\n"
-            "3. **Con un token inválido/expirado** → también retorna `200` ✅ "
-            "(AllowAny ignora el header Authorization completamente)\n\n"
-            "### Resultado esperado por roles\n"
-            "| Estado del usuario | Resultado |\n"
-            "|--------------------|-----------|\n"
-            "| Sin token (anónimo) | ✅ 200 |\n"
-            "| Token expirado | ✅ 200 |\n"
-            "| Autenticado, cualquier rol | ✅ 200 |\n"
-        ),
-        auth=[],
-        responses={
-            200: _ok(
-                "PublicResponse",
-                {
-                    "message": "Endpoint público — accesible sin autenticación",
-                    "authenticated": "false",
-                },
-            )
-        },
-    )
-    def get(self, request: Request) -> Response:
-        is_auth = bool(request.user and request.user.is_authenticated)
-        return Response({
-            "message": "Endpoint público — accesible sin autenticación",
-            "authenticated": str(is_auth).lower(),
-            "user": str(request.user) if is_auth else "anónimo",
-        })
+# La respuesta de /public/ solo depende del header Authorization y declara
+# `Vary: Authorization`. La del caller anónimo es fija y cacheable por 60 s;
+# la del autenticado se arma en cada request y se marca `private`, así ningún
+# cache compartido la guarda y un cambio de identidad se ve enseguida. Los
+# headers se aplican dentro del handler: los decoradores sync de Django
+# (cache_page, vary_on_headers) no sirven sobre el dispatch de adrf, que
+# retorna una corrutina.
+_PUBLIC_CACHE_SECONDS = 60
+
+# Cuerpos fijos para el caller anónimo, serializados una vez al importar.
+_PUBLIC_ANON_BODY = orjson.dumps({
+    "message": "Endpoint público — accesible sin autenticación",
+    "authenticated": "false",
+    "user": "anónimo",
+})
+_ANON_INFO_BODY = orjson.dumps({"authenticated": "false", "user": "anónimo", "role": None})
 
 
-class AnonymousInfoView(APIView):
+class PublicView(AsyncAPIView):
+    """Endpoint completamente público, sin autenticación."""
+    permission_classes = [AllowAny]
+
+    @documented(schemas.public_schema)
+    async def get(self, request: Request) -> HttpResponse:
+        user = request.user
+        if not (user and user.is_authenticated):
+            response = HttpResponse(_PUBLIC_ANON_BODY, content_type="application/json")
+            patch_response_headers(response, _PUBLIC_CACHE_SECONDS)
+        else:
+            response = _json({
+                "message": "Endpoint público — accesible sin autenticación",
+                "authenticated": "true",
+                "user": str(user),
+            })
+            patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ("Authorization",))
+        return response
+
+
+class AnonymousInfoView(AsyncAPIView):
     """Muestra información del estado de autenticación del caller."""
     permission_classes = [AllowAny]
 
-    @extend_schema(
-        tags=["Playground"],
-        summary="¿Quién llama? (público)",
-        description=(
-            "Endpoint público que **informa el estado de autenticación** del solicitante.\n\n"
-            "Útil para verificar que el token se está enviando correctamente "
-            "antes de probar endpoints protegidos.\n\n"
-            "### Cómo probarlo\n"
-            "1. Sin Bearer token → `authenticated: false`, `user: 'anónimo'`\n"
-            "2. Con Bearer token válido → `authenticated: true`, muestra email y rol\n\n"
-            "### Resultado esperado\n"
-            "| Estado | `authenticated` | `user` | `role` |\n"
-            "|--------|----------------|--------|--------|\n"
-            "| Sin token | `false` | `'anónimo'` | `null` |\n"
-            "| Con token válido | `true` | email del usuario | nombre del rol |\n"
-        ),
-        auth=[],
-        responses={
-            200: OpenApiResponse(
-                response=inline_serializer(
-                    name="AnonymousInfoResponse",
-                    fields={
-                        "authenticated": s.CharField(),
-                        "user": s.CharField(),
-                        "role": s.CharField(allow_null=True),
-                    },
-                ),
-                description="Información del caller.",
-                examples=[
-                    OpenApiExample(
-                        "Anónimo",
-                        value={"authenticated": "false", "user": "anónimo", "role": None},
-                        response_only=True,
-                    ),
-                    OpenApiExample(
-                        "Autenticado",
-                        value={"authenticated": "true", "user": "john@example.com", "role": "Operador"},
-                        response_only=True,
-                    ),
-                ],
-            )
-        },
-    )
-    def get(self, request: Request) -> Response:
-        is_auth = bool(request.user and request.user.is_authenticated)
-        role = getattr(request.user, "role", None) if is_auth else None
+    @documented(schemas.anonymous_info_schema)
+    async def get(self, request: Request) -> Response | HttpResponse:
+        user = request.user
+        if not (user and user.is_authenticated):
+            return HttpResponse(_ANON_INFO_BODY, content_type="application/json")
         return Response({
-            "authenticated": str(is_auth).lower(),
-            "user": str(request.user) if is_auth else "anónimo",
-            "role": str(role) if role else None,
+            "authenticated": "true",
+            "user": str(user),
+            "role": await _role_name(user),
         })
 
 
@@ -192,49 +148,18 @@ class AnonymousInfoView(APIView):
 # ESCENARIO B — Solo autenticación (cualquier rol)
 # ===========================================================================
 
-class AuthenticatedOnlyView(APIView):
+class AuthenticatedOnlyView(RBACView):
     """Requiere JWT válido. No exige ningún permiso específico."""
     permission_classes = [IsAuthenticated]
 
-    @extend_schema(
-        tags=["Playground"],
-        summary="Solo usuarios autenticados (cualquier rol)",
-        description=(
-            "Responde a cualquier usuario con un **JWT válido**, "
-            "independientemente del rol que tenga asignado.\n\n"
-            "### ¿Qué demuestra?\n"
-            "`IsAuthenticated` verifica solo que el token existe y es válido. "
-            "No consulta roles ni permisos.\n\n"
-            "### Cómo probarlo\n"
-            "1. **Sin Bearer token** → `401` ❌\n"
-            "2. **Con token expirado** → `401` ❌\n"
-            "3. **Con token válido, rol Operador** → `200` ✅\n"
-            "4. **Con token válido, rol Administrador** → `200` ✅\n\n"
-            "### Resultado esperado por estado\n"
-            "| Estado | Resultado |\n"
-            "|--------|-----------|\n"
-            "| Sin token | ❌ 401 |\n"
-            "| Token expirado | ❌ 401 |\n"
-            "| Token válido, **cualquier rol** | ✅ 200 |\n"
-        ),
-        responses={
-            200: _ok(
-                "AuthenticatedOnlyResponse",
-                {
-                    "message": "Acceso correcto — estás autenticado",
-                    "user": "john@example.com",
-                    "role": "Operador",
-                },
-            ),
-            401: _401,
-        },
-    )
+    @documented(schemas.authenticated_only_schema)
     def get(self, request: Request) -> Response:
-        role = getattr(request.user, "role", None)
+        user = request.user
+        role = user.role  # precargado por CustomJWTAuthentication
         return Response({
             "message": "Acceso correcto — estás autenticado",
-            "user": str(request.user),
-            "role": str(role) if role else None,
+            "user": str(user),
+            "role": role.name if role else None,
         })
 
 
@@ -242,447 +167,151 @@ class AuthenticatedOnlyView(APIView):
 # ESCENARIO C — HasPermission (permiso único, distintos niveles)
 # ===========================================================================
 
-class PermisoConciliacionRun(APIView):
+class PermisoConciliacionRun(RBACView):
     """Requiere conciliacion.run — solo Administrador."""
-    permission_classes = [IsAuthenticated, HasPermission("conciliacion.run")]
-
-    @extend_schema(
-        tags=["Playground"],
-        summary="Requiere: conciliacion.run",
-        description=(
-            "Acepta usuarios cuyo rol incluya el permiso `conciliacion.run`.\n\n"
-            "### Acceso por rol\n"
-            "| Rol | Tiene `conciliacion.run` | Resultado |\n"
-            "|-----|--------------------------|----------|\n"
-            "| Sin token | — | ❌ 401 |\n"
-            "| **Operador** | ❌ No | ❌ 403 |\n"
-            "| **Administrador** | ✅ Sí | ✅ 200 |\n\n"
-            "### Prueba rápida\n"
-            "Logueate como usuario con rol **Operador** → `403`\n\n"
-            "Logueate como usuario con rol **Administrador** → `200`"
-        ),
-        responses={200: _ok("PermisoConciliacionRunResponse", {"acceso": "concedido", "permiso": "conciliacion.run"}), 401: _401, 403: _403},
-    )
-    def get(self, request: Request) -> Response:
-        return Response({"acceso": "concedido", "permiso": "conciliacion.run", "user": str(request.user)})
+    permission_classes = [AuthenticatedHasPermission("conciliacion.run")]
+    _BODY = _granted_prefix({"acceso": "concedido", "permiso": "conciliacion.run"})
+
+    @documented(schemas.permiso_conciliacion_run_schema)
+    def get(self, request: Request) -> HttpResponse:
+        return _granted(self._BODY, request)
 
 
-class PermisoConciliacionExport(APIView):
+class PermisoConciliacionExport(RBACView):
     """Requiere conciliacion.export — solo Administrador."""
-    permission_classes = [IsAuthenticated, HasPermission("conciliacion.export")]
-
-    @extend_schema(
-        tags=["Playground"],
-        summary="Requiere: conciliacion.export",
-        description=(
-            "Acepta usuarios cuyo rol incluya el permiso `conciliacion.export`.\n\n"
-            "### Acceso por rol\n"
-            "| Rol | Tiene `conciliacion.export` | Resultado |\n"
-            "|-----|-----------------------------|----------|\n"
-            "| Sin token | — | ❌ 401 |\n"
-            "| **Operador** | ❌ No | ❌ 403 |\n"
-            "| **Administrador** | ✅ Sí | ✅ 200 |\n\n"
-            "### Prueba rápida\n"
-            "Logueate como **Operador** → `403` (puede ver la conciliación pero no exportar)\n\n"
-            "Logueate como **Administrador** → `200`"
-        ),
-        responses={200: _ok("PermisoConciliacionExportResponse", {"acceso": "concedido", "permiso": "conciliacion.export"}), 401: _401, 403: _403},
-    )
-    def get(self, request: Request) -> Response:
-        return Response({"acceso": "concedido", "permiso": "conciliacion.export", "user": str(request.user)})
+    permission_classes = [AuthenticatedHasPermission("conciliacion.export")]
+    _BODY = _granted_prefix({"acceso": "concedido", "permiso": "conciliacion.export"})
 
+    @documented(schemas.permiso_conciliacion_export_schema)
+    def get(self, request: Request) -> HttpResponse:
+        return _granted(self._BODY, request)
 
-class PermisoReportesExport(APIView):
+
+class PermisoReportesExport(RBACView):
     """Requiere reportes.export — Supervisor y Administrador."""
-    permission_classes = [IsAuthenticated, HasPermission("reportes.export")]
-
-    @extend_schema(
-        tags=["Playground"],
-        summary="Requiere: reportes.export",
-        description=(
-            "Acepta usuarios cuyo rol incluya el permiso `reportes.export`.\n\n"
-            "### Acceso por rol\n"
-            "| Rol | Tiene `reportes.export` | Resultado |\n"
-            "|-----|-------------------------|----------|\n"
-            "| Sin token | — | ❌ 401 |\n"
-            "| **Operador** | ❌ No | ❌ 403 |\n"
-            "| **Administrador** | ✅ Sí | ✅ 200 |\n"
-        ),
-        responses={200: _ok("PermisoReportesExportResponse", {"acceso": "concedido", "permiso": "reportes.export"}), 401: _401, 403: _403},
-    )
-    def get(self, request: Request) -> Response:
-        return Response({"acceso": "concedido", "permiso": "reportes.export", "user": str(request.user)})
+    permission_classes = [AuthenticatedHasPermission("reportes.export")]
+    _BODY = _granted_prefix({"acceso": "concedido", "permiso": "reportes.export"})
+
+    @documented(schemas.permiso_reportes_export_schema)
+    def get(self, request: Request) -> HttpResponse:
+        return _granted(self._BODY, request)
 
 
-class PermisoUsuariosDelete(APIView):
+class PermisoUsuariosDelete(RBACView):
     """Requiere usuarios.delete — solo Administrador."""
-    permission_classes = [IsAuthenticated, HasPermission("usuarios.delete")]
-
-    @extend_schema(
-        tags=["Playground"],
-        summary="Requiere: usuarios.delete  ← solo Administrador",
-        description=(
-            "Solo accesible para el rol **Administrador** "
-            "(único que incluye `usuarios.delete` en la carga inicial).\n\n"
-            "### Acceso por rol\n"
-            "| Rol | Tiene `usuarios.delete` | Resultado |\n"
-            "|-----|-------------------------|----------|\n"
-            "| Sin token | — | ❌ 401 |\n"
-            "| **Operador** | ❌ No | ❌ 403 |\n"
-            "| **Administrador** | ✅ Sí | ✅ 200 |\n\n"
-            "### Prueba rápida\n"
-            "Prueba con **Operador** → `403`.\n\n"
-            "Demuestra que los roles tienen fronteras claras: ver ≠ eliminar."
-        ),
-        responses={200: _ok("PermisoDeleteResponse", {"acceso": "concedido", "permiso": "usuarios.delete"}), 401: _401, 403: _403},
-        request=None,
-    )
-    def delete(self, request: Request) -> Response:
-        return Response({"acceso": "concedido", "permiso": "usuarios.delete", "user": str(request.user)})
+    permission_classes = [AuthenticatedHasPermission("usuarios.delete")]
+    _BODY = _granted_prefix({"acceso": "concedido", "permiso": "usuarios.delete"})
 
+    @documented(schemas.permiso_usuarios_delete_schema)
+    def delete(self, request: Request) -> HttpResponse:
+        return _granted(self._BODY, request)
 
-class PermisoAdminFull(APIView):
+
+class PermisoAdminFull(RBACView):
     """Requiere admin.full — solo Administrador."""
-    permission_classes = [IsAuthenticated, HasPermission("admin.full")]
-
-    @extend_schema(
-        tags=["Playground"],
-        summary="Requiere: admin.full  ← solo Administrador",
-        description=(
-            "Permiso de mayor nivel del sistema. Solo el rol **Administrador** lo posee.\n\n"
-            "### Acceso por rol\n"
-            "| Rol | Tiene `admin.full` | Resultado |\n"
-            "|-----|--------------------|----------|\n"
-            "| Sin token | — | ❌ 401 |\n"
-            "| **Operador** | ❌ No | ❌ 403 |\n"
-            "| **Administrador** | ✅ Sí | ✅ 200 |\n\n"
-            "### Diferencia con `usuarios.delete`\n"
-            "Ambos son de nivel Administrador, pero son permisos independientes. "
-            "En el futuro se puede crear un rol **Super-Admin** que tenga `admin.full` "
-            "pero no `usuarios.delete` (o viceversa), sin modificar código."
-        ),
-        responses={200: _ok("PermisoAdminFullResponse", {"acceso": "concedido", "permiso": "admin.full"}), 401: _401, 403: _403},
-    )
-    def get(self, request: Request) -> Response:
-        return Response({"acceso": "concedido", "permiso": "admin.full", "user": str(request.user)})
+    permission_classes = [AuthenticatedHasPermission("admin.full")]
+    _BODY = _granted_prefix({"acceso": "concedido", "permiso": "admin.full"})
+
+    @documented(schemas.permiso_admin_full_schema)
+    def get(self, request: Request) -> HttpResponse:
+        return _granted(self._BODY, request)
 
 
 # ===========================================================================
 # ESCENARIO D — HasAnyPermission (lógica OR)
 # ===========================================================================
 
-class PermisoOrView(APIView):
+class PermisoOrView(RBACView):
     """Requiere conciliacion.view OR reportes.view."""
-    permission_classes = [IsAuthenticated, HasAnyPermission("conciliacion.view", "reportes.view")]
-
-    @extend_schema(
-        tags=["Playground"],
-        summary="Requiere: conciliacion.view OR reportes.view",
-        description=(
-            "Acepta usuarios que tengan **al menos uno** de los dos permisos.\n\n"
-            "### Clase usada: `HasAnyPermission('conciliacion.view', 'reportes.view')`\n\n"
-            "### Acceso por rol\n"
-            "| Rol | `conciliacion.view` | `reportes.view` | OR → Resultado |\n"
-            "|-----|---------------------|-----------------|----------------|\n"
-            "| Sin token | — | — | ❌ 401 |\n"
-            "| **Operador** | ✅ | ✅ | ✅ 200 |\n"
-            "| **Administrador** | ✅ | ✅ | ✅ 200 |\n\n"
-            "En este ejemplo ambos roles tienen acceso porque ambos permisos "
-            "están en todos los roles. Para ver el OR en acción, prueba con un rol "
-            "hipotético que tenga solo uno de los dos.\n\n"
-            "### Cuándo usar lógica OR\n"
-            "Ideal cuando **distintos dominios del sistema** necesitan acceso al mismo recurso. "
-            "Ej: el equipo de conciliación y el equipo de reportes pueden ver el mismo dashboard."
-        ),
-        responses={
-            200: _ok(
-                "PermisoOrResponse",
-                {
-                    "acceso": "concedido",
-                    "logica": "OR",
-                    "permisos_evaluados": "conciliacion.view | reportes.view",
-                },
-            ),
-            401: _401,
-            403: OpenApiResponse(
-                description=(
-                    "**403** — El usuario no tiene ni `conciliacion.view` ni `reportes.view`.\n\n"
-                    "En la configuración inicial esto **nunca ocurre** porque todos los roles "
-                    "tienen ambos permisos, pero aplica si se crea un rol sin ellos."
-                ),
-                examples=[
-                    OpenApiExample(
-                        "Sin ningún permiso",
-                        value={"detail": "Permiso denegado. No posee ninguno de los permisos requeridos."},
-                        response_only=True,
-                    )
-                ],
-            ),
-        },
-    )
-    def get(self, request: Request) -> Response:
-        return Response({
-            "acceso": "concedido",
-            "logica": "OR",
-            "permisos_evaluados": "conciliacion.view | reportes.view",
-            "user": str(request.user),
-        })
+    permission_classes = [AuthenticatedHasAnyPermission("conciliacion.view", "reportes.view")]
+    _BODY = _granted_prefix({
+        "acceso": "concedido",
+        "logica": "OR",
+        "permisos_evaluados": "conciliacion.view | reportes.view",
+    })
+
+    @documented(schemas.permiso_or_schema)
+    def get(self, request: Request) -> HttpResponse:
+        return _granted(self._BODY, request)
 
 
-class PermisoOrRestrictivoView(APIView):
+class PermisoOrRestrictivoView(RBACView):
     """Requiere conciliacion.export OR admin.full — solo Supervisor y Admin."""
-    permission_classes = [IsAuthenticated, HasAnyPermission("conciliacion.export", "admin.full")]
-
-    @extend_schema(
-        tags=["Playground"],
-        summary="Requiere: conciliacion.export OR admin.full  ← solo Administrador",
-        description=(
-            "Ejemplo de OR **restrictivo**: los dos permisos son de nivel alto, "
-            "por lo que solo roles de nivel Supervisor o superior acceden.\n\n"
-            "### Clase usada: `HasAnyPermission('conciliacion.export', 'admin.full')`\n\n"
-            "### Acceso por rol\n"
-            "| Rol | `conciliacion.export` | `admin.full` | OR → Resultado |\n"
-            "|-----|-----------------------|--------------|----------------|\n"
-            "| Sin token | — | — | ❌ 401 |\n"
-            "| **Operador** | ❌ | ❌ | ❌ 403 |\n"
-            "| **Administrador** | ✅ | ✅ | ✅ 200 |\n\n"
-            "Prueba con **Operador** → `403`. Prueba con **Administrador** → `200`."
-        ),
-        responses={
-            200: _ok(
-                "PermisoOrRestrictivoResponse",
-                {
-                    "acceso": "concedido",
-                    "logica": "OR restrictivo",
-                    "permisos_evaluados": "conciliacion.export | admin.full",
-                },
-            ),
-            401: _401,
-            403: _403,
-        },
-    )
-    def get(self, request: Request) -> Response:
-        return Response({
-            "acceso": "concedido",
-            "logica": "OR restrictivo",
-            "permisos_evaluados": "conciliacion.export | admin.full",
-            "user": str(request.user),
-        })
+    permission_classes = [AuthenticatedHasAnyPermission("conciliacion.export", "admin.full")]
+    _BODY = _granted_prefix({
+        "acceso": "concedido",
+        "logica": "OR restrictivo",
+        "permisos_evaluados": "conciliacion.export | admin.full",
+    })
+
+    @documented(schemas.permiso_or_restrictivo_schema)
+    def get(self, request: Request) -> HttpResponse:
+        return _granted(self._BODY, request)
 
 
 # ===========================================================================
 # ESCENARIO E — HasAllPermissions (lógica AND)
 # ===========================================================================
 
-class PermisoAndView(APIView):
+class PermisoAndView(RBACView):
     """Requiere conciliacion.run AND reportes.export — solo Supervisor y Admin."""
-    permission_classes = [IsAuthenticated, HasAllPermissions("conciliacion.run", "reportes.export")]
-
-    @extend_schema(
-        tags=["Playground"],
-        summary="Requiere: conciliacion.run AND reportes.export",
-        description=(
-            "Acepta usuarios que tengan **ambos** permisos simultáneamente.\n\n"
-            "### Clase usada: `HasAllPermissions('conciliacion.run', 'reportes.export')`\n\n"
-            "### Acceso por rol\n"
-            "| Rol | `conciliacion.run` | `reportes.export` | AND → Resultado |\n"
-            "|-----|--------------------|--------------------|------------------|\n"
-            "| Sin token | — | — | ❌ 401 |\n"
-            "| **Operador** | ❌ | ❌ | ❌ 403 |\n"
-            "| **Administrador** | ✅ | ✅ | ✅ 200 |\n\n"
-            "### Punto clave\n"
-            "El **Operador** solo tiene permisos de vista y no posee `conciliacion.run` ni `reportes.export`. "
-            "AND es más estricto: se requieren todos, no basta con uno.\n\n"
-            "### Cuándo usar lógica AND\n"
-            "Operaciones críticas que requieren capacidades de **múltiples dominios** "
-            "(ej: proceso que corre una conciliación y luego exporta el reporte resultante)."
-        ),
-        responses={
-            200: _ok(
-                "PermisoAndResponse",
-                {
-                    "acceso": "concedido",
-                    "logica": "AND",
-                    "permisos_evaluados": "conciliacion.run AND reportes.export",
-                },
-            ),
-            401: _401,
-            403: OpenApiResponse(
-                description=(
-                    "**403** — El usuario no tiene uno o ambos permisos requeridos.\n\n"
-                    "Caso típico: **Operador** no tiene ninguno de los dos permisos requeridos."
-                ),
-                examples=[
-                    OpenApiExample(
-                        "Tiene solo uno",
-                        value={"detail": "Permiso denegado. No posee todos los permisos requeridos."},
-                        response_only=True,
-                    )
-                ],
-            ),
-        },
-        request=None,
-    )
-    def post(self, request: Request) -> Response:
-        return Response({
-            "acceso": "concedido",
-            "logica": "AND",
-            "permisos_evaluados": "conciliacion.run AND reportes.export",
-            "user": str(request.user),
-        })
+    permission_classes = [AuthenticatedHasAllPermissions("conciliacion.run", "reportes.export")]
+    _BODY = _granted_prefix({
+        "acceso": "concedido",
+        "logica": "AND",
+        "permisos_evaluados": "conciliacion.run AND reportes.export",
+    })
+
+    @documented(schemas.permiso_and_schema)
+    def post(self, request: Request) -> HttpResponse:
+        return _granted(self._BODY, request)
 
 
-class PermisoAndAdminView(APIView):
+class PermisoAndAdminView(RBACView):
     """Requiere usuarios.create AND usuarios.delete — solo Administrador."""
-    permission_classes = [IsAuthenticated, HasAllPermissions("usuarios.create", "usuarios.delete")]
-
-    @extend_schema(
-        tags=["Playground"],
-        summary="Requiere: usuarios.create AND usuarios.delete  ← solo Administrador",
-        description=(
-            "Ejemplo extremo de AND: requiere dos permisos de gestión de usuarios "
-            "que solo el **Administrador** posee.\n\n"
-            "### Acceso por rol\n"
-            "| Rol | `usuarios.create` | `usuarios.delete` | AND → Resultado |\n"
-            "|-----|-------------------|--------------------|-----------------|\n"
-            "| Sin token | — | — | ❌ 401 |\n"
-            "| **Operador** | ❌ | ❌ | ❌ 403 |\n"
-            "| **Administrador** | ✅ | ✅ | ✅ 200 |\n\n"
-            "Demuestra que se puede construir una **jerarquía implícita** "
-            "combinando AND con permisos de nivel alto."
-        ),
-        responses={
-            200: _ok("PermisoAndAdminResponse", {"acceso": "concedido", "logica": "AND — solo Admin"}),
-            401: _401,
-            403: _403,
-        },
-        request=None,
-    )
-    def delete(self, request: Request) -> Response:
-        return Response({
-            "acceso": "concedido",
-            "logica": "AND — solo Admin",
-            "permisos_evaluados": "usuarios.create AND usuarios.delete",
-            "user": str(request.user),
-        })
+    permission_classes = [AuthenticatedHasAllPermissions("usuarios.create", "usuarios.delete")]
+    _BODY = _granted_prefix({
+        "acceso": "concedido",
+        "logica": "AND — solo Admin",
+        "permisos_evaluados": "usuarios.create AND usuarios.delete",
+    })
+
+    @documented(schemas.permiso_and_admin_schema)
+    def delete(self, request: Request) -> HttpResponse:
+        return _granted(self._BODY, request)
 
 
 # ===========================================================================
 # ESCENARIO F — Introspección: quién soy y qué puedo hacer
 # ===========================================================================
 
-class WhoAmIView(APIView):
+class WhoAmIView(RBACView):
     """Devuelve identidad completa + permisos del usuario autenticado."""
     permission_classes = [IsAuthenticated]
 
-    @extend_schema(
-        tags=["Playground"],
-        summary="¿Quién soy? ¿Qué puedo hacer?",
-        description=(
-            "Retorna el perfil completo del usuario autenticado junto con su rol "
-            "y la lista exacta de permisos que tiene en este momento.\n\n"
-            "### ¿Qué demuestra?\n"
-            "- Que el rol y los permisos se leen **directamente de la base de datos** "
-            "en cada request, sin depender del contenido del JWT.\n"
-            "- Que cambiar el rol en el admin de Django surte efecto **inmediatamente** "
-            "en la próxima llamada a este endpoint.\n\n"
-            "### Casos de prueba\n"
-            "1. Loguear como **Operador** → ver que solo tiene permisos de vista\n"
-            "2. En el admin de Django cambiar ese usuario a **Administrador**\n"
-            "3. **Sin renovar el token**, volver a llamar este endpoint → los permisos ya cambiaron\n\n"
-            "### Respuestas por rol\n"
-            "| Rol | Permisos esperados |\n"
-            "|-----|--------------------\n"
-            "| Operador | `conciliacion.view`, `reportes.view`, `dashboard.view` (3 permisos) |\n"
-            "| Administrador | Todos (11 permisos) |\n"
-            "| Sin rol | `[]` |\n"
-        ),
-        responses={
-            200: OpenApiResponse(
-                response=inline_serializer(
-                    name="WhoAmIResponse",
-                    fields={
-                        "user": s.CharField(),
-                        "email": s.EmailField(),
-                        "role": s.CharField(allow_null=True),
-                        "permissions": s.ListField(child=s.CharField()),
-                        "permission_count": s.IntegerField(),
-                    },
-                ),
-                description="Identidad completa + permisos del usuario.",
-                examples=[
-                    OpenApiExample(
-                        "Operador",
-                        value={
-                            "user": "john@example.com",
-                            "email": "john@example.com",
-                            "role": "Operador",
-                            "permissions": [
-                                "conciliacion.view",
-                                "dashboard.view",
-                                "reportes.view",
-                            ],
-                            "permission_count": 3,
-                        },
-                        response_only=True,
-                    ),
-                    OpenApiExample(
-                        "Administrador",
-                        value={
-                            "user": "admin@example.com",
-                            "email": "admin@example.com",
-                            "role": "Administrador",
-                            "permissions": [
-                                "admin.full",
-                                "conciliacion.export",
-                                "conciliacion.run",
-                                "conciliacion.view",
-                                "dashboard.view",
-                                "reportes.export",
-                                "reportes.view",
-                                "usuarios.create",
-                                "usuarios.delete",
-                                "usuarios.edit",
-                                "usuarios.view",
-                            ],
-                            "permission_count": 11,
-                        },
-                        response_only=True,
-                    ),
-                    OpenApiExample(
-                        "Sin rol",
-                        value={
-                            "user": "norole@example.com",
-                            "email": "norole@example.com",
-                            "role": None,
-                            "permissions": [],
-                            "permission_count": 0,
-                        },
-                        response_only=True,
-                    ),
-                ],
-            ),
-            401: _401,
-        },
-    )
-    def get(self, request: Request) -> Response:
+    @documented(schemas.who_am_i_schema)
+    def get(self, request: Request) -> HttpResponse:
         user = request.user
-        role = getattr(user, "role", None)
-        permisos = get_user_permissions(user)
-        return Response({
-            "user": str(user),
-            "email": getattr(user, "email", str(user)),
-            "role": str(role) if role else None,
-            "permissions": sorted(permisos),
+        role = user.role
+        permisos = request_permissions(request)
+        user_str = str(user)
+        return _json({
+            "user": user_str,
+            "email": getattr(user, "email", user_str),
+            "role": role.name if role else None,
+            "permissions": sorted_permission_codes(permisos),
             "permission_count": len(permisos),
         })
 
 
-class AccessMatrixView(APIView):
+class AccessMatrixView(RBACView):
     """Muestra una matriz de acceso para todos los permisos del sistema."""
     permission_classes = [IsAuthenticated]
 
-    _TODOS_LOS_PERMISOS = [
+    # Universo de permisos que evalúa la matriz, ordenado una sola vez al
+    # cargar la clase: particionarlo preserva el orden y evita ordenar
+    # `tiene` / `no_tiene` en cada request.
+    _TODOS_LOS_PERMISOS = tuple(sorted({
         "conciliacion.run",
         "conciliacion.view",
         "conciliacion.export",
@@ -694,83 +323,25 @@ class AccessMatrixView(APIView):
         "usuarios.edit",
         "usuarios.delete",
         "admin.full",
-    ]
-
-    @extend_schema(
-        tags=["Playground"],
-        summary="Matriz de acceso — qué endpoints puedo usar",
-        description=(
-            "Evalúa **en tiempo real** qué permisos del sistema tiene el usuario "
-            "y cuáles le faltan, devolviendo una matriz completa.\n\n"
-            "Útil para que el frontend sepa exactamente qué mostrar/ocultar "
-            "sin hacer múltiples requests.\n\n"
-            "### Cómo funciona\n"
-            "Para cada permiso conocido del sistema llama internamente a "
-            "`user_has_permission(user, code)` y agrupa los resultados en "
-            "`tiene` y `no_tiene`.\n\n"
-            "### Valor de esta vista\n"
-            "Demuestra que el sistema RBAC es **dinámico**: si se cambia el rol "
-            "del usuario en el admin de Django, la matriz es diferente en el siguiente "
-            "request **sin renovar el token JWT**."
-        ),
-        responses={
-            200: OpenApiResponse(
-                response=inline_serializer(
-                    name="AccessMatrixResponse",
-                    fields={
-                        "user": s.CharField(),
-                        "role": s.CharField(allow_null=True),
-                        "tiene": s.ListField(child=s.CharField()),
-                        "no_tiene": s.ListField(child=s.CharField()),
-                    },
-                ),
-                description="Matriz de acceso completa.",
-                examples=[
-                    OpenApiExample(
-                        "Operador",
-                        value={
-                            "user": "operador@example.com",
-                            "role": "Operador",
-                            "tiene": [
-                                "conciliacion.view",
-                                "dashboard.view",
-                                "reportes.view",
-                            ],
-                            "no_tiene": [
-                                "admin.full",
-                                "conciliacion.export",
-                                "conciliacion.run",
-                                "reportes.export",
-                                "usuarios.create",
-                                "usuarios.delete",
-                                "usuarios.edit",
-                                "usuarios.view",
-                            ],
-                        },
-                        response_only=True,
-                    ),
-                ],
-            ),
-            401: _401,
-        },
-    )
-    def get(self, request: Request) -> Response:
-        from apps.authorization.services import user_has_permission
-        user = request.user
-        role = getattr(user, "role", None)
+    }))
 
-        tiene = []
-        no_tiene = []
-        for code in self._TODOS_LOS_PERMISOS:
-            if user_has_permission(user, code):
-                tiene.append(code)
-            else:
-                no_tiene.append(code)
-
-        return Response({
+    @documented(schemas.access_matrix_schema)
+    def get(self, request: Request) -> HttpResponse:
+        user = request.user
+        role = user.role
+        if role is None:
+            # Sin rol no hay permisos: todo cae en `no_tiene`.
+            return _json({
+                "user": str(user),
+                "role": None,
+                "tiene": [],
+                "no_tiene": self._TODOS_LOS_PERMISOS,
+            })
+        permisos = request_permissions(request)
+
+        return _json({
             "user": str(user),
-            "role": str(role) if role else None,
-            "tiene": tiene,
-            "no_tiene": no_tiene,
+            "role": role.name,
+            "tiene": [code for code in self._TODOS_LOS_PERMISOS if code in permisos],
+            "no_tiene": [code for code in self._TODOS_LOS_PERMISOS if code not in permisos],
         })
-
@@ -0,0 +1,69 @@
+# Generated by Django 6.0.2 on 2026-10-16 12:00
+
+import logging
+import re
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+logger = logging.getLogger(__name__)
+
+CUIT_LENGTH = 11
+
+
+def normalize_existing_cuits(apps, schema_editor):
+    """
+    Reescribe los CUIT existentes en forma canónica (solo dígitos).
+
+    Antes de tocar filas agrupa por valor canónico: si dos clientes difieren
+    solo en guiones/espacios, la reescritura chocaría con el índice único, así
+    que se aborta listando los PKs a unificar a mano. Los CUIT cuya forma
+    canónica no tiene 11 dígitos se normalizan igual y se informan por log.
+    """
+    Client = apps.get_model('trading', 'Client')
+    non_digits = re.compile(r'\D+')
+
+    groups = defaultdict(list)
+    for pk, cuit in Client.objects.values_list('pk', 'cuit').iterator():
+        groups[non_digits.sub('', cuit)].append((pk, cuit))
+
+    collisions = {canonical: rows for canonical, rows in groups.items() if len(rows) > 1}
+    if collisions:
+        detail = '; '.join(
+            f"{canonical}: pks {sorted(pk for pk, _ in rows)}"
+            for canonical, rows in sorted(collisions.items())
+        )
+        raise RuntimeError(
+            'No se pueden normalizar los CUIT: hay clientes que solo difieren en '
+            f'guiones/espacios ({detail}). Unificarlos y volver a migrar.'
+        )
+
+    invalid = sorted(
+        pk for canonical, rows in groups.items() if len(canonical) != CUIT_LENGTH
+        for pk, _ in rows
+    )
+    if invalid:
+        logger.warning(
+            'CUIT sin %s dígitos tras normalizar, revisar clientes: %s', CUIT_LENGTH, invalid
+        )
+
+    for canonical, [(pk, cuit)] in groups.items():
+        if canonical != cuit:
+            Client.objects.filter(pk=pk).update(cuit=canonical)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_existing_cuits, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='client',
+            name='cuit',
+            field=models.CharField(help_text='11 dígitos sin guiones (forma canónica). Identificador fiscal único.', max_length=13, unique=True, verbose_name='CUIT'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.2 on 2026-10-16 12:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0002_normalize_client_cuit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Última modificación'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='asset',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Última modificación'),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0003_client_asset_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['name'], name='trading_client_name_idx'),
+        ),
+    ]
@@ -23,6 +23,7 @@ Principios de diseño:
 
 from __future__ import annotations
 
+import re
 from decimal import Decimal
 
 from django.core.validators import MinValueValidator
@@ -62,13 +63,29 @@ class TransactionStatus(models.TextChoices):
 # Client
 # ---------------------------------------------------------------------------
 
+CUIT_LENGTH = 11
+
+# Compilada una sola vez: elimina guiones, espacios y cualquier no-dígito.
+_CUIT_NON_DIGITS = re.compile(r"\D+")
+
+
+def normalize_cuit(cuit: str) -> str:
+    """
+    Forma canónica del CUIT: solo dígitos.
+
+    "20-12345678-9", " 20 12345678 9 " y "20123456789" producen la misma
+    clave, por lo que la unicidad no depende de cómo se tipearon los guiones.
+    """
+    return _CUIT_NON_DIGITS.sub("", cuit)
+
 
 class Client(models.Model):
     """
     Contraparte operacional del brokerage.
 
     Identificada de forma única por su CUIT (Clave Única de Identificación
-    Tributaria), identificador fiscal estándar en Argentina.
+    Tributaria), identificador fiscal estándar en Argentina. El CUIT se
+    persiste en forma canónica (11 dígitos, sin guiones): ver `normalize_cuit`.
 
     - Un cliente BLOCKED no puede generar órdenes ni transacciones nuevas.
     - No se puede eliminar si tiene transacciones vinculadas (PROTECT).
@@ -78,7 +95,7 @@ class Client(models.Model):
         max_length=13,
         unique=True,
         verbose_name="CUIT",
-        help_text="Formato: XX-XXXXXXXX-X. Identificador fiscal único.",
+        help_text="11 dígitos sin guiones (forma canónica). Identificador fiscal único.",
     )
     name = models.CharField(
         max_length=200,
@@ -99,6 +116,10 @@ class Client(models.Model):
         auto_now_add=True,
         verbose_name="Fecha de alta",
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Última modificación",
+    )
 
     class Meta:
         app_label = "trading"
@@ -108,6 +129,8 @@ class Client(models.Model):
         indexes = [
             models.Index(fields=["cuit"],   name="trading_client_cuit_idx"),
             models.Index(fields=["status"], name="trading_client_status_idx"),
+            # Respalda el ORDER BY name del listado (ver Meta.ordering).
+            models.Index(fields=["name"],   name="trading_client_name_idx"),
         ]
 
     def __str__(self) -> str:
@@ -149,6 +172,10 @@ class Asset(models.Model):
         verbose_name="¿Activo?",
         help_text="Si False, no acepta nuevas operaciones pero mantiene historial.",
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Última modificación",
+    )
 
     class Meta:
         app_label = "trading"
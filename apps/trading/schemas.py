@@ -0,0 +1,933 @@
+"""
+trading.schemas
+===============
+Metadata OpenAPI (drf-spectacular) de las views del módulo trading.
+
+Mismo esquema que `authorization.schemas`: cada `*_schema()` arma los kwargs
+de `extend_schema` recién al invocarse (memoizada con `functools.cache`) y
+`documented()` solo la invoca si `settings.OPENAPI_SCHEMA_ENABLED` es True.
+Importar views.py no construye ningún OpenApiResponse/OpenApiExample.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import Any
+
+from drf_spectacular.utils import (
+    OpenApiExample,
+    OpenApiParameter,
+    OpenApiResponse,
+    inline_serializer,
+)
+from rest_framework import serializers as s
+
+from .serializers import (
+    AssetCreateSerializer,
+    AssetSerializer,
+    ClientCreateSerializer,
+    ClientSerializer,
+    ClientUpdateSerializer,
+    FiatCurrencyCreateSerializer,
+    FiatCurrencySerializer,
+    OrderCreateSerializer,
+    OrderSerializer,
+    TransactionCreateSerializer,
+    TransactionSerializer,
+)
+from .services import BULK_BATCH_SIZE
+
+
+# ---------------------------------------------------------------------------
+# Shared OpenAPI building blocks
+# ---------------------------------------------------------------------------
+
+
+@cache
+def _401() -> OpenApiResponse:
+    return OpenApiResponse(description="No autenticado. Se requiere JWT válido en el header `Authorization: Bearer <token>`.")
+
+
+@cache
+def _304_list() -> OpenApiResponse:
+    return OpenApiResponse(
+        description=(
+            "El listado no cambió desde la versión indicada en `If-None-Match`. "
+            "Sin cuerpo; el cliente reutiliza su copia."
+        ),
+    )
+
+
+@cache
+def _404_client() -> OpenApiResponse:
+    return OpenApiResponse(
+        response=inline_serializer(
+            name="ClientNotFoundResponse",
+            fields={"error": s.CharField(default="Cliente no encontrado.")},
+        ),
+        description="El cliente con el ID proporcionado no existe.",
+    )
+
+
+@cache
+def _404_asset() -> OpenApiResponse:
+    return OpenApiResponse(
+        response=inline_serializer(
+            name="AssetNotFoundResponse",
+            fields={"error": s.CharField(default="Activo no encontrado.")},
+        ),
+        description="El activo con el ID proporcionado no existe.",
+    )
+
+
+@cache
+def _400_validation() -> OpenApiResponse:
+    return OpenApiResponse(
+        response=inline_serializer(
+            name="BrokerageValidationErrorResponse",
+            fields={
+                "cuit": s.ListField(child=s.CharField(), required=False),
+                "name": s.ListField(child=s.CharField(), required=False),
+                "code": s.ListField(child=s.CharField(), required=False),
+            },
+        ),
+        description=(
+            "Datos de entrada inválidos. El cuerpo incluye un objeto con los campos "
+            "que fallaron y una lista de mensajes descriptivos por campo.\n\n"
+            "Ejemplo: `{\"cuit\": [\"Ya existe un cliente con CUIT '20123456789'.\"]}`"
+        ),
+    )
+
+
+@cache
+def _client_example() -> OpenApiExample:
+    return OpenApiExample(
+        name="Cliente activo",
+        summary="Respuesta estándar de un cliente operativo",
+        value={
+            "id": 3,
+            "cuit": "20123456789",
+            "name": "Industrias Río de la Plata S.A.",
+            "status": "ACTIVE",
+            "is_active": True,
+            "created_at": "2026-02-15T10:30:00Z",
+        },
+        response_only=True,
+    )
+
+
+@cache
+def _client_blocked_example() -> OpenApiExample:
+    return OpenApiExample(
+        name="Cliente bloqueado",
+        summary="Cliente cuyo estado es BLOCKED — no puede operar",
+        value={
+            "id": 7,
+            "cuit": "30987654321",
+            "name": "Inversiones del Sur S.R.L.",
+            "status": "BLOCKED",
+            "is_active": False,
+            "created_at": "2026-01-10T09:00:00Z",
+        },
+        response_only=True,
+    )
+
+
+@cache
+def _asset_active_example() -> OpenApiExample:
+    return OpenApiExample(
+        name="Activo activo",
+        summary="Instrumento habilitado para operar",
+        value={
+            "id": 1,
+            "code": "BTC",
+            "name": "Bitcoin",
+            "is_active": True,
+        },
+        response_only=True,
+    )
+
+
+@cache
+def _asset_inactive_example() -> OpenApiExample:
+    return OpenApiExample(
+        name="Activo desactivado",
+        summary="Instrumento suspendido — no acepta nuevas operaciones",
+        value={
+            "id": 5,
+            "code": "LUNA",
+            "name": "Terra Luna",
+            "is_active": False,
+        },
+        response_only=True,
+    )
+
+
+@cache
+def _404_fiat() -> OpenApiResponse:
+    return OpenApiResponse(
+        response=inline_serializer(
+            name="FiatNotFoundResponse",
+            fields={"error": s.CharField(default="Moneda fiat no encontrada.")},
+        ),
+        description="La moneda fiat con el ID proporcionado no existe.",
+    )
+
+
+@cache
+def _fiat_ars_example() -> OpenApiExample:
+    return OpenApiExample(
+        name="ARS activo",
+        value={"id": 1, "code": "ARS", "name": "Peso Argentino", "is_active": True},
+        response_only=True,
+    )
+
+
+@cache
+def _fiat_usd_example() -> OpenApiExample:
+    return OpenApiExample(
+        name="USD activo",
+        value={"id": 2, "code": "USD", "name": "Dólar Estadounidense", "is_active": True},
+        response_only=True,
+    )
+
+
+@cache
+def _404_order() -> OpenApiResponse:
+    return OpenApiResponse(
+        response=inline_serializer(
+            name="OrderNotFoundResponse",
+            fields={"error": s.CharField(default="Orden no encontrada.")},
+        ),
+        description="La orden con el ID proporcionado no existe.",
+    )
+
+
+@cache
+def _order_example() -> OpenApiExample:
+    return OpenApiExample(
+        name="Orden de compra pendiente",
+        value={
+            "id": 1,
+            "client_id": 3,
+            "client_cuit": "20123456789",
+            "asset_code": "BTC",
+            "fiat_currency_code": "ARS",
+            "transaction_type": "BUY",
+            "limit_price": "50000000.00000000",
+            "quantity": "0.01000000",
+            "notional": "500000.00000000",
+            "status": "PENDING",
+            "created_at": "2026-02-20T14:30:00Z",
+            "updated_at": "2026-02-20T14:30:00Z",
+        },
+        response_only=True,
+    )
+
+
+@cache
+def _404_tx() -> OpenApiResponse:
+    return OpenApiResponse(
+        response=inline_serializer(
+            name="TxNotFoundResponse",
+            fields={"error": s.CharField(default="Transacción no encontrada.")},
+        ),
+        description="La transacción con el ID proporcionado no existe.",
+    )
+
+
+@cache
+def _tx_example() -> OpenApiExample:
+    return OpenApiExample(
+        name="Compra de BTC",
+        value={
+            "id": 1,
+            "client_id": 3,
+            "client_cuit": "20123456789",
+            "order_id": 1,
+            "asset_code": "BTC",
+            "fiat_currency_code": "ARS",
+            "transaction_type": "BUY",
+            "unit_price": "50000000.00000000",
+            "quantity": "0.01000000",
+            "total": "500000.00000000",
+            "status": "CONFIRMED",
+            "blockchain_hash": None,
+            "created_at": "2026-02-20T14:35:00Z",
+        },
+        response_only=True,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Client views
+# ---------------------------------------------------------------------------
+
+
+@cache
+def clients_list_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_clients_list",
+        tags=["Trading"],
+        summary="Listar todos los clientes",
+        description=(
+            "Retorna la lista completa de clientes registrados en el sistema de brokerage, "
+            "ordenados alfabéticamente por nombre.\n\n"
+            "**¿Qué es un Cliente?**\n"
+            "Un cliente es una contraparte operacional identificada por su CUIT (Clave Única "
+            "de Identificación Tributaria). Puede tratarse de una persona física o jurídica "
+            "habilitada para realizar operaciones financieras en la plataforma.\n\n"
+            "**Estados posibles:**\n"
+            "- `ACTIVE` — el cliente puede operar normalmente.\n"
+            "- `BLOCKED` — el cliente está suspendido y no puede generar nuevas operaciones. "
+            "  El historial previo se mantiene intacto.\n\n"
+            "**Caché:** la respuesta incluye `ETag`; reenviarlo en `If-None-Match` "
+            "devuelve `304` sin cuerpo si el listado no cambió.\n\n"
+            "**Nota:** este endpoint devuelve todos los clientes sin paginar. "
+            "Para operaciones de alta escala, se incorporará paginación en una iteración posterior."
+        ),
+        responses={
+            200: OpenApiResponse(
+                response=ClientSerializer(many=True),
+                description="Lista de clientes. Array vacío `[]` si no hay clientes registrados.",
+                examples=[
+                    OpenApiExample(
+                        name="Lista con clientes mixtos",
+                        summary="Respuesta típica con clientes activos y bloqueados",
+                        value=[
+                            {
+                                "id": 1,
+                                "cuit": "20123456789",
+                                "name": "Industrias Río de la Plata S.A.",
+                                "status": "ACTIVE",
+                                "is_active": True,
+                                "created_at": "2026-02-15T10:30:00Z",
+                            },
+                            {
+                                "id": 2,
+                                "cuit": "30987654321",
+                                "name": "Inversiones del Sur S.R.L.",
+                                "status": "BLOCKED",
+                                "is_active": False,
+                                "created_at": "2026-01-10T09:00:00Z",
+                            },
+                        ],
+                        response_only=True,
+                    )
+                ],
+            ),
+            304: _304_list(),
+            401: _401(),
+        },
+    )
+
+
+@cache
+def clients_create_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_clients_create",
+        tags=["Trading"],
+        summary="Registrar nuevo cliente",
+        description=(
+            "Registra una nueva contraparte operacional en el sistema de brokerage.\n\n"
+            "**Reglas de negocio:**\n"
+            "- El `cuit` debe ser único en el sistema. Si ya existe un cliente con el mismo "
+            "  CUIT, se retorna `400` con el detalle del conflicto.\n"
+            "- El `cuit` se acepta con o sin guiones (`20-12345678-9` o `20123456789`) y se "
+            "  almacena en forma canónica: 11 dígitos sin separadores.\n"
+            "- El cliente se crea con estado `ACTIVE` de forma automática.\n"
+            "- `name` acepta razón social o nombre completo (máx. 200 caracteres).\n\n"
+            "**No confundir con el módulo de usuarios:** este endpoint registra una "
+            "contraparte financiera, no una cuenta de acceso al sistema."
+        ),
+        request=ClientCreateSerializer,
+        responses={
+            201: OpenApiResponse(
+                response=ClientSerializer,
+                description="Cliente creado exitosamente. Se retorna la representación completa.",
+                examples=[_client_example()],
+            ),
+            400: _400_validation(),
+            401: _401(),
+        },
+    )
+
+
+@cache
+def clients_retrieve_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_clients_retrieve",
+        tags=["Trading"],
+        summary="Obtener detalle de un cliente",
+        description=(
+            "Retorna la representación completa de un cliente identificado por su `id` interno.\n\n"
+            "Útil para:\n"
+            "- Verificar el estado actual de un cliente antes de procesar una operación.\n"
+            "- Mostrar datos del cliente en pantallas de detalle o confirmación.\n\n"
+            "**Nota:** si necesitas buscar por CUIT en lugar de por ID, "
+            "usa el listado general y filtrá en el cliente."
+        ),
+        responses={
+            200: OpenApiResponse(
+                response=ClientSerializer,
+                description="Detalle del cliente.",
+                examples=[_client_example(), _client_blocked_example()],
+            ),
+            401: _401(),
+            404: _404_client(),
+        },
+    )
+
+
+@cache
+def clients_partial_update_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_clients_partial_update",
+        tags=["Trading"],
+        summary="Actualizar nombre del cliente",
+        description=(
+            "Actualiza el campo `name` (razón social / nombre completo) de un cliente existente.\n\n"
+            "**Campos modificables:**\n"
+            "- `name` — nombre o razón social. Máx. 200 caracteres. No puede quedar vacío.\n\n"
+            "**Campos inmutables:** `cuit`, `status`, `created_at`. "
+            "Para cambiar el estado de un cliente usá los endpoints `/block/` y `/unblock/`.\n\n"
+            "Este endpoint acepta actualizaciones parciales (`PATCH`): "
+            "solo los campos enviados son modificados."
+        ),
+        request=ClientUpdateSerializer,
+        responses={
+            200: OpenApiResponse(
+                response=ClientSerializer,
+                description="Cliente actualizado. Se retorna la representación completa con el nuevo nombre.",
+                examples=[_client_example()],
+            ),
+            400: _400_validation(),
+            401: _401(),
+            404: _404_client(),
+        },
+    )
+
+
+@cache
+def clients_status_schema() -> dict[str, Any]:
+    return dict(
+        tags=["Trading"],
+        summary="Bloquear / desbloquear cliente",
+        description=(
+            "Cambia el estado operativo del cliente según la ruta (`/block/` o `/unblock/`):\n\n"
+            "- `block` — pasa el cliente a `BLOCKED`, impidiendo que genere nuevas operaciones. "
+            "  El historial de operaciones previas se mantiene intacto.\n"
+            "- `unblock` — restaura el estado a `ACTIVE` y lo habilita nuevamente para operar.\n\n"
+            "**Comportamiento:**\n"
+            "- Si el cliente ya está en el estado destino, la operación es **idempotente** "
+            "  (retorna `200` con el estado actual sin generar un error).\n"
+            "- No requiere cuerpo en el request (`body` vacío o ausente).\n\n"
+            "**Casos de uso típicos:** suspensión preventiva por actividad anómala, orden "
+            "judicial o incumplimiento de compliance; levantamiento de la suspensión una vez "
+            "resuelto el conflicto."
+        ),
+        request=None,
+        responses={
+            200: OpenApiResponse(
+                response=ClientSerializer,
+                description=(
+                    "Cliente con el estado resultante: `BLOCKED` / `is_active: false` tras "
+                    "`block`, `ACTIVE` / `is_active: true` tras `unblock`."
+                ),
+                examples=[_client_blocked_example(), _client_example()],
+            ),
+            401: _401(),
+            404: _404_client(),
+        },
+    )
+
+
+@cache
+def clients_bulk_create_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_clients_bulk_create",
+        tags=["Trading"],
+        summary="Registrar clientes en lote",
+        description=(
+            "Registra varios clientes en una sola operación. Pensado para importaciones "
+            "que de otro modo harían un `POST /clients/` por fila.\n\n"
+            "**Reglas:**\n"
+            f"- El cuerpo es un array de 1 a {BULK_BATCH_SIZE} objetos con el mismo formato "
+            "  que el alta individual.\n"
+            "- Es **todo o nada**: si algún elemento es inválido, algún `cuit` se repite en "
+            "  el lote o ya existe, no se crea ningún cliente.\n"
+            "- Los errores de formato se devuelven como array alineado con la entrada "
+            "  (`{}` para los elementos válidos); los de negocio, bajo `cuit`, listando "
+            "  los CUIT afectados."
+        ),
+        request=ClientCreateSerializer(many=True),
+        responses={
+            201: OpenApiResponse(
+                response=ClientSerializer(many=True),
+                description="Clientes creados, en el mismo orden del request.",
+            ),
+            400: _400_validation(),
+            401: _401(),
+        },
+    )
+
+
+# ---------------------------------------------------------------------------
+# Asset views
+# ---------------------------------------------------------------------------
+
+
+@cache
+def assets_list_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_assets_list",
+        tags=["Trading"],
+        summary="Listar activos / instrumentos",
+        description=(
+            "Retorna la lista de activos (instrumentos negociables) registrados en el sistema.\n\n"
+            "**¿Qué es un Activo?**\n"
+            "Un activo representa un instrumento financiero o criptoactivo identificado por su "
+            "símbolo de mercado (`code`). Ejemplos: `BTC` (Bitcoin), `ETH` (Ethereum), "
+            "`USD` (Dólar estadounidense), `ARS` (Peso argentino).\n\n"
+            "**Filtro por estado activo:**\n"
+            "Pasando `?active=true` se retorna solo los activos habilitados para operar. "
+            "Sin ese parámetro se retornan todos (activos e inactivos).\n\n"
+            "**Ordenamiento:** alfabético por `code`."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="active",
+                type=str,
+                enum=["true"],
+                required=False,
+                description=(
+                    "Si se pasa `active=true`, retorna únicamente los activos con `is_active=true`. "
+                    "Omitir este parámetro retorna todos los activos sin filtrar."
+                ),
+            )
+        ],
+        responses={
+            200: OpenApiResponse(
+                response=AssetSerializer(many=True),
+                description="Lista de activos ordenada por código. Array vacío `[]` si no hay activos.",
+                examples=[
+                    OpenApiExample(
+                        name="Lista completa (activos e inactivos)",
+                        value=[
+                            {"id": 1, "code": "BTC", "name": "Bitcoin", "is_active": True},
+                            {"id": 2, "code": "ETH", "name": "Ethereum", "is_active": True},
+                            {"id": 3, "code": "LUNA", "name": "Terra Luna", "is_active": False},
+                            {"id": 4, "code": "USDT", "name": "Tether USD", "is_active": True},
+                        ],
+                        response_only=True,
+                    ),
+                    OpenApiExample(
+                        name="Solo activos (?active=true)",
+                        value=[
+                            {"id": 1, "code": "BTC", "name": "Bitcoin", "is_active": True},
+                            {"id": 2, "code": "ETH", "name": "Ethereum", "is_active": True},
+                            {"id": 4, "code": "USDT", "name": "Tether USD", "is_active": True},
+                        ],
+                        response_only=True,
+                    ),
+                ],
+            ),
+            304: _304_list(),
+            401: _401(),
+        },
+    )
+
+
+@cache
+def assets_create_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_assets_create",
+        tags=["Trading"],
+        summary="Registrar nuevo activo",
+        description=(
+            "Registra un nuevo instrumento financiero en el catálogo de activos negociables.\n\n"
+            "**Reglas de negocio:**\n"
+            "- El `code` (símbolo de mercado) debe ser único. Se convierte a mayúsculas "
+            "  automáticamente: `btc` → `BTC`.\n"
+            "- El `code` identifica el activo en todo el sistema; elegirlo con cuidado ya "
+            "  que es el identificador de negocio (no el `id` interno).\n"
+            "- `name` es opcional y descriptivo (ej: `Bitcoin`, `Ethereum`). "
+            "  Si se omite queda en blanco.\n"
+            "- El activo se crea habilitado (`is_active: true`) de forma automática.\n\n"
+            "**Ejemplos de códigos válidos:** `BTC`, `ETH`, `USDT`, `ARS`, `USD`, `AL30`, `GD30`."
+        ),
+        request=AssetCreateSerializer,
+        responses={
+            201: OpenApiResponse(
+                response=AssetSerializer,
+                description="Activo creado exitosamente.",
+                examples=[_asset_active_example()],
+            ),
+            400: _400_validation(),
+            401: _401(),
+        },
+    )
+
+
+@cache
+def assets_retrieve_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_assets_retrieve",
+        tags=["Trading"],
+        summary="Obtener detalle de un activo",
+        description=(
+            "Retorna la representación completa de un activo identificado por su `id` interno.\n\n"
+            "El campo `is_active` indica si el activo está habilitado para generar nuevas "
+            "operaciones. Un activo inactivo (`is_active: false`) mantiene su historial "
+            "de operaciones pero no acepta nuevas.\n\n"
+            "**Tip:** para buscar un activo por símbolo de mercado en vez de por ID, "
+            "combiná el listado con filtrado del lado cliente usando el campo `code`."
+        ),
+        responses={
+            200: OpenApiResponse(
+                response=AssetSerializer,
+                description="Detalle del activo.",
+                examples=[_asset_active_example(), _asset_inactive_example()],
+            ),
+            401: _401(),
+            404: _404_asset(),
+        },
+    )
+
+
+@cache
+def assets_status_schema() -> dict[str, Any]:
+    return dict(
+        tags=["Trading"],
+        summary="Desactivar / reactivar activo",
+        description=(
+            "Cambia la disponibilidad del activo según la ruta (`/deactivate/` o `/reactivate/`):\n\n"
+            "- `deactivate` — suspende el activo del catálogo, impidiendo que sea usado en "
+            "  nuevas operaciones. El historial que lo referencia se mantiene intacto.\n"
+            "- `reactivate` — lo habilita nuevamente para nuevas operaciones.\n\n"
+            "**Comportamiento:**\n"
+            "- Si el activo ya está en el estado destino, la operación es **idempotente** "
+            "  (retorna `200` con el estado actual sin generar error).\n"
+            "- No requiere cuerpo en el request.\n\n"
+            "**Casos de uso típicos:** suspensión regulatoria o deslistado de un instrumento; "
+            "reincorporación tras el levantamiento de la suspensión o relistado."
+        ),
+        request=None,
+        responses={
+            200: OpenApiResponse(
+                response=AssetSerializer,
+                description=(
+                    "Activo con el estado resultante: `is_active: false` tras `deactivate`, "
+                    "`is_active: true` tras `reactivate`."
+                ),
+                examples=[_asset_inactive_example(), _asset_active_example()],
+            ),
+            401: _401(),
+            404: _404_asset(),
+        },
+    )
+
+
+@cache
+def assets_bulk_create_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_assets_bulk_create",
+        tags=["Trading"],
+        summary="Registrar activos en lote",
+        description=(
+            f"Registra de 1 a {BULK_BATCH_SIZE} activos en una sola operación, con las "
+            "mismas reglas que el alta individual.\n\n"
+            "Es **todo o nada**: si algún elemento es inválido, algún `code` se repite en "
+            "el lote o ya existe, no se crea ningún activo. Los errores siguen el mismo "
+            "formato que `POST /clients/bulk/`."
+        ),
+        request=AssetCreateSerializer(many=True),
+        responses={
+            201: OpenApiResponse(
+                response=AssetSerializer(many=True),
+                description="Activos creados, en el mismo orden del request.",
+            ),
+            400: _400_validation(),
+            401: _401(),
+        },
+    )
+
+
+# ---------------------------------------------------------------------------
+# FiatCurrency views
+# ---------------------------------------------------------------------------
+
+
+@cache
+def fiat_list_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_fiat_list",
+        tags=["Trading"],
+        summary="Listar monedas fiat",
+        description=(
+            "Retorna la lista de monedas fiat de liquidación registradas.\n\n"
+            "Pasando `?active=true` se retornan sólo las activas."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="active",
+                type=str,
+                enum=["true"],
+                required=False,
+                description="Filtra sólo monedas fiat activas.",
+            )
+        ],
+        responses={
+            200: OpenApiResponse(
+                response=FiatCurrencySerializer(many=True),
+                description="Lista de monedas fiat.",
+                examples=[
+                    OpenApiExample(
+                        name="Lista completa",
+                        value=[
+                            {"id": 1, "code": "ARS", "name": "Peso Argentino", "is_active": True},
+                            {"id": 2, "code": "USD", "name": "Dólar Estadounidense", "is_active": True},
+                        ],
+                        response_only=True,
+                    )
+                ],
+            ),
+            401: _401(),
+        },
+    )
+
+
+@cache
+def fiat_create_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_fiat_create",
+        tags=["Trading"],
+        summary="Registrar moneda fiat",
+        description=(
+            "Registra una nueva moneda fiat de liquidación.\n\n"
+            "El `code` (ISO 4217) debe ser único. Se convierte a mayúsculas automáticamente."
+        ),
+        request=FiatCurrencyCreateSerializer,
+        responses={
+            201: OpenApiResponse(
+                response=FiatCurrencySerializer,
+                description="Moneda fiat creada.",
+                examples=[_fiat_ars_example()],
+            ),
+            400: _400_validation(),
+            401: _401(),
+        },
+    )
+
+
+@cache
+def fiat_retrieve_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_fiat_retrieve",
+        tags=["Trading"],
+        summary="Obtener detalle de moneda fiat",
+        responses={
+            200: OpenApiResponse(response=FiatCurrencySerializer, examples=[_fiat_ars_example(), _fiat_usd_example()]),
+            401: _401(),
+            404: _404_fiat(),
+        },
+    )
+
+
+@cache
+def fiat_deactivate_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_fiat_deactivate",
+        tags=["Trading"],
+        summary="Desactivar moneda fiat",
+        description="Suspende una moneda fiat. Idempotente si ya está inactiva.",
+        request=None,
+        responses={
+            200: OpenApiResponse(response=FiatCurrencySerializer, description="Moneda fiat desactivada."),
+            401: _401(),
+            404: _404_fiat(),
+        },
+    )
+
+
+@cache
+def fiat_reactivate_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_fiat_reactivate",
+        tags=["Trading"],
+        summary="Reactivar moneda fiat",
+        description="Habilita nuevamente una moneda fiat. Idempotente si ya está activa.",
+        request=None,
+        responses={
+            200: OpenApiResponse(response=FiatCurrencySerializer, description="Moneda fiat reactivada."),
+            401: _401(),
+            404: _404_fiat(),
+        },
+    )
+
+
+# ---------------------------------------------------------------------------
+# Order views
+# ---------------------------------------------------------------------------
+
+
+@cache
+def orders_list_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_orders_list",
+        tags=["Trading"],
+        summary="Listar órdenes",
+        description=(
+            "Retorna todas las órdenes registradas, ordenadas por fecha descendente.\n\n"
+            "Una **Orden** representa una intención de compra/venta a precio límite "
+            "antes de ser ejecutada. Una orden puede derivar en cero, una o múltiples "
+            "Transacciones (ejecución parcial)."
+        ),
+        responses={
+            200: OpenApiResponse(
+                response=OrderSerializer(many=True),
+                description="Lista de órdenes.",
+            ),
+            401: _401(),
+        },
+    )
+
+
+@cache
+def orders_create_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_orders_create",
+        tags=["Trading"],
+        summary="Crear orden",
+        description=(
+            "Crea una nueva orden de compra/venta a precio límite.\n\n"
+            "**Validaciones:**\n"
+            "- El cliente debe estar en estado `ACTIVE`.\n"
+            "- El activo debe estar activo (`is_active=true`).\n"
+            "- La moneda fiat debe estar activa.\n"
+            "- `limit_price` y `quantity` deben ser mayores a cero."
+        ),
+        request=OrderCreateSerializer,
+        responses={
+            201: OpenApiResponse(
+                response=OrderSerializer,
+                description="Orden creada con estado `PENDING`.",
+                examples=[_order_example()],
+            ),
+            400: _400_validation(),
+            401: _401(),
+        },
+    )
+
+
+@cache
+def orders_retrieve_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_orders_retrieve",
+        tags=["Trading"],
+        summary="Obtener detalle de una orden",
+        responses={
+            200: OpenApiResponse(response=OrderSerializer, examples=[_order_example()]),
+            401: _401(),
+            404: _404_order(),
+        },
+    )
+
+
+@cache
+def orders_cancel_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_orders_cancel",
+        tags=["Trading"],
+        summary="Cancelar orden",
+        description=(
+            "Cancela una orden en estado `PENDING` o `PARTIAL`.\n\n"
+            "No se puede cancelar una orden `FILLED` o ya `CANCELLED`."
+        ),
+        request=None,
+        responses={
+            200: OpenApiResponse(
+                response=OrderSerializer,
+                description="Orden cancelada. El campo `status` será `CANCELLED`.",
+            ),
+            400: OpenApiResponse(
+                response=inline_serializer(
+                    name="OrderCancelError",
+                    fields={"status": s.ListField(child=s.CharField())},
+                ),
+                description="La orden no puede cancelarse en su estado actual.",
+            ),
+            401: _401(),
+            404: _404_order(),
+        },
+    )
+
+
+# ---------------------------------------------------------------------------
+# Transaction views
+# ---------------------------------------------------------------------------
+
+
+@cache
+def transactions_list_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_transactions_list",
+        tags=["Trading"],
+        summary="Listar transacciones",
+        description=(
+            "Retorna todas las transacciones registradas, ordenadas por fecha descendente.\n\n"
+            "Una **Transacción** es un hecho contable ejecutado e **inmutable**. "
+            "Representa la liquidación real de una operación financiera. "
+            "El campo `total` (precio unitario × cantidad) se calcula en tiempo real "
+            "y no está almacenado en la base de datos."
+        ),
+        responses={
+            200: OpenApiResponse(
+                response=TransactionSerializer(many=True),
+                description="Lista de transacciones.",
+            ),
+            401: _401(),
+        },
+    )
+
+
+@cache
+def transactions_create_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_transactions_create",
+        tags=["Trading"],
+        summary="Registrar transacción",
+        description=(
+            "Registra una nueva transacción contable ejecutada.\n\n"
+            "**Inmutabilidad:** una vez creada, la transacción no puede modificarse ni eliminarse. "
+            "Para revertir una operación, crear una nueva transacción de signo contrario.\n\n"
+            "**Validaciones:**\n"
+            "- El cliente debe estar en estado `ACTIVE`.\n"
+            "- `unit_price` y `quantity` deben ser mayores a cero.\n"
+            "- `order_id` es opcional (transacciones OTC o directas sin orden previa)."
+        ),
+        request=TransactionCreateSerializer,
+        responses={
+            201: OpenApiResponse(
+                response=TransactionSerializer,
+                description="Transacción registrada con estado `CONFIRMED`.",
+                examples=[_tx_example()],
+            ),
+            400: _400_validation(),
+            401: _401(),
+        },
+    )
+
+
+@cache
+def transactions_retrieve_schema() -> dict[str, Any]:
+    return dict(
+        operation_id="brokerage_transactions_retrieve",
+        tags=["Trading"],
+        summary="Obtener detalle de una transacción",
+        responses={
+            200: OpenApiResponse(response=TransactionSerializer, examples=[_tx_example()]),
+            401: _401(),
+            404: _404_tx(),
+        },
+    )
@@ -4,13 +4,26 @@ trading.selectors
 Consultas de lectura del módulo trading.
 
 Sin lógica de negocio — solo queries optimizadas y reutilizables.
+
+Las variantes batch (`get_clients_by_ids`, `get_assets_by_codes`) son la API
+preferida cuando el caller itera sobre varios identificadores: resuelven
+todo en una sola query en lugar de N llamadas a `get_*_by_id`.
+
+Los `get_*_by_id` de Client/Asset cargan la fila completa porque los
+endpoints de detalle serializan casi todas sus columnas. Los `get_*_for_operation`
+acotan con `only()` a lo que consumen las altas de órdenes y transacciones;
+acceder a otra columna dispara una query extra por instancia.
 """
 
 from __future__ import annotations
 
-from django.db.models import QuerySet
+from collections.abc import Iterable
+from datetime import datetime
+from functools import lru_cache
 
-from .models import Asset, Client, ClientStatus, FiatCurrency, Order, Transaction
+from django.db.models import BooleanField, Case, Count, Max, QuerySet, Value, When
+
+from .models import Asset, Client, ClientStatus, FiatCurrency, Order, Transaction, normalize_cuit
 
 
 # ---------------------------------------------------------------------------
@@ -23,14 +36,60 @@ def get_client_list() -> QuerySet[Client]:
     return Client.objects.all()
 
 
+def get_client_list_values() -> QuerySet[Client, dict]:
+    """
+    Todos los clientes como dicts listos para serializar, ordenados por nombre.
+
+    No instancia modelos: `is_active` (property en el modelo) se calcula en
+    la query a partir de `status`.
+    """
+    return Client.objects.annotate(
+        is_active=Case(
+            When(status=ClientStatus.ACTIVE, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+    ).values("id", "cuit", "name", "email", "status", "is_active", "created_at")
+
+
+def get_client_list_version() -> tuple[int, datetime | None]:
+    """
+    Versión del listado de clientes: (cantidad, último `updated_at`).
+
+    Cambia ante cualquier alta, modificación o baja; los listados la usan
+    como ETag para responder 304 sin releer las filas.
+    """
+    agg = Client.objects.aggregate(n=Count("id"), last=Max("updated_at"))
+    return agg["n"], agg["last"]
+
+
 def get_client_by_id(client_id: int) -> Client:
     """Lanza Client.DoesNotExist si no existe."""
     return Client.objects.get(pk=client_id)
 
 
+def get_client_for_operation(client_id: int) -> Client:
+    """
+    Cliente contraparte de una orden/transacción, con solo las columnas que
+    usa ese flujo (estado para validar, CUIT para la respuesta).
+
+    Lanza Client.DoesNotExist si no existe.
+    """
+    return Client.objects.only("pk", "cuit", "status").get(pk=client_id)
+
+
 def get_client_by_cuit(cuit: str) -> Client:
-    """Lanza Client.DoesNotExist si no existe."""
-    return Client.objects.get(cuit=cuit.strip())
+    """Acepta el CUIT con o sin guiones. Lanza Client.DoesNotExist si no existe."""
+    return Client.objects.get(cuit=normalize_cuit(cuit))
+
+
+def get_clients_by_ids(client_ids: Iterable[int]) -> dict[int, Client]:
+    """
+    Resuelve varios clientes en una sola query, indexados por PK.
+
+    Los IDs inexistentes simplemente no aparecen en el dict resultante.
+    """
+    return {c.pk: c for c in Client.objects.filter(pk__in=set(client_ids))}
 
 
 def get_active_clients() -> QuerySet[Client]:
@@ -51,16 +110,72 @@ def get_asset_list() -> QuerySet[Asset]:
     return Asset.objects.all()
 
 
+def get_asset_list_values(*, only_active: bool = False) -> QuerySet[Asset, dict]:
+    """
+    Activos como dicts listos para serializar, ordenados por código.
+
+    Con `only_active=True` equivale a `get_active_assets()`.
+    """
+    qs = Asset.objects.filter(is_active=True) if only_active else Asset.objects.all()
+    return qs.values("id", "code", "name", "is_active")
+
+
+def get_asset_list_version() -> tuple[int, datetime | None]:
+    """Versión del listado de activos; ver `get_client_list_version`."""
+    agg = Asset.objects.aggregate(n=Count("id"), last=Max("updated_at"))
+    return agg["n"], agg["last"]
+
+
+@lru_cache(maxsize=4)
+def _asset_rows(only_active: bool, version: tuple[int, datetime | None]) -> tuple[dict, ...]:
+    return tuple(get_asset_list_values(only_active=only_active))
+
+
+def get_asset_rows(
+    *, only_active: bool, version: tuple[int, datetime | None]
+) -> tuple[dict, ...]:
+    """
+    Filas de `get_asset_list_values`, cacheadas en memoria por *version*.
+
+    *version* debe venir de `get_asset_list_version()`: como se lee de la
+    DB, cualquier alta/modificación desde cualquier proceso cambia la clave
+    y la siguiente llamada relee las filas. Las filas devueltas se
+    comparten entre requests; no mutarlas.
+    """
+    return _asset_rows(only_active, version)
+
+
 def get_asset_by_id(asset_id: int) -> Asset:
     """Lanza Asset.DoesNotExist si no existe."""
     return Asset.objects.get(pk=asset_id)
 
 
+def get_asset_for_operation(asset_id: int) -> Asset:
+    """
+    Activo de una orden/transacción, con solo las columnas que usa ese flujo
+    (`is_active` para validar, `code` para la respuesta).
+
+    Lanza Asset.DoesNotExist si no existe.
+    """
+    return Asset.objects.only("pk", "code", "is_active").get(pk=asset_id)
+
+
 def get_asset_by_code(code: str) -> Asset:
     """Lanza Asset.DoesNotExist si no existe."""
     return Asset.objects.get(code=code.strip().upper())
 
 
+def get_assets_by_codes(codes: Iterable[str]) -> dict[str, Asset]:
+    """
+    Resuelve varios activos en una sola query, indexados por código.
+
+    Los códigos se normalizan igual que en `get_asset_by_code` (strip + upper);
+    los inexistentes no aparecen en el dict resultante.
+    """
+    normalized = {code.strip().upper() for code in codes}
+    return {a.code: a for a in Asset.objects.filter(code__in=normalized)}
+
+
 def get_active_assets() -> QuerySet[Asset]:
     return Asset.objects.filter(is_active=True)
 
@@ -0,0 +1,136 @@
+"""
+trading.serializers
+===================
+Serializers del módulo trading.
+
+Los de Client/Asset y los de salida (`*Serializer`) solo describen el
+esquema para drf-spectacular; la entrada de Client/Asset se valida con las
+funciones `validate_*` de views.py. Los `*CreateSerializer` de FiatCurrency,
+Order y Transaction sí validan la entrada en runtime.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from rest_framework import serializers as s
+
+from .models import ClientStatus, TransactionType
+
+# `TextChoices.choices` arma una lista nueva en cada acceso; se fija una vez.
+_STATUS_CHOICES = tuple(ClientStatus.choices)
+_TRANSACTION_TYPE_CHOICES = tuple(TransactionType.choices)
+
+
+class ClientSerializer(s.Serializer):
+    id = s.IntegerField(read_only=True)
+    cuit = s.CharField()
+    name = s.CharField()
+    email = s.EmailField(allow_blank=True)
+    status = s.ChoiceField(choices=_STATUS_CHOICES)
+    is_active = s.BooleanField(read_only=True)
+    created_at = s.DateTimeField(read_only=True)
+
+
+class ClientCreateSerializer(s.Serializer):
+    cuit = s.CharField(max_length=13)
+    name = s.CharField(max_length=200)
+    email = s.EmailField(required=False, allow_blank=True, default="")
+
+
+class ClientUpdateSerializer(s.Serializer):
+    name = s.CharField(max_length=200, required=False)
+    email = s.EmailField(required=False, allow_blank=True)
+
+
+class AssetSerializer(s.Serializer):
+    id = s.IntegerField(read_only=True)
+    code = s.CharField()
+    name = s.CharField()
+    is_active = s.BooleanField()
+
+
+class AssetCreateSerializer(s.Serializer):
+    code = s.CharField(max_length=20)
+    name = s.CharField(max_length=100, required=False, allow_blank=True, default="")
+
+
+class FiatCurrencySerializer(s.Serializer):
+    id = s.IntegerField(read_only=True)
+    code = s.CharField()
+    name = s.CharField()
+    is_active = s.BooleanField()
+
+
+class FiatCurrencyCreateSerializer(s.Serializer):
+    code = s.CharField(max_length=10)
+    name = s.CharField(max_length=50, required=False, allow_blank=True, default="")
+
+
+class OrderSerializer(s.Serializer):
+    id = s.IntegerField(read_only=True)
+    client_id = s.IntegerField(source="client.pk", read_only=True)
+    client_cuit = s.CharField(source="client.cuit", read_only=True)
+    asset_code = s.CharField(source="asset.code", read_only=True)
+    fiat_currency_code = s.CharField(source="fiat_currency.code", read_only=True)
+    transaction_type = s.CharField()
+    limit_price = s.DecimalField(max_digits=20, decimal_places=8)
+    quantity = s.DecimalField(max_digits=20, decimal_places=8)
+    notional = s.DecimalField(max_digits=30, decimal_places=8, read_only=True)
+    status = s.CharField()
+    created_at = s.DateTimeField(read_only=True)
+    updated_at = s.DateTimeField(read_only=True)
+
+
+class OrderCreateSerializer(s.Serializer):
+    client_id = s.IntegerField()
+    asset_id = s.IntegerField()
+    fiat_currency_id = s.IntegerField()
+    transaction_type = s.ChoiceField(choices=_TRANSACTION_TYPE_CHOICES)
+    limit_price = s.DecimalField(
+        max_digits=20,
+        decimal_places=8,
+        min_value=Decimal("0.00000001"),
+    )
+    quantity = s.DecimalField(
+        max_digits=20,
+        decimal_places=8,
+        min_value=Decimal("0.00000001"),
+    )
+
+
+class TransactionSerializer(s.Serializer):
+    id = s.IntegerField(read_only=True)
+    client_id = s.IntegerField(source="client.pk", read_only=True)
+    client_cuit = s.CharField(source="client.cuit", read_only=True)
+    order_id = s.IntegerField(source="order.pk", allow_null=True, read_only=True)
+    asset_code = s.CharField(source="asset.code", read_only=True)
+    fiat_currency_code = s.CharField(source="fiat_currency.code", read_only=True)
+    transaction_type = s.CharField()
+    unit_price = s.DecimalField(max_digits=20, decimal_places=8)
+    quantity = s.DecimalField(max_digits=20, decimal_places=8)
+    total = s.DecimalField(max_digits=30, decimal_places=8, read_only=True)
+    status = s.CharField()
+    blockchain_hash = s.CharField(allow_null=True, allow_blank=True)
+    created_at = s.DateTimeField(read_only=True)
+
+
+class TransactionCreateSerializer(s.Serializer):
+    client_id = s.IntegerField()
+    asset_id = s.IntegerField()
+    fiat_currency_id = s.IntegerField()
+    transaction_type = s.ChoiceField(choices=_TRANSACTION_TYPE_CHOICES)
+    unit_price = s.DecimalField(
+        max_digits=20,
+        decimal_places=8,
+        min_value=Decimal("0.00000001"),
+    )
+    quantity = s.DecimalField(
+        max_digits=20,
+        decimal_places=8,
+        min_value=Decimal("0.00000001"),
+    )
+    order_id = s.IntegerField(required=False, allow_null=True, default=None)
+    blockchain_hash = s.CharField(
+        max_length=255, required=False, allow_blank=True, allow_null=True, default=None
+    )
@@ -5,19 +5,27 @@ Operaciones de escritura del módulo trading.
 
 Convenciones del proyecto:
   - Funciones keyword-only (*, param).
-  - Transacciones atómicas en toda mutación.
+  - Transacciones atómicas en mutaciones de más de una sentencia.
+    Los toggles de estado (block/unblock, deactivate/reactivate) emiten un
+    único UPDATE, atómico por sí mismo, y no abren bloque atomic.
+    Los de Client y Asset reciben el id y devuelven la fila con
+    UPDATE ... RETURNING: un solo round-trip, sin SELECT previo.
   - ValidationError de Django para errores de negocio.
   - Sin side-effects hacia otros módulos en esta etapa.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
 from decimal import Decimal
+from typing import Any
 
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import IntegrityError, connections, models, router, transaction
+from django.utils import timezone
 
 from .models import (
+    CUIT_LENGTH,
     Asset,
     Client,
     ClientStatus,
@@ -27,9 +35,58 @@ from .models import (
     Transaction,
     TransactionStatus,
     TransactionType,
+    normalize_cuit,
 )
 
 
+# Tamaño de lote de los INSERT en las altas masivas.
+BULK_BATCH_SIZE = 1000
+
+# Motores con UPDATE ... RETURNING (SQLite >= 3.35 en el caso de sqlite).
+_UPDATE_RETURNING_VENDORS = frozenset({"postgresql", "sqlite"})
+
+
+def _update_returning[M: models.Model](model: type[M], pk: int, **values: Any) -> M:
+    """
+    Asigna *values* a la fila *pk* y la devuelve como instancia de *model*.
+
+    En PostgreSQL/SQLite es un único ``UPDATE ... RETURNING *``; en otros
+    motores se degrada a UPDATE + SELECT. Lanza ``model.DoesNotExist`` si la
+    fila no existe. Los campos ``auto_now`` se actualizan igual que en save().
+
+    No pasa por ``Model.save()``: no se emiten pre_save/post_save. Solo se usa
+    para los toggles de estado, que no tienen receivers y cuyo único efecto
+    derivado (el ETag de los listados) depende de ``updated_at``.
+    """
+    meta = model._meta
+    now = timezone.now()
+    for field in meta.concrete_fields:
+        if getattr(field, "auto_now", False):
+            values.setdefault(field.name, now)
+
+    manager = model._default_manager.db_manager(router.db_for_write(model))
+    connection = connections[manager.db]
+    if connection.vendor not in _UPDATE_RETURNING_VENDORS:
+        if not manager.filter(pk=pk).update(**values):
+            raise model.DoesNotExist(f"{model.__name__} {pk} no existe.")
+        return manager.get(pk=pk)
+
+    qn = connection.ops.quote_name
+    columns, params = [], []
+    for name, value in values.items():
+        field = meta.get_field(name)
+        columns.append(f"{qn(field.column)} = %s")
+        params.append(field.get_db_prep_save(value, connection))
+    sql = (
+        f"UPDATE {qn(meta.db_table)} SET {', '.join(columns)} "
+        f"WHERE {qn(meta.pk.column)} = %s RETURNING *"
+    )
+    rows = list(manager.raw(sql, [*params, pk]))
+    if not rows:
+        raise model.DoesNotExist(f"{model.__name__} {pk} no existe.")
+    return rows[0]
+
+
 # ---------------------------------------------------------------------------
 # Client
 # ---------------------------------------------------------------------------
@@ -40,15 +97,19 @@ def create_client(*, cuit: str, name: str, email: str = "") -> Client:
     """
     Registra un nuevo cliente operacional.
 
+    El CUIT se normaliza a su forma canónica (solo dígitos) antes de validar
+    y persistir, de modo que "20-12345678-9" y "20123456789" colisionan.
     Valida que el CUIT no esté ya registrado antes de insertar.
     El estado inicial es siempre ACTIVE.
     """
-    cuit = cuit.strip()
+    cuit = normalize_cuit(cuit)
     name = name.strip()
     email = email.strip()
 
     if not cuit:
         raise ValidationError({"cuit": "El CUIT es obligatorio."})
+    if len(cuit) != CUIT_LENGTH:
+        raise ValidationError({"cuit": f"El CUIT debe tener {CUIT_LENGTH} dígitos."})
     if not name:
         raise ValidationError({"name": "El nombre es obligatorio."})
     if Client.objects.filter(cuit=cuit).exists():
@@ -57,6 +118,57 @@ def create_client(*, cuit: str, name: str, email: str = "") -> Client:
     return Client.objects.create(cuit=cuit, name=name, email=email, status=ClientStatus.ACTIVE)
 
 
+def bulk_create_clients(*, clients: Iterable[Mapping[str, str]]) -> list[Client]:
+    """
+    Registra un lote de clientes (claves `cuit`, `name` y opcional `email`).
+
+    Aplica las mismas reglas que `create_client`, pero resuelve la unicidad
+    con una sola query para todo el lote y persiste con `bulk_create`.
+    Todo o nada: si algún CUIT es inválido, se repite dentro del lote o ya
+    existe, no se inserta ninguno y el error lista los CUIT afectados.
+    """
+    objs: list[Client] = []
+    invalid: list[str] = []
+    repeated: list[str] = []
+    seen: set[str] = set()
+    for item in clients:
+        cuit = normalize_cuit(item["cuit"])
+        name = item["name"].strip()
+        if not name:
+            raise ValidationError({"name": "El nombre es obligatorio."})
+        if len(cuit) != CUIT_LENGTH:
+            invalid.append(item["cuit"])
+        elif cuit in seen:
+            repeated.append(cuit)
+        seen.add(cuit)
+        objs.append(
+            Client(
+                cuit=cuit,
+                name=name,
+                email=item.get("email", "").strip(),
+                status=ClientStatus.ACTIVE,
+            )
+        )
+
+    errors: list[str] = []
+    if invalid:
+        errors.append(f"CUIT sin {CUIT_LENGTH} dígitos: {', '.join(invalid)}.")
+    if repeated:
+        errors.append(f"CUIT repetidos en el lote: {', '.join(repeated)}.")
+    existing = sorted(Client.objects.filter(cuit__in=seen).values_list("cuit", flat=True))
+    if existing:
+        errors.append(f"Ya existen clientes con CUIT: {', '.join(existing)}.")
+    if errors:
+        raise ValidationError({"cuit": errors})
+
+    try:
+        with transaction.atomic():
+            return Client.objects.bulk_create(objs, batch_size=BULK_BATCH_SIZE)
+    except IntegrityError:
+        # Otro alta concurrente registró alguno de los CUIT entre el chequeo y el INSERT.
+        raise ValidationError({"cuit": "Alguno de los CUIT del lote ya fue registrado."})
+
+
 @transaction.atomic
 def update_client(*, client: Client, name: str | None = None, email: str | None = None) -> Client:
     """
@@ -77,29 +189,29 @@ def update_client(*, client: Client, name: str | None = None, email: str | None
         fields.append("email")
 
     if fields:
-        client.save(update_fields=fields)
+        client.save(update_fields=[*fields, "updated_at"])
 
     return client
 
 
-@transaction.atomic
-def block_client(*, client: Client) -> Client:
-    """Bloquea un cliente activo. Idempotente si ya está bloqueado."""
-    if client.status == ClientStatus.BLOCKED:
-        return client
-    client.status = ClientStatus.BLOCKED
-    client.save(update_fields=["status"])
-    return client
+def block_client(*, client_id: int) -> Client:
+    """
+    Bloquea el cliente *client_id*. Idempotente si ya está bloqueado.
 
+    Lanza Client.DoesNotExist si no existe.
+    """
+    # UPDATE directo, sin save() ni señales: ver _update_returning.
+    return _update_returning(Client, client_id, status=ClientStatus.BLOCKED)
 
-@transaction.atomic
-def unblock_client(*, client: Client) -> Client:
-    """Reactiva un cliente bloqueado. Idempotente si ya está activo."""
-    if client.status == ClientStatus.ACTIVE:
-        return client
-    client.status = ClientStatus.ACTIVE
-    client.save(update_fields=["status"])
-    return client
+
+def unblock_client(*, client_id: int) -> Client:
+    """
+    Reactiva el cliente *client_id*. Idempotente si ya está activo.
+
+    Lanza Client.DoesNotExist si no existe.
+    """
+    # UPDATE directo, sin save() ni señales: ver _update_returning.
+    return _update_returning(Client, client_id, status=ClientStatus.ACTIVE)
 
 
 # ---------------------------------------------------------------------------
@@ -124,24 +236,59 @@ def create_asset(*, code: str, name: str = "") -> Asset:
     return Asset.objects.create(code=code, name=name.strip(), is_active=True)
 
 
-@transaction.atomic
-def deactivate_asset(*, asset: Asset) -> Asset:
-    """Desactiva un activo. No borra registros históricos."""
-    if not asset.is_active:
-        return asset
-    asset.is_active = False
-    asset.save(update_fields=["is_active"])
-    return asset
+def bulk_create_assets(*, assets: Iterable[Mapping[str, str]]) -> list[Asset]:
+    """
+    Registra un lote de activos (claves `code` y opcional `name`).
 
+    Mismas reglas que `create_asset`, con una sola query de unicidad y
+    `bulk_create`. Todo o nada, igual que `bulk_create_clients`.
+    """
+    objs: list[Asset] = []
+    repeated: list[str] = []
+    seen: set[str] = set()
+    for item in assets:
+        code = item["code"].strip().upper()
+        if not code:
+            raise ValidationError({"code": "El código del activo es obligatorio."})
+        if code in seen:
+            repeated.append(code)
+        seen.add(code)
+        objs.append(Asset(code=code, name=item.get("name", "").strip(), is_active=True))
+
+    errors: list[str] = []
+    if repeated:
+        errors.append(f"Códigos repetidos en el lote: {', '.join(repeated)}.")
+    existing = sorted(Asset.objects.filter(code__in=seen).values_list("code", flat=True))
+    if existing:
+        errors.append(f"Ya existen activos con código: {', '.join(existing)}.")
+    if errors:
+        raise ValidationError({"code": errors})
+
+    try:
+        with transaction.atomic():
+            return Asset.objects.bulk_create(objs, batch_size=BULK_BATCH_SIZE)
+    except IntegrityError:
+        raise ValidationError({"code": "Alguno de los códigos del lote ya fue registrado."})
+
+
+def deactivate_asset(*, asset_id: int) -> Asset:
+    """
+    Desactiva el activo *asset_id*. No borra registros históricos.
 
-@transaction.atomic
-def reactivate_asset(*, asset: Asset) -> Asset:
-    """Reactiva un activo previamente desactivado."""
-    if asset.is_active:
-        return asset
-    asset.is_active = True
-    asset.save(update_fields=["is_active"])
-    return asset
+    Lanza Asset.DoesNotExist si no existe.
+    """
+    # UPDATE directo, sin save() ni señales: ver _update_returning.
+    return _update_returning(Asset, asset_id, is_active=False)
+
+
+def reactivate_asset(*, asset_id: int) -> Asset:
+    """
+    Reactiva el activo *asset_id*. Idempotente si ya está activo.
+
+    Lanza Asset.DoesNotExist si no existe.
+    """
+    # UPDATE directo, sin save() ni señales: ver _update_returning.
+    return _update_returning(Asset, asset_id, is_active=True)
 
 
 # ---------------------------------------------------------------------------
@@ -165,24 +312,24 @@ def create_fiat_currency(*, code: str, name: str = "") -> FiatCurrency:
     return FiatCurrency.objects.create(code=code, name=name.strip(), is_active=True)
 
 
-@transaction.atomic
-def deactivate_fiat_currency(*, fiat_currency: FiatCurrency) -> FiatCurrency:
-    """Desactiva una moneda fiat. Idempotente."""
-    if not fiat_currency.is_active:
-        return fiat_currency
-    fiat_currency.is_active = False
-    fiat_currency.save(update_fields=["is_active"])
-    return fiat_currency
+def deactivate_fiat_currency(*, fiat_id: int) -> FiatCurrency:
+    """
+    Desactiva la moneda fiat *fiat_id*. Idempotente.
 
+    Lanza FiatCurrency.DoesNotExist si no existe.
+    """
+    # UPDATE directo, sin save() ni señales: ver _update_returning.
+    return _update_returning(FiatCurrency, fiat_id, is_active=False)
 
-@transaction.atomic
-def reactivate_fiat_currency(*, fiat_currency: FiatCurrency) -> FiatCurrency:
-    """Reactiva una moneda fiat previamente desactivada. Idempotente."""
-    if fiat_currency.is_active:
-        return fiat_currency
-    fiat_currency.is_active = True
-    fiat_currency.save(update_fields=["is_active"])
-    return fiat_currency
+
+def reactivate_fiat_currency(*, fiat_id: int) -> FiatCurrency:
+    """
+    Reactiva la moneda fiat *fiat_id*. Idempotente.
+
+    Lanza FiatCurrency.DoesNotExist si no existe.
+    """
+    # UPDATE directo, sin save() ni señales: ver _update_returning.
+    return _update_returning(FiatCurrency, fiat_id, is_active=True)
 
 
 # ---------------------------------------------------------------------------
@@ -4,15 +4,22 @@ API tests for trading asset endpoints.
 Endpoints covered:
   GET    /api/trading/assets/
   POST   /api/trading/assets/
+  POST   /api/trading/assets/bulk/
   GET    /api/trading/assets/<id>/
   POST   /api/trading/assets/<id>/deactivate/
   POST   /api/trading/assets/<id>/reactivate/
 """
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
+from django.core.cache import cache
+from django.urls import reverse
 from rest_framework import status
 
+from apps.trading import views
+
 BASE = "/api/trading/assets/"
 
 
@@ -42,6 +49,12 @@ class TestAssetList:
         assert len(data) == 1
         assert data[0]["code"] == "BTC"
 
+    def test_etag_depends_on_active_filter(self, auth_client, asset, inactive_asset):
+        etag = auth_client.get(BASE)["ETag"]
+        response = auth_client.get(f"{BASE}?active=true", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 1
+
     def test_response_fields(self, auth_client, asset):
         data = auth_client.get(BASE).json()[0]
         assert "id" in data
@@ -50,6 +63,62 @@ class TestAssetList:
         assert "is_active" in data
 
 
+class _DeferredExecutor:
+    """
+    Guarda los jobs para correrlos después en el thread del test, que ve la
+    DB en memoria (el handler async no puede usar el ORM sync).
+    """
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, fn):
+        self.jobs.append(fn)
+
+    def run_pending(self):
+        while self.jobs:
+            self.jobs.pop(0)()
+
+
+@pytest.mark.api
+@pytest.mark.django_db
+class TestAssetListClientPrefetch:
+    @pytest.fixture
+    def executor(self, settings):
+        settings.TRADING_PREFETCH_CLIENTS = True
+        cache.clear()
+        executor = _DeferredExecutor()
+        with patch.object(views, "_prefetch_executor", executor), \
+                patch.object(views, "close_old_connections"):
+            yield executor
+        cache.clear()
+
+    def test_200_prefetches_client_rows(self, auth_client, asset, client_obj, executor):
+        assert auth_client.get(BASE).status_code == status.HTTP_200_OK
+        assert len(executor.jobs) == 1
+        executor.run_pending()
+
+        etag = views._list_etag("clients", views.get_client_list_version())
+        rows = cache.get(views._client_rows_cache_key(etag))
+        assert [row["cuit"] for row in rows] == [client_obj.cuit]
+
+    def test_304_does_not_prefetch(self, auth_client, asset, executor):
+        etag = auth_client.get(BASE)["ETag"]
+        executor.run_pending()
+        response = auth_client.get(BASE, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert executor.jobs == []
+
+    def test_drops_submission_while_one_is_pending(self, auth_client, asset, executor):
+        auth_client.get(BASE)
+        auth_client.get(f"{BASE}?active=true")
+        assert len(executor.jobs) == 1
+        executor.run_pending()
+        auth_client.get(BASE)
+        assert len(executor.jobs) == 1
+        executor.run_pending()
+
+
 # ---------------------------------------------------------------------------
 # POST /api/trading/assets/
 # ---------------------------------------------------------------------------
@@ -73,6 +142,11 @@ class TestAssetCreate:
         response = auth_client.post(BASE, {"code": "DOGE"}, format="json")
         assert response.status_code == status.HTTP_201_CREATED
 
+    def test_code_too_long_returns_400(self, auth_client):
+        response = auth_client.post(BASE, {"code": "X" * 21}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "code" in response.json()
+
     def test_duplicate_code_returns_400(self, auth_client, asset):
         response = auth_client.post(BASE, {"code": "BTC"}, format="json")
         assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -86,6 +160,32 @@ class TestAssetCreate:
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
+# ---------------------------------------------------------------------------
+# POST /api/trading/assets/bulk/
+# ---------------------------------------------------------------------------
+
+@pytest.mark.api
+@pytest.mark.django_db
+class TestAssetBulkCreate:
+    URL = f"{BASE}bulk/"
+
+    def test_creates_all_assets(self, auth_client):
+        payload = [{"code": "eth", "name": "Ethereum"}, {"code": "SOL"}]
+        response = auth_client.post(self.URL, payload, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [a["code"] for a in response.json()] == ["ETH", "SOL"]
+
+    def test_repeated_code_in_batch_returns_400(self, auth_client):
+        payload = [{"code": "ETH"}, {"code": "eth"}]
+        response = auth_client.post(self.URL, payload, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "code" in response.json()
+
+    def test_existing_code_returns_400(self, auth_client, asset):
+        response = auth_client.post(self.URL, [{"code": asset.code}], format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 # ---------------------------------------------------------------------------
 # GET /api/trading/assets/<id>/
 # ---------------------------------------------------------------------------
@@ -98,6 +198,11 @@ class TestAssetDetail:
         assert response.status_code == status.HTTP_200_OK
         assert response.json()["code"] == "BTC"
 
+    def test_single_query_for_asset(self, auth_client, asset, django_assert_num_queries):
+        # Usuario del JWT + la fila del activo; ningún acceso lazy adicional.
+        with django_assert_num_queries(2):
+            auth_client.get(f"{BASE}{asset.pk}/")
+
     def test_inactive_asset_returned(self, auth_client, inactive_asset):
         response = auth_client.get(f"{BASE}{inactive_asset.pk}/")
         assert response.status_code == status.HTTP_200_OK
@@ -115,6 +220,10 @@ class TestAssetDetail:
 @pytest.mark.api
 @pytest.mark.django_db
 class TestAssetDeactivate:
+    def test_url_names(self, asset):
+        assert reverse("trading:asset-deactivate", args=[asset.pk]) == f"{BASE}{asset.pk}/deactivate/"
+        assert reverse("trading:asset-reactivate", args=[asset.pk]) == f"{BASE}{asset.pk}/reactivate/"
+
     def test_deactivate_active_asset(self, auth_client, asset):
         response = auth_client.post(f"{BASE}{asset.pk}/deactivate/")
         assert response.status_code == status.HTTP_200_OK
@@ -150,3 +259,7 @@ class TestAssetReactivate:
     def test_not_found_returns_404(self, auth_client):
         response = auth_client.post(f"{BASE}99999/reactivate/")
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_unknown_action_returns_404(self, auth_client, asset):
+        response = auth_client.post(f"{BASE}{asset.pk}/archive/")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -4,6 +4,7 @@ API tests for trading client endpoints.
 Endpoints covered:
   GET    /api/trading/clients/
   POST   /api/trading/clients/
+  POST   /api/trading/clients/bulk/
   GET    /api/trading/clients/<id>/
   PATCH  /api/trading/clients/<id>/
   POST   /api/trading/clients/<id>/block/
@@ -12,6 +13,7 @@ Endpoints covered:
 from __future__ import annotations
 
 import pytest
+from django.urls import reverse
 from rest_framework import status
 
 BASE = "/api/trading/clients/"
@@ -49,6 +51,35 @@ class TestClientList:
         assert "is_active" in data
         assert "created_at" in data
 
+    def test_returns_etag(self, auth_client, client_obj):
+        response = auth_client.get(BASE)
+        assert response["ETag"]
+        assert "private" in response["Cache-Control"]
+
+    def test_matching_etag_returns_304(self, auth_client, client_obj):
+        etag = auth_client.get(BASE)["ETag"]
+        response = auth_client.get(BASE, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+    def test_etag_changes_after_mutation(self, auth_client, client_obj):
+        etag = auth_client.get(BASE)["ETag"]
+        auth_client.post(f"{BASE}{client_obj.pk}/block/")
+        response = auth_client.get(BASE, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_view_is_async(self):
+        from apps.trading.views import ClientListCreateView
+
+        assert ClientListCreateView.view_is_async is True
+
+    def test_list_matches_detail_representation(self, auth_client, client_obj):
+        listed = auth_client.get(BASE)
+        detail = auth_client.get(f"{BASE}{client_obj.pk}/")
+        assert listed["Content-Type"] == "application/json"
+        assert listed.json()[0] == detail.json()
+
 
 # ---------------------------------------------------------------------------
 # POST /api/trading/clients/
@@ -66,7 +97,7 @@ class TestClientCreate:
         response = auth_client.post(BASE, payload, format="json")
         assert response.status_code == status.HTTP_201_CREATED
         data = response.json()
-        assert data["cuit"] == "20-11111111-1"
+        assert data["cuit"] == "20111111111"
         assert data["name"] == "Empresa SA"
         assert data["status"] == "ACTIVE"
         assert data["is_active"] is True
@@ -91,6 +122,80 @@ class TestClientCreate:
         response = auth_client.post(BASE, {"cuit": "20-33333333-3"}, format="json")
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_invalid_email_returns_400(self, auth_client):
+        payload = {"cuit": "20333333333", "name": "Mail roto", "email": "no-es-mail"}
+        response = auth_client.post(BASE, payload, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "email" in response.json()
+
+    def test_reports_all_invalid_fields(self, auth_client):
+        response = auth_client.post(BASE, {"name": "  "}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert set(response.json()) == {"cuit", "name"}
+
+    def test_non_object_body_returns_400(self, auth_client):
+        response = auth_client.post(BASE, ["20333333333"], format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "non_field_errors" in response.json()
+
+    def test_strips_name_whitespace(self, auth_client):
+        payload = {"cuit": "20333333333", "name": "  Espacios S.A.  "}
+        response = auth_client.post(BASE, payload, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["name"] == "Espacios S.A."
+
+
+# ---------------------------------------------------------------------------
+# POST /api/trading/clients/bulk/
+# ---------------------------------------------------------------------------
+
+@pytest.mark.api
+@pytest.mark.django_db
+class TestClientBulkCreate:
+    URL = f"{BASE}bulk/"
+
+    def test_unauthenticated_returns_401(self, api_client):
+        response = api_client.post(self.URL, [], format="json")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_creates_all_clients(self, auth_client):
+        payload = [
+            {"cuit": "20-11111111-1", "name": "Uno S.A."},
+            {"cuit": "20222222222", "name": "Dos S.A.", "email": "dos@mail.com"},
+        ]
+        response = auth_client.post(self.URL, payload, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert [c["cuit"] for c in data] == ["20111111111", "20222222222"]
+        assert all(c["id"] and c["status"] == "ACTIVE" for c in data)
+
+    def test_item_errors_are_aligned_with_input(self, auth_client):
+        payload = [{"cuit": "20111111111", "name": "Uno"}, {"cuit": "20222222222"}]
+        response = auth_client.post(self.URL, payload, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        errors = response.json()
+        assert errors[0] == {}
+        assert "name" in errors[1]
+
+    def test_existing_cuit_rejects_whole_batch(self, auth_client, client_obj):
+        payload = [
+            {"cuit": "20333333333", "name": "Nuevo"},
+            {"cuit": client_obj.cuit, "name": "Duplicado"},
+        ]
+        response = auth_client.post(self.URL, payload, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert client_obj.cuit in response.json()["cuit"][0]
+        assert len(auth_client.get(BASE).json()) == 1
+
+    def test_non_list_body_returns_400(self, auth_client):
+        response = auth_client.post(self.URL, {"cuit": "20111111111", "name": "Uno"}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "non_field_errors" in response.json()
+
+    def test_empty_list_returns_400(self, auth_client):
+        response = auth_client.post(self.URL, [], format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
 
 # ---------------------------------------------------------------------------
 # GET /api/trading/clients/<id>/
@@ -104,6 +209,11 @@ class TestClientDetail:
         assert response.status_code == status.HTTP_200_OK
         assert response.json()["cuit"] == client_obj.cuit
 
+    def test_single_query_for_client(self, auth_client, client_obj, django_assert_num_queries):
+        # Usuario del JWT + la fila del cliente; ningún acceso lazy adicional.
+        with django_assert_num_queries(2):
+            auth_client.get(f"{BASE}{client_obj.pk}/")
+
     def test_not_found_returns_404(self, auth_client):
         response = auth_client.get(f"{BASE}99999/")
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -156,6 +266,10 @@ class TestClientUpdate:
 @pytest.mark.api
 @pytest.mark.django_db
 class TestClientBlock:
+    def test_url_names(self, client_obj):
+        assert reverse("trading:client-block", args=[client_obj.pk]) == f"{BASE}{client_obj.pk}/block/"
+        assert reverse("trading:client-unblock", args=[client_obj.pk]) == f"{BASE}{client_obj.pk}/unblock/"
+
     def test_block_active_client(self, auth_client, client_obj):
         response = auth_client.post(f"{BASE}{client_obj.pk}/block/")
         assert response.status_code == status.HTTP_200_OK
@@ -199,3 +313,9 @@ class TestClientUnblock:
     def test_unblock_not_found_returns_404(self, auth_client):
         response = auth_client.post(f"{BASE}99999/unblock/")
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_unknown_action_returns_404(self, auth_client, client_obj):
+        response = auth_client.post(f"{BASE}{client_obj.pk}/archive/")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        client_obj.refresh_from_db()
+        assert client_obj.status == "ACTIVE"
@@ -65,7 +65,7 @@ def auth_client(user):
 @pytest.fixture
 def client_obj(db):
     return Client.objects.create(
-        cuit="20-12345678-9",
+        cuit="20123456789",
         name="Empresa Test S.A.",
         email="test@empresa.com",
         status=ClientStatus.ACTIVE,
@@ -75,7 +75,7 @@ def client_obj(db):
 @pytest.fixture
 def blocked_client(db):
     return Client.objects.create(
-        cuit="30-99999999-9",
+        cuit="30999999999",
         name="Empresa Bloqueada S.R.L.",
         status=ClientStatus.BLOCKED,
     )
@@ -0,0 +1,45 @@
+"""
+Unit tests for trading data migrations.
+
+Covers:
+- 0002 CUIT backfill: normalization, collision detection, invalid-length report
+"""
+from __future__ import annotations
+
+import logging
+from importlib import import_module
+
+import pytest
+from django.apps import apps
+
+from apps.trading.models import Client
+
+normalize_existing_cuits = import_module(
+    "apps.trading.migrations.0002_normalize_client_cuit"
+).normalize_existing_cuits
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestNormalizeExistingCuits:
+    def test_rewrites_to_digits_only(self):
+        client = Client.objects.create(cuit="20-12345678-9", name="Con guiones")
+        normalize_existing_cuits(apps, None)
+        client.refresh_from_db()
+        assert client.cuit == "20123456789"
+
+    def test_collision_aborts_listing_pks(self):
+        a = Client.objects.create(cuit="20-12345678-9", name="A")
+        b = Client.objects.create(cuit="20123456789", name="B")
+        with pytest.raises(RuntimeError, match=rf"20123456789: pks \[{a.pk}, {b.pk}\]"):
+            normalize_existing_cuits(apps, None)
+        a.refresh_from_db()
+        assert a.cuit == "20-12345678-9"
+
+    def test_logs_invalid_length(self, caplog):
+        client = Client.objects.create(cuit="20-1234-9", name="Corto")
+        with caplog.at_level(logging.WARNING):
+            normalize_existing_cuits(apps, None)
+        client.refresh_from_db()
+        assert client.cuit == "2012349"
+        assert f"[{client.pk}]" in caplog.text
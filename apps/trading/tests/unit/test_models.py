@@ -41,7 +41,7 @@ class TestClientModel:
 
     def test_str_representation(self, client_obj):
         assert "Empresa Test S.A." in str(client_obj)
-        assert "20-12345678-9" in str(client_obj)
+        assert "20123456789" in str(client_obj)
 
 
 # ---------------------------------------------------------------------------
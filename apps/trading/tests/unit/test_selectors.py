@@ -22,11 +22,19 @@ from apps.trading.selectors import (
     get_active_fiat_currencies,
     get_asset_by_code,
     get_asset_by_id,
+    get_asset_for_operation,
     get_asset_list,
+    get_asset_list_values,
+    get_asset_list_version,
+    get_asset_rows,
+    get_assets_by_codes,
     get_blocked_clients,
     get_client_by_cuit,
     get_client_by_id,
+    get_client_for_operation,
     get_client_list,
+    get_client_list_values,
+    get_clients_by_ids,
     get_fiat_currency_by_code,
     get_fiat_currency_by_id,
     get_fiat_currency_list,
@@ -53,6 +61,12 @@ class TestClientSelectors:
         result = list(get_client_list())
         assert len(result) == 2
 
+    def test_get_client_list_values_computes_is_active(self, client_obj, blocked_client):
+        rows = {r["id"]: r for r in get_client_list_values()}
+        assert rows[client_obj.pk]["is_active"] is True
+        assert rows[blocked_client.pk]["is_active"] is False
+        assert rows[client_obj.pk]["cuit"] == client_obj.cuit
+
     def test_get_client_by_id_found(self, client_obj):
         result = get_client_by_id(client_obj.pk)
         assert result.pk == client_obj.pk
@@ -61,6 +75,13 @@ class TestClientSelectors:
         with pytest.raises(Client.DoesNotExist):
             get_client_by_id(99999)
 
+    def test_get_client_for_operation_loads_only_needed_fields(self, client_obj, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            c = get_client_for_operation(client_obj.pk)
+            assert c.is_active is True
+            assert c.cuit == client_obj.cuit
+        assert {"name", "email", "created_at"} <= c.get_deferred_fields()
+
     def test_get_client_by_cuit(self, client_obj):
         result = get_client_by_cuit(client_obj.cuit)
         assert result.pk == client_obj.pk
@@ -69,10 +90,23 @@ class TestClientSelectors:
         result = get_client_by_cuit(f"  {client_obj.cuit}  ")
         assert result.pk == client_obj.pk
 
+    def test_get_client_by_cuit_accepts_dashed_format(self, client_obj):
+        result = get_client_by_cuit("20-12345678-9")
+        assert result.pk == client_obj.pk
+
     def test_get_client_by_cuit_not_found(self):
         with pytest.raises(Client.DoesNotExist):
             get_client_by_cuit("99-99999999-9")
 
+    def test_get_clients_by_ids_single_query(self, client_obj, blocked_client, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            result = get_clients_by_ids([client_obj.pk, blocked_client.pk, 99999])
+        assert set(result) == {client_obj.pk, blocked_client.pk}
+        assert result[client_obj.pk].cuit == client_obj.cuit
+
+    def test_get_clients_by_ids_empty(self, db):
+        assert get_clients_by_ids([]) == {}
+
     def test_get_active_clients(self, client_obj, blocked_client):
         result = list(get_active_clients())
         pks = [c.pk for c in result]
@@ -103,6 +137,25 @@ class TestAssetSelectors:
         assert asset.pk in pks
         assert inactive_asset.pk not in pks
 
+    def test_get_asset_list_values(self, asset, inactive_asset):
+        assert len(get_asset_list_values()) == 2
+        active = list(get_asset_list_values(only_active=True))
+        assert active == [{"id": asset.pk, "code": asset.code, "name": asset.name, "is_active": True}]
+
+    def test_get_asset_rows_cached_per_version(self, asset, django_assert_num_queries):
+        version = get_asset_list_version()
+        first = get_asset_rows(only_active=True, version=version)
+        with django_assert_num_queries(0):
+            assert get_asset_rows(only_active=True, version=version) is first
+
+    def test_get_asset_rows_reloads_after_mutation(self, asset, inactive_asset):
+        before = get_asset_rows(only_active=True, version=get_asset_list_version())
+        inactive_asset.is_active = True
+        inactive_asset.save()
+        after = get_asset_rows(only_active=True, version=get_asset_list_version())
+        assert len(before) == 1
+        assert len(after) == 2
+
     def test_get_asset_by_id(self, asset):
         result = get_asset_by_id(asset.pk)
         assert result.code == "BTC"
@@ -111,6 +164,13 @@ class TestAssetSelectors:
         with pytest.raises(Asset.DoesNotExist):
             get_asset_by_id(99999)
 
+    def test_get_asset_for_operation_loads_only_needed_fields(self, asset, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            a = get_asset_for_operation(asset.pk)
+            assert a.is_active is True
+            assert a.code == asset.code
+        assert "name" in a.get_deferred_fields()
+
     def test_get_asset_by_code(self, asset):
         result = get_asset_by_code("BTC")
         assert result.pk == asset.pk
@@ -119,6 +179,12 @@ class TestAssetSelectors:
         result = get_asset_by_code("btc")
         assert result.pk == asset.pk
 
+    def test_get_assets_by_codes_normalizes(self, asset, inactive_asset, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            result = get_assets_by_codes([" btc ", "luna", "DOGE"])
+        assert set(result) == {"BTC", "LUNA"}
+        assert result["BTC"].pk == asset.pk
+
     def test_get_asset_by_code_not_found(self):
         with pytest.raises(Asset.DoesNotExist):
             get_asset_by_code("XYZ")
@@ -186,7 +252,7 @@ class TestOrderSelectors:
     def test_get_orders_by_client_returns_empty_for_new_client(self, db):
         from apps.trading.models import ClientStatus
         new_client = Client.objects.create(
-            cuit="11-22333444-5", name="Nuevo", status=ClientStatus.ACTIVE
+            cuit="11223334445", name="Nuevo", status=ClientStatus.ACTIVE
         )
         result = list(get_orders_by_client(new_client))
         assert result == []
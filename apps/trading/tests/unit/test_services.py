@@ -15,9 +15,19 @@ from decimal import Decimal
 import pytest
 from django.core.exceptions import ValidationError
 
-from apps.trading.models import ClientStatus, OrderStatus, TransactionStatus, TransactionType
+from apps.trading import services
+from apps.trading.models import (
+    Asset,
+    Client,
+    ClientStatus,
+    FiatCurrency,
+    OrderStatus,
+    TransactionStatus,
+    TransactionType,
+)
 from apps.trading.services import (
     block_client,
+    bulk_create_clients,
     cancel_order,
     create_asset,
     create_client,
@@ -45,13 +55,24 @@ class TestCreateClient:
         assert c.pk is not None
         assert c.status == ClientStatus.ACTIVE
         assert c.name == "Test SA"
-        assert c.cuit == "20-11111111-1"
+        assert c.cuit == "20111111111"
 
     def test_strips_whitespace(self):
         c = create_client(cuit="  20-22222222-2  ", name="  Empresa   ")
-        assert c.cuit == "20-22222222-2"
+        assert c.cuit == "20222222222"
         assert c.name == "Empresa"
 
+    def test_duplicate_cuit_with_different_format_raises(self):
+        create_client(cuit="20-77777777-7", name="Primera")
+        with pytest.raises(ValidationError) as exc_info:
+            create_client(cuit="20777777777", name="Segunda")
+        assert "cuit" in exc_info.value.message_dict
+
+    def test_invalid_cuit_length_raises(self):
+        with pytest.raises(ValidationError) as exc_info:
+            create_client(cuit="20-1234-9", name="Corto")
+        assert "cuit" in exc_info.value.message_dict
+
     def test_email_optional(self):
         c = create_client(cuit="20-33333333-3", name="No Email")
         assert c.email == ""
@@ -103,6 +124,39 @@ class TestUpdateClient:
         assert result.name == original_name
 
 
+# ---------------------------------------------------------------------------
+# bulk_create_clients
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestBulkCreateClients:
+    def test_creates_in_constant_queries(self, django_assert_max_num_queries):
+        items = [{"cuit": f"20{i:09d}", "name": f"Cliente {i}"} for i in range(50)]
+        with django_assert_max_num_queries(4):
+            created = bulk_create_clients(clients=items)
+        assert len(created) == 50
+        assert all(c.pk for c in created)
+
+    def test_normalizes_and_detects_repeats(self):
+        items = [
+            {"cuit": "20-11111111-1", "name": "A"},
+            {"cuit": "20111111111", "name": "B"},
+        ]
+        with pytest.raises(ValidationError) as exc_info:
+            bulk_create_clients(clients=items)
+        assert "20111111111" in exc_info.value.message_dict["cuit"][0]
+
+    def test_existing_cuit_creates_nothing(self, client_obj):
+        items = [
+            {"cuit": "20333333333", "name": "Nuevo"},
+            {"cuit": client_obj.cuit, "name": "Duplicado"},
+        ]
+        with pytest.raises(ValidationError):
+            bulk_create_clients(clients=items)
+        assert not Client.objects.filter(cuit="20333333333").exists()
+
+
 # ---------------------------------------------------------------------------
 # block_client / unblock_client
 # ---------------------------------------------------------------------------
@@ -111,23 +165,56 @@ class TestUpdateClient:
 @pytest.mark.django_db
 class TestBlockUnblockClient:
     def test_block_active_client(self, client_obj):
-        blocked = block_client(client=client_obj)
+        blocked = block_client(client_id=client_obj.pk)
         assert blocked.status == ClientStatus.BLOCKED
         assert blocked.is_active is False
 
     def test_block_idempotent(self, blocked_client):
-        result = block_client(client=blocked_client)
+        result = block_client(client_id=blocked_client.pk)
         assert result.status == ClientStatus.BLOCKED
 
     def test_unblock_blocked_client(self, blocked_client):
-        active = unblock_client(client=blocked_client)
+        active = unblock_client(client_id=blocked_client.pk)
         assert active.status == ClientStatus.ACTIVE
         assert active.is_active is True
 
     def test_unblock_idempotent(self, client_obj):
-        result = unblock_client(client=client_obj)
+        result = unblock_client(client_id=client_obj.pk)
         assert result.status == ClientStatus.ACTIVE
 
+    def test_block_persists_in_single_query(self, client_obj, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            blocked = block_client(client_id=client_obj.pk)
+        assert blocked.cuit == client_obj.cuit
+        client_obj.refresh_from_db()
+        assert client_obj.status == ClientStatus.BLOCKED
+
+    def test_block_missing_client_raises(self):
+        with pytest.raises(Client.DoesNotExist):
+            block_client(client_id=999_999)
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestUpdateReturningFallback:
+    """Motores sin UPDATE ... RETURNING: UPDATE + SELECT."""
+
+    @pytest.fixture(autouse=True)
+    def _no_returning(self, monkeypatch):
+        monkeypatch.setattr(services, "_UPDATE_RETURNING_VENDORS", frozenset())
+
+    def test_block_uses_update_then_select(self, client_obj, django_assert_num_queries):
+        with django_assert_num_queries(2) as ctx:
+            blocked = block_client(client_id=client_obj.pk)
+        assert "RETURNING" not in ctx.captured_queries[0]["sql"].upper()
+        assert blocked.status == ClientStatus.BLOCKED
+        client_obj.refresh_from_db()
+        assert client_obj.status == ClientStatus.BLOCKED
+
+    def test_missing_row_raises(self):
+        with pytest.raises(Asset.DoesNotExist):
+            deactivate_asset(asset_id=999_999)
+
 
 # ---------------------------------------------------------------------------
 # create_asset
@@ -170,21 +257,25 @@ class TestCreateAsset:
 @pytest.mark.django_db
 class TestDeactivateReactivateAsset:
     def test_deactivate(self, asset):
-        result = deactivate_asset(asset=asset)
+        result = deactivate_asset(asset_id=asset.pk)
         assert result.is_active is False
 
     def test_deactivate_idempotent(self, inactive_asset):
-        result = deactivate_asset(asset=inactive_asset)
+        result = deactivate_asset(asset_id=inactive_asset.pk)
         assert result.is_active is False
 
     def test_reactivate(self, inactive_asset):
-        result = reactivate_asset(asset=inactive_asset)
+        result = reactivate_asset(asset_id=inactive_asset.pk)
         assert result.is_active is True
 
     def test_reactivate_idempotent(self, asset):
-        result = reactivate_asset(asset=asset)
+        result = reactivate_asset(asset_id=asset.pk)
         assert result.is_active is True
 
+    def test_deactivate_missing_asset_raises(self):
+        with pytest.raises(Asset.DoesNotExist):
+            deactivate_asset(asset_id=999_999)
+
 
 # ---------------------------------------------------------------------------
 # create_fiat_currency
@@ -223,21 +314,25 @@ class TestCreateFiatCurrency:
 @pytest.mark.django_db
 class TestDeactivateReactivateFiat:
     def test_deactivate(self, fiat_currency):
-        result = deactivate_fiat_currency(fiat_currency=fiat_currency)
+        result = deactivate_fiat_currency(fiat_id=fiat_currency.pk)
         assert result.is_active is False
 
     def test_deactivate_idempotent(self, inactive_fiat):
-        result = deactivate_fiat_currency(fiat_currency=inactive_fiat)
+        result = deactivate_fiat_currency(fiat_id=inactive_fiat.pk)
         assert result.is_active is False
 
     def test_reactivate(self, inactive_fiat):
-        result = reactivate_fiat_currency(fiat_currency=inactive_fiat)
+        result = reactivate_fiat_currency(fiat_id=inactive_fiat.pk)
         assert result.is_active is True
 
     def test_reactivate_idempotent(self, fiat_currency):
-        result = reactivate_fiat_currency(fiat_currency=fiat_currency)
+        result = reactivate_fiat_currency(fiat_id=fiat_currency.pk)
         assert result.is_active is True
 
+    def test_deactivate_missing_fiat_raises(self):
+        with pytest.raises(FiatCurrency.DoesNotExist):
+            deactivate_fiat_currency(fiat_id=999_999)
+
 
 # ---------------------------------------------------------------------------
 # create_order
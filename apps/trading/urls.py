@@ -1,14 +1,14 @@
 from django.urls import path
 
 from .views import (
-    AssetDeactivateView,
+    AssetBulkCreateView,
     AssetDetailView,
     AssetListCreateView,
-    AssetReactivateView,
-    ClientBlockView,
+    AssetStatusView,
+    ClientBulkCreateView,
     ClientDetailView,
     ClientListCreateView,
-    ClientUnblockView,
+    ClientStatusView,
     FiatCurrencyDeactivateView,
     FiatCurrencyDetailView,
     FiatCurrencyListCreateView,
@@ -27,17 +27,19 @@ urlpatterns = [
     # Clients
     # ------------------------------------------------------------------
     path("trading/clients/",                          ClientListCreateView.as_view(),  name="client-list-create"),
+    path("trading/clients/bulk/",                     ClientBulkCreateView.as_view(),  name="client-bulk-create"),
     path("trading/clients/<int:client_id>/",          ClientDetailView.as_view(),      name="client-detail"),
-    path("trading/clients/<int:client_id>/block/",    ClientBlockView.as_view(),       name="client-block"),
-    path("trading/clients/<int:client_id>/unblock/",  ClientUnblockView.as_view(),     name="client-unblock"),
+    path("trading/clients/<int:client_id>/block/",    ClientStatusView.as_view(),      name="client-block",   kwargs={"action": "block"}),
+    path("trading/clients/<int:client_id>/unblock/",  ClientStatusView.as_view(),      name="client-unblock", kwargs={"action": "unblock"}),
 
     # ------------------------------------------------------------------
     # Assets
     # ------------------------------------------------------------------
     path("trading/assets/",                              AssetListCreateView.as_view(),   name="asset-list-create"),
+    path("trading/assets/bulk/",                         AssetBulkCreateView.as_view(),   name="asset-bulk-create"),
     path("trading/assets/<int:asset_id>/",               AssetDetailView.as_view(),       name="asset-detail"),
-    path("trading/assets/<int:asset_id>/deactivate/",    AssetDeactivateView.as_view(),   name="asset-deactivate"),
-    path("trading/assets/<int:asset_id>/reactivate/",    AssetReactivateView.as_view(),   name="asset-reactivate"),
+    path("trading/assets/<int:asset_id>/deactivate/",    AssetStatusView.as_view(),       name="asset-deactivate", kwargs={"action": "deactivate"}),
+    path("trading/assets/<int:asset_id>/reactivate/",    AssetStatusView.as_view(),       name="asset-reactivate", kwargs={"action": "reactivate"}),
 
     # ------------------------------------------------------------------
     # Fiat Currencies
@@ -1,4 +1,7 @@
+from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework import exceptions
 from django.contrib.auth import get_user_model
 
@@ -28,3 +31,25 @@ class CustomJWTAuthentication(JWTAuthentication):
             raise exceptions.AuthenticationFailed('Usuario inactivo')
         
         return user, token
+
+    def get_user(self, validated_token):
+        """
+        Carga el usuario del token junto con su rol en una sola consulta.
+
+        Las vistas y los permisos RBAC leen `request.user.role`; con
+        select_related el rol queda cacheado en la instancia y no se
+        dispara una segunda consulta por request.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        try:
+            user = User.objects.select_related("role").get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except User.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        return user
@@ -17,6 +17,8 @@ import django_filters
 
 from .models import User
 
+_FIELDS = ('email', 'role', 'is_active')
+
 
 class UserFilter(django_filters.FilterSet):
     email = django_filters.CharFilter(
@@ -33,4 +35,20 @@ class UserFilter(django_filters.FilterSet):
 
     class Meta:
         model = User
-        fields = ['email', 'role', 'is_active']
+        fields = _FIELDS
+
+    def get_form_class(self):
+        """
+        Clase de formulario construida una sola vez por clase de filtro.
+
+        django-filter arma la clase con type() en cada instancia (es decir,
+        en cada request del listado). Los filtros de este FilterSet no
+        dependen de la request, así que la clase es siempre la misma; el
+        formulario en sí sigue siendo una instancia nueva por request.
+        """
+        cls = type(self)
+        form_class = cls.__dict__.get('_form_class')
+        if form_class is None:
+            form_class = super().get_form_class()
+            cls._form_class = form_class
+        return form_class
@@ -0,0 +1,40 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_role_name(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    Role = apps.get_model("authorization", "Role")
+    User.objects.filter(role__isnull=False).update(
+        role_name=Subquery(Role.objects.filter(pk=OuterRef("role_id")).values("name")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+    """
+    Agrega `role_name`, copia desnormalizada de role.name, y la completa para
+    los usuarios existentes.
+
+    El listado administrativo la lee directamente de la fila de User, sin
+    JOIN con authorization_role.
+    """
+
+    dependencies = [
+        ("users", "0005_user_list_indexes"),
+        ("authorization", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="role_name",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=100,
+                null=True,
+                verbose_name="Nombre del rol",
+            ),
+        ),
+        migrations.RunPython(backfill_role_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Elimina la copia desnormalizada `role_name`: solo se mantenía en sync vía
+    User.save() y post_save de Role, y los QuerySet.update() la dejaban
+    desactualizada. El listado vuelve a leer el nombre con un JOIN indexado.
+    """
+
+    dependencies = [
+        ("users", "0006_user_role_name"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="user",
+            name="role_name",
+        ),
+    ]
@@ -84,11 +84,24 @@ class User(AbstractUser):
         verbose_name = 'Usuario'
         verbose_name_plural = 'Usuarios'
         ordering = ['-created_at']
+        indexes = [
+            # Listado administrativo: orden por defecto (-created_at).
+            models.Index(fields=['-created_at'], name='users_created_idx'),
+            # Listado filtrado por rol y estado (UserFilter), ya ordenado.
+            models.Index(
+                fields=['role', 'is_active', '-created_at'],
+                name='users_role_active_created_idx',
+            ),
+        ]
     
     def __str__(self):
         return self.email
-    
+
     @property
     def full_name(self):
         """Retorna el nombre completo del usuario"""
+        # Los listados lo traen calculado por la DB (users.selectors).
+        annotated = getattr(self, '_full_name', None)
+        if annotated is not None:
+            return annotated
         return f"{self.first_name} {self.last_name}".strip() or self.email
\ No newline at end of file
@@ -9,10 +9,29 @@ Toda query usa select_related para evitar N+1 en la serialización del rol.
 
 from __future__ import annotations
 
-from django.db.models import QuerySet
+from django.db.models import CharField, F, QuerySet, Value
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim
 
 from .models import User
 
+# Columnas que consume AdminUserSerializer en el listado. El resto de
+# AbstractUser (password, last_login, is_staff, ...) no se trae ni se hidrata.
+_LIST_FIELDS = (
+    'id', 'email', 'first_name', 'last_name', 'is_active',
+    'created_at', 'updated_at', 'role', 'role__name',
+)
+
+# Equivalente SQL de User.full_name: "nombre apellido" o, si queda vacío, el
+# email. El listado lo recibe ya armado en cada fila.
+_FULL_NAME = Coalesce(
+    NullIf(
+        Trim(Concat('first_name', Value(' '), 'last_name', output_field=CharField())),
+        Value(''),
+    ),
+    F('email'),
+    output_field=CharField(),
+)
+
 
 def get_user_by_id(user_id: int) -> User:
     """
@@ -29,5 +48,13 @@ def get_user_list() -> QuerySet[User]:
     Los filtros de la request (email, role, is_active) se aplican externamente
     a través de UserFilter (filters.py) por DjangoFilterBackend.
     El ordenamiento y la paginación también los gestiona DRF.
+
+    Solo carga las columnas que serializa el listado (ver _LIST_FIELDS) y
+    trae full_name calculado por la DB.
     """
-    return User.objects.select_related('role').order_by('-created_at')
+    return (
+        User.objects.select_related('role')
+        .only(*_LIST_FIELDS)
+        .annotate(_full_name=_FULL_NAME)
+        .order_by('-created_at')
+    )
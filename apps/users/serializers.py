@@ -1,13 +1,18 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.password_validation import validate_password
-from django.core.exceptions import ObjectDoesNotExist, ValidationError as DjangoValidationError
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from typing import Any, cast
 
+from config.serializers import CachedFieldsModelSerializer
+
 from .models import User
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsModelSerializer):
     """Serializer for User model - read-only representation"""
     full_name = serializers.CharField(read_only=True)
     
@@ -18,6 +23,12 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at', 'is_active']
 
 
+_LOGIN_FIELDS = (
+    'id', 'password', 'is_active',
+    'email', 'first_name', 'last_name', 'created_at', 'updated_at',
+)
+
+
 class LoginSerializer(serializers.Serializer):
     """Serializer for user login with email/password"""
     email = serializers.EmailField(required=True)
@@ -36,14 +47,17 @@ class LoginSerializer(serializers.Serializer):
                 'Email and password are required.'
             )
         
-        # Authenticate using email
-        try:
-            user = User.objects.get(email=email)
-            if not user.check_password(password):
-                raise serializers.ValidationError(
-                    'Invalid email or password.'
-                )
-        except User.DoesNotExist:
+        # Authenticate using email. Una sola query, limitada a las columnas
+        # que usan la verificación y la respuesta del login (UserSerializer).
+        user = User.objects.only(*_LOGIN_FIELDS).filter(email=email).first()
+        if user is None:
+            # Se hashea igual la contraseña para que un email inexistente no
+            # responda más rápido que uno válido (enumeración por timing).
+            make_password(password)
+            raise serializers.ValidationError(
+                'Invalid email or password.'
+            )
+        if not user.check_password(password):
             raise serializers.ValidationError(
                 'Invalid email or password.'
             )
@@ -57,6 +71,10 @@ class LoginSerializer(serializers.Serializer):
         return attrs
 
 
+# Rol asignado a las altas por registro público.
+_DEFAULT_ROLE = 'Operador'
+
+
 class RegisterSerializer(serializers.ModelSerializer):
     """Serializer for user registration"""
     password = serializers.CharField(
@@ -77,6 +95,9 @@ class RegisterSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             'first_name': {'required': True},
             'last_name': {'required': True},
+            # La unicidad del email la resuelve validate_email (misma query
+            # que los usernames ocupados); sin el UniqueValidator automático.
+            'email': {'validators': []},
         }
 
     def validate_password(self, value):
@@ -102,38 +123,86 @@ class RegisterSerializer(serializers.ModelSerializer):
         return attrs
     
     def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError(
-                'A user with this email already exists.'
-            )
+        # Una sola query resuelve la unicidad del email y trae los usernames
+        # que colisionan con el prefijo, que create() reutiliza.
+        base = value.split('@')[0]
+        rows = User.objects.filter(
+            Q(email=value) | Q(username__startswith=base)
+        ).values_list('email', 'username')
+        taken = []
+        for email, username in rows.iterator():
+            if email == value:
+                raise serializers.ValidationError(
+                    'A user with this email already exists.'
+                )
+            taken.append(username)
+        self._taken_usernames = frozenset(taken)
         return value
     
-    def create(self, validated_data):
-        validated_data.pop('password_confirm')
-        password = validated_data.pop('password')
+    @staticmethod
+    def _taken_usernames_for(base):
+        return frozenset(
+            User.objects.filter(username__startswith=base)
+            .values_list('username', flat=True)
+            .iterator()
+        )
 
-        # Genera un username único a partir del email (no expuesto en la API)
-        base = validated_data.get('email', '').split('@')[0]
+    @staticmethod
+    def _first_free_username(base, taken):
         username = base
         counter = 1
-        while User.objects.filter(username=username).exists():
+        while username in taken:
             username = f"{base}{counter}"
             counter += 1
-        validated_data['username'] = username
+        return username
 
-        user = User.objects.create(**validated_data)
+    def create(self, validated_data):
+        validated_data.pop('password_confirm')
+        password = validated_data.pop('password')
+
+        # Genera un username único a partir del email (no expuesto en la API).
+        # Los candidatos ocupados se traen en una sola query y el primer
+        # sufijo libre se elige en memoria.
+        base = validated_data.get('email', '').split('@')[0]
+        taken = getattr(self, '_taken_usernames', None)
+        if taken is None:
+            taken = self._taken_usernames_for(base)
+        validated_data['username'] = self._first_free_username(base, taken)
+
+        # El usuario se arma completo en memoria (hash y rol incluidos) y se
+        # persiste con un único INSERT.
+        user = User(**validated_data)
         user.set_password(password)
 
         # Asigna el rol por defecto "Operador" si está definido en el sistema.
         # Importación diferida para evitar acoplamiento circular users → authorization.
         # Si el rol no existe (entorno limpio sin seed), se deja sin rol.
+        # El PK se resuelve contra un cache en memoria (sin query por alta).
         try:
-            from apps.authorization.models import Role  # noqa: PLC0415
-            user.role_id = Role.objects.get(name='Operador').pk
-        except (ImportError, ObjectDoesNotExist):
+            from apps.authorization.services import get_role_id  # noqa: PLC0415
+            role_id = get_role_id(_DEFAULT_ROLE)
+            if role_id is not None:
+                user.role_id = role_id
+        except ImportError:
             pass
 
-        user.save()
+        # Una alta concurrente puede pasar la validación y chocar con una
+        # constraint unique. Si fue el email se responde 400, no 500; si fue
+        # el username (otra alta tomó el mismo sufijo) se elige otro y se
+        # reintenta una vez. Cualquier otro error se propaga.
+        try:
+            with transaction.atomic():
+                user.save()
+        except IntegrityError:
+            if User.objects.filter(email=user.email).exists():
+                raise serializers.ValidationError({
+                    'email': ['A user with this email already exists.']
+                })
+            user.username = self._first_free_username(
+                base, self._taken_usernames_for(base)
+            )
+            with transaction.atomic():
+                user.save()
 
         return user
 
@@ -161,6 +230,12 @@ class ChangePasswordSerializer(serializers.Serializer):
             raise serializers.ValidationError({
                 'new_password_confirm': 'Passwords do not match.'
             })
+        # old_password ya se verificó contra el hash guardado: si coincide con
+        # la nueva, el cambio no cambiaría nada y no debe auditarse como tal.
+        if attrs['new_password'] == attrs['old_password']:
+            raise serializers.ValidationError({
+                'new_password': 'New password must be different from the current one.'
+            })
         return attrs
     
     def validate_old_password(self, value):
@@ -196,7 +271,7 @@ class ChangePasswordSerializer(serializers.Serializer):
 # Serializers de administración de usuarios
 # ===========================================================================
 
-class AdminUserSerializer(serializers.ModelSerializer):
+class AdminUserSerializer(CachedFieldsModelSerializer):
     """
     Representación completa de un usuario para endpoints administrativos.
     Incluye role_name como campo de solo lectura para evitar un join adicional en el frontend.
@@ -229,11 +304,22 @@ class AdminCreateUserSerializer(serializers.Serializer):
     )
     role_id = serializers.IntegerField(required=False, allow_null=True, default=None)
     is_active = serializers.BooleanField(default=True)
+    # La unicidad del email la valida services.create_user contra la
+    # constraint de la DB, en el mismo INSERT.
 
-    def validate_email(self, value: str) -> str:
-        from .models import User as _User
-        if _User.objects.filter(email=value).exists():
-            raise serializers.ValidationError('Ya existe un usuario con este email.')
+    def validate_password(self, value: str) -> str:
+        # Única pasada por AUTH_PASSWORD_VALIDATORS del alta administrativa;
+        # services.create_user recibe la contraseña ya validada.
+        initial = cast(dict[str, Any], self.initial_data)
+        partial_user = User(
+            email=initial.get('email', ''),
+            first_name=initial.get('first_name', ''),
+            last_name=initial.get('last_name', ''),
+        )
+        try:
+            validate_password(value, user=partial_user)
+        except DjangoValidationError as exc:
+            raise serializers.ValidationError(exc.messages)
         return value
 
 
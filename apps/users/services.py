@@ -19,9 +19,10 @@ from __future__ import annotations
 import secrets
 import string
 
-from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
 
 from .models import User
 
@@ -31,20 +32,63 @@ from .models import User
 # ---------------------------------------------------------------------------
 
 def _unique_username(email: str) -> str:
-    """Deriva un username único del email (campo interno, no expuesto en API)."""
+    """
+    Deriva un username único del email (campo interno, no expuesto en API).
+
+    Los candidatos ocupados se traen en una sola query y el primer sufijo
+    libre se elige en memoria.
+    """
     base = email.split('@')[0]
+    taken = frozenset(
+        User.objects.filter(username__startswith=base)
+        .values_list('username', flat=True)
+        .iterator()
+    )
     candidate = base
     counter = 1
-    while User.objects.filter(username=candidate).exists():
+    while candidate in taken:
         candidate = f"{base}{counter}"
         counter += 1
     return candidate
 
 
+_TEMP_PASSWORD_ALPHABET = string.ascii_letters + string.digits + "!@#$%&*"
+# Mayor múltiplo del alfabeto que entra en un byte. Los bytes por encima se
+# descartan para que `b % len(alfabeto)` no favorezca a los primeros símbolos.
+_TEMP_PASSWORD_BYTE_LIMIT = 256 - 256 % len(_TEMP_PASSWORD_ALPHABET)
+
+
 def _generate_temp_password(length: int = 16) -> str:
-    """Contraseña temporal criptográficamente segura."""
-    alphabet = string.ascii_letters + string.digits + "!@#$%&*"
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    """
+    Contraseña temporal criptográficamente segura.
+
+    Lee un único bloque de bytes aleatorios (en vez de una llamada a
+    secrets.choice por carácter) y lo mapea al alfabeto sin sesgo; el bloque
+    cubre `length` con holgura, así que casi nunca hace falta un segundo.
+    """
+    chars: list[str] = []
+    while len(chars) < length:
+        chars.extend(
+            _TEMP_PASSWORD_ALPHABET[b % len(_TEMP_PASSWORD_ALPHABET)]
+            for b in secrets.token_bytes(length * 2)
+            if b < _TEMP_PASSWORD_BYTE_LIMIT
+        )
+    return ''.join(chars[:length])
+
+
+def _update_with_token_bump(user: User, **values) -> None:
+    """
+    Escribe *values* e incrementa token_version en un único UPDATE.
+
+    El incremento lo hace la DB (F()), así dos operaciones concurrentes sobre
+    el mismo usuario no pierden ninguno. La instancia se actualiza en memoria
+    con lo escrito, sin releerla.
+    """
+    values['updated_at'] = timezone.now()
+    User.objects.filter(pk=user.pk).update(token_version=F('token_version') + 1, **values)
+    for field, value in values.items():
+        setattr(user, field, value)
+    user.token_version += 1
 
 
 # ---------------------------------------------------------------------------
@@ -65,11 +109,12 @@ def create_user(
     Crea un usuario desde el panel de administración.
 
     A diferencia del registro público, permite asignar rol y estado inicial.
-    Lanza ValidationError si el email ya existe o la contraseña no cumple políticas.
-    """
-    if User.objects.filter(email=email).exists():
-        raise ValidationError({'email': 'Ya existe un usuario con este email.'})
+    La contraseña llega validada por AdminCreateUserSerializer.
+    Lanza ValidationError si el email ya existe.
 
+    La unicidad del email la resuelve la constraint de la DB en el mismo
+    INSERT (sin SELECT previo ni carrera entre chequeo e inserción).
+    """
     user = User(
         email=email,
         username=_unique_username(email),
@@ -80,13 +125,18 @@ def create_user(
     if role_id is not None:
         user.role_id = role_id
 
-    validate_password(password, user)
     user.set_password(password)
-    user.save()
+    try:
+        with transaction.atomic():
+            user.save()
+    except IntegrityError:
+        # Solo el camino de error paga la query que distingue la causa.
+        if User.objects.filter(email=email).exists():
+            raise ValidationError({'email': 'Ya existe un usuario con este email.'})
+        raise
     return user
 
 
-@transaction.atomic
 def update_user(
     *,
     user: User,
@@ -99,21 +149,24 @@ def update_user(
 
     Solo modifica los campos que se pasen explícitamente (semántica PATCH).
     No permite cambiar is_active ni password desde aquí (operaciones dedicadas).
+    Los valores iguales a los actuales se ignoran: si nada cambia no hay UPDATE.
     """
-    fields: list[str] = ['updated_at']
+    fields: list[str] = []
 
-    if first_name is not None:
+    if first_name is not None and first_name != user.first_name:
         user.first_name = first_name
         fields.append('first_name')
-    if last_name is not None:
+    if last_name is not None and last_name != user.last_name:
         user.last_name = last_name
         fields.append('last_name')
-    if role_id is not None:
+    if role_id is not None and role_id != user.role_id:
         user.role_id = role_id
         fields.append('role_id')
 
-    if len(fields) > 1:
-        user.save(update_fields=fields)
+    # Sin transacción explícita: la escritura es un único UPDATE, y un PATCH
+    # vacío o sin cambios no abre ni BEGIN/COMMIT ni savepoint.
+    if fields:
+        user.save(update_fields=[*fields, 'updated_at'])
 
     return user
 
@@ -126,13 +179,25 @@ def deactivate_user(*, user: User) -> User:
     Incrementa token_version para invalidar todos sus JWTs activos sin esperar
     a que expiren naturalmente.
     """
-    user.is_active = False
-    user.token_version += 1
-    user.save(update_fields=['is_active', 'token_version', 'updated_at'])
-
+    _update_with_token_bump(user, is_active=False)
     return user
 
 
+def deactivate_users(*, user_ids: list[int]) -> int:
+    """
+    Desactiva en bloque a los usuarios activos de *user_ids*.
+
+    Misma semántica que deactivate_user (is_active=False y token_version + 1),
+    resuelta en un único UPDATE. Retorna la cantidad de usuarios desactivados;
+    los ya inactivos o inexistentes se ignoran.
+    """
+    return User.objects.filter(pk__in=user_ids, is_active=True).update(
+        is_active=False,
+        token_version=F('token_version') + 1,
+        updated_at=timezone.now(),
+    )
+
+
 @transaction.atomic
 def reset_password(*, user: User) -> str:
     """
@@ -145,8 +210,7 @@ def reset_password(*, user: User) -> str:
     """
     temp_password = _generate_temp_password()
     user.set_password(temp_password)
-    user.token_version += 1
-    user.save(update_fields=['password', 'token_version', 'updated_at'])
+    _update_with_token_bump(user, password=user.password)
 
     # TODO: NotificationService.send_temp_password(user=user, password=temp_password)
     return temp_password
@@ -15,9 +15,9 @@ Cada grupo verifica autenticación, permisos RBAC y lógica de negocio.
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.authorization.models import Permission, Role
+from apps.users.models import User
 from apps.users.tests.factories.user_factory import UserFactory
 
 pytestmark = [pytest.mark.api, pytest.mark.django_db]
@@ -27,62 +27,92 @@ pytestmark = [pytest.mark.api, pytest.mark.django_db]
 # Helpers / Fixtures
 # ---------------------------------------------------------------------------
 
-def _make_admin_role(permissions: list[str]) -> Role:
-    """Crea un rol Administrador con los permisos indicados."""
-    role, _ = Role.objects.get_or_create(name='Administrador_test')
-    for code in permissions:
-        perm, _ = Permission.objects.get_or_create(
-            code=code,
-            defaults={'description': code},
-        )
-        role.permissions.add(perm)
+def _make_admin_role(permissions: list[str], name: str = 'Administrador_test') -> Role:
+    """Crea (o reutiliza) el rol *name* con los permisos indicados."""
+    role, _ = Role.objects.get_or_create(name=name)
+    Permission.objects.bulk_create(
+        [Permission(code=code, description=code) for code in permissions],
+        ignore_conflicts=True,
+    )
+    role.permissions.add(*Permission.objects.filter(code__in=permissions))
     return role
 
 
 def _auth_client(user) -> APIClient:
-    """Retorna un APIClient autenticado con JWT del usuario dado."""
+    """
+    Retorna un APIClient autenticado como el usuario dado.
+
+    Usa force_authenticate: estos tests cubren permisos RBAC y lógica de
+    negocio, no la emisión ni validación del JWT (ver test_authentication),
+    así que no se firma un token por test.
+    """
     client = APIClient()
-    token = RefreshToken.for_user(user)
-    client.credentials(HTTP_AUTHORIZATION=f'Bearer {str(token.access_token)}')  # type: ignore[attr-defined]
+    client.force_authenticate(user=user)
     return client
 
 
-@pytest.fixture()
-def full_admin():
-    """Usuario Administrador con todos los permisos de usuarios.*"""
-    role = _make_admin_role([
-        'usuarios.view',
-        'usuarios.create',
-        'usuarios.edit',
-        'usuarios.delete',
-    ])
-    user = UserFactory(email='fulladmin@test.com')
-    user.role = role
-    user.save()
-    return user
+def _class_admin(django_db_blocker, email: str, role_name: str, permissions: list[str]):
+    """
+    Crea un usuario con rol y permisos fuera de la transacción de cada test,
+    de modo que lo compartan todos los tests de una clase, y lo borra al final.
 
-
-@pytest.fixture()
+    Solo se eliminan los permisos que no existían antes de crearlo.
+    """
+    with django_db_blocker.unblock():
+        existing = set(
+            Permission.objects.filter(code__in=permissions).values_list('code', flat=True)
+        )
+        role = _make_admin_role(permissions, name=role_name)
+        user = UserFactory(email=email, role=role)
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
+        role.delete()
+        Permission.objects.filter(code__in=set(permissions) - existing).delete()
+
+
+@pytest.fixture(scope='class')
+def full_admin(django_db_setup, django_db_blocker):
+    """Usuario Administrador con todos los permisos de usuarios.* (uno por clase)."""
+    yield from _class_admin(
+        django_db_blocker,
+        'fulladmin@test.com',
+        'Administrador_test',
+        ['usuarios.view', 'usuarios.create', 'usuarios.edit', 'usuarios.delete'],
+    )
+
+
+@pytest.fixture(scope='class')
 def admin_client(full_admin):
     """APIClient autenticado como full_admin."""
     return _auth_client(full_admin)
 
 
-@pytest.fixture()
-def view_only_admin():
-    """Usuario con solo usuarios.view."""
-    role = _make_admin_role(['usuarios.view'])
-    user = UserFactory(email='viewonly@test.com')
-    user.role = role
-    user.save()
-    return user
+@pytest.fixture(scope='class')
+def view_only_admin(django_db_setup, django_db_blocker):
+    """Usuario con solo usuarios.view (uno por clase, con rol propio)."""
+    yield from _class_admin(
+        django_db_blocker,
+        'viewonly@test.com',
+        'Visor_test',
+        ['usuarios.view'],
+    )
 
 
-@pytest.fixture()
+@pytest.fixture(scope='class')
 def view_client(view_only_admin):
     return _auth_client(view_only_admin)
 
 
+@pytest.fixture()
+def unsaved_user():
+    """
+    Usuario en memoria, sin INSERT, para tests que solo necesitan un id en la
+    URL: la request se rechaza por autenticación o permisos antes de buscarlo.
+    """
+    return UserFactory.build(pk=999_998)
+
+
 @pytest.fixture()
 def target_user():
     """Usuario de prueba sobre el que se operará."""
@@ -106,7 +136,8 @@ class TestUserListView:
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_returns_paginated_list(self, admin_client):
-        UserFactory.create_batch(3)
+        # Un solo INSERT para las filas del listado (sin save() por usuario).
+        User.objects.bulk_create(UserFactory.build_batch(3))
         response = admin_client.get(self.url)
         assert response.status_code == status.HTTP_200_OK
         assert 'results' in response.data
@@ -195,6 +226,17 @@ class TestUserCreateView:
         response = admin_client.post(self.url, data, format='json')
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_weak_password_returns_400(self, admin_client):
+        data = {
+            'email': 'weak@example.com',
+            'first_name': 'W',
+            'last_name': 'P',
+            'password': 'password123',  # noqa: S106 # NOSONAR
+        }
+        response = admin_client.post(self.url, data, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'password' in response.data
+
     def test_missing_required_field_returns_400(self, admin_client):
         data = {'email': 'missing@example.com'}
         response = admin_client.post(self.url, data, format='json')
@@ -209,8 +251,8 @@ class TestUserDetailView:
     def _url(self, pk: int) -> str:
         return f'/api/users/{pk}/'
 
-    def test_requires_auth(self, api_client, target_user):
-        response = api_client.get(self._url(target_user.pk))
+    def test_requires_auth(self, api_client, unsaved_user):
+        response = api_client.get(self._url(unsaved_user.pk))
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_returns_user(self, admin_client, target_user):
@@ -237,9 +279,9 @@ class TestUserUpdateView:
     def _url(self, pk: int) -> str:
         return f'/api/users/{pk}/'
 
-    def test_requires_edit_permission(self, view_client, target_user):
+    def test_requires_edit_permission(self, view_client, unsaved_user):
         response = view_client.patch(
-            self._url(target_user.pk),
+            self._url(unsaved_user.pk),
             {'first_name': 'Nuevo'},
             format='json',
         )
@@ -288,8 +330,8 @@ class TestUserDeactivateView:
     def _url(self, pk: int) -> str:
         return f'/api/users/{pk}/deactivate/'
 
-    def test_requires_delete_permission(self, view_client, target_user):
-        response = view_client.post(self._url(target_user.pk))
+    def test_requires_delete_permission(self, view_client, unsaved_user):
+        response = view_client.post(self._url(unsaved_user.pk))
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_deactivate_success(self, admin_client, target_user):
@@ -324,8 +366,8 @@ class TestUserResetPasswordView:
     def _url(self, pk: int) -> str:
         return f'/api/users/{pk}/reset-password/'
 
-    def test_requires_edit_permission(self, view_client, target_user):
-        response = view_client.post(self._url(target_user.pk))
+    def test_requires_edit_permission(self, view_client, unsaved_user):
+        response = view_client.post(self._url(unsaved_user.pk))
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_reset_returns_temp_password(self, admin_client, target_user):
@@ -9,7 +9,6 @@ Tests cover:
 
 import pytest
 from rest_framework import status
-from apps.users.tests.factories.user_factory import UserFactory
 
 pytestmark = [pytest.mark.api, pytest.mark.django_db]
 
@@ -38,44 +37,36 @@ class TestChangePasswordEndpoint:
         assert user.check_password('NewSecurePassword456!')
         assert not user.check_password(self.default_password)
     
-    def test_change_password_wrong_old_password(self, authenticated_client):
-        """Test password change with incorrect old password."""
-        data = {
+    @pytest.mark.parametrize('data, error_fields', [
+        ({
             'old_password': 'WrongOldPassword123!',
             'new_password': 'NewSecurePassword456!',
-            'new_password_confirm': 'NewSecurePassword456!'
-        }
-        
-        response = authenticated_client.post(self.url, data, format='json')
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'old_password' in response.data
-    
-    def test_change_password_mismatch(self, authenticated_client):
-        """Test password change with mismatched new passwords."""
-        data = {
-            'old_password': self.default_password,
+            'new_password_confirm': 'NewSecurePassword456!',
+        }, ['old_password']),
+        ({
+            'old_password': default_password,
             'new_password': 'NewSecurePassword456!',
-            'new_password_confirm': 'DifferentPassword456!'
-        }
-        
-        response = authenticated_client.post(self.url, data, format='json')
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'new_password_confirm' in response.data
-    
-    def test_change_password_weak_new_password(self, authenticated_client):
-        """Test password change with weak new password."""
-        data = {
-            'old_password': self.default_password,
+            'new_password_confirm': 'DifferentPassword456!',
+        }, ['new_password_confirm']),
+        ({
+            'old_password': default_password,
             'new_password': '123',
-            'new_password_confirm': '123'
-        }
-        
-        response = authenticated_client.post(self.url, data, format='json')
+            'new_password_confirm': '123',
+        }, ['new_password']),
+        ({
+            'old_password': default_password,
+            'new_password': default_password,
+            'new_password_confirm': default_password,
+        }, ['new_password']),
+        ({'old_password': default_password}, ['new_password', 'new_password_confirm']),
+    ], ids=['wrong_old_password', 'mismatch', 'weak_new_password', 'same_as_old', 'missing_fields'])
+    def test_change_password_invalid_payload(self, shared_client, data, error_fields):
+        """Rejected changes return 400 and never write, so they share one user."""
+        response = shared_client.post(self.url, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'new_password' in response.data
+        for field in error_fields:
+            assert field in response.data
     
     def test_change_password_without_authentication(self, api_client):
         """Test that password change requires authentication."""
@@ -89,16 +80,6 @@ class TestChangePasswordEndpoint:
         
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
-    def test_change_password_missing_fields(self, authenticated_client):
-        """Test password change with missing fields."""
-        data = {'old_password': self.default_password}
-        
-        response = authenticated_client.post(self.url, data, format='json')
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'new_password' in response.data
-        assert 'new_password_confirm' in response.data
-    
     def test_change_password_invalidates_old_sessions(self, api_client, user):
         """Test that changing password doesn't invalidate current token."""
         # Login to get tokens
@@ -20,12 +20,10 @@ class TestLoginEndpoint:
     
     url = '/api/auth/login/'
     
-    def test_login_success(self, api_client):
+    def test_login_success(self, api_client, shared_user):
         """Test successful login with valid credentials."""
-        UserFactory(email='test@example.com')
-        
         data = {
-            'email': 'test@example.com',
+            'email': shared_user.email,
             'password': 'TestPassword123!'
         }
         
@@ -36,12 +34,10 @@ class TestLoginEndpoint:
         assert 'refresh' in response.data
         assert 'user' in response.data
     
-    def test_login_returns_jwt_tokens(self, api_client):
+    def test_login_returns_jwt_tokens(self, api_client, shared_user):
         """Test that login returns valid JWT tokens."""
-        UserFactory(email='test@example.com')
-        
         data = {
-            'email': 'test@example.com',
+            'email': shared_user.email,
             'password': 'TestPassword123!'
         }
         
@@ -55,16 +51,10 @@ class TestLoginEndpoint:
         assert len(response.data['access']) > 50
         assert len(response.data['refresh']) > 50
     
-    def test_login_returns_user_data(self, api_client):
+    def test_login_returns_user_data(self, api_client, shared_user):
         """Test that login returns user data."""
-        user = UserFactory(
-            email='test@example.com',
-            first_name='Test',
-            last_name='User'
-        )
-        
         data = {
-            'email': 'test@example.com',
+            'email': shared_user.email,
             'password': 'TestPassword123!'
         }
         
@@ -73,19 +63,17 @@ class TestLoginEndpoint:
         assert response.status_code == status.HTTP_200_OK
         user_data = response.data['user']
         
-        assert user_data['id'] == user.id
-        assert user_data['email'] == 'test@example.com'
+        assert user_data['id'] == shared_user.id
+        assert user_data['email'] == shared_user.email
         assert user_data['first_name'] == 'Test'
         assert user_data['last_name'] == 'User'
         assert user_data['full_name'] == 'Test User'
         assert 'password' not in user_data
     
-    def test_login_wrong_password(self, api_client):
+    def test_login_wrong_password(self, api_client, shared_user):
         """Test login with incorrect password."""
-        UserFactory(email='test@example.com')
-        
         data = {
-            'email': 'test@example.com',
+            'email': shared_user.email,
             'password': 'WrongPassword123!'
         }
         
@@ -93,17 +81,6 @@ class TestLoginEndpoint:
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
     
-    def test_login_nonexistent_email(self, api_client):
-        """Test login with non-existent email."""
-        data = {
-            'email': 'nonexistent@example.com',
-            'password': 'TestPassword123!'
-        }
-        
-        response = api_client.post(self.url, data, format='json')
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-    
     def test_login_inactive_user(self, api_client):
         """Test login with inactive user."""
         UserFactory(email='inactive@example.com', is_active=False)
@@ -117,38 +94,24 @@ class TestLoginEndpoint:
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
     
-    def test_login_missing_email(self, api_client):
-        """Test login without email."""
-        data = {'password': 'TestPassword123!'}
-        
-        response = api_client.post(self.url, data, format='json')
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'email' in response.data
-    
-    def test_login_missing_password(self, api_client):
-        """Test login without password."""
-        data = {'email': 'test@example.com'}
-        
+    @pytest.mark.parametrize('data, error_field', [
+        ({'email': 'nonexistent@example.com', 'password': 'TestPassword123!'}, None),
+        ({'password': 'TestPassword123!'}, 'email'),
+        ({'email': 'test@example.com'}, 'password'),
+        ({'email': '', 'password': ''}, None),
+    ], ids=['nonexistent_email', 'missing_email', 'missing_password', 'empty_credentials'])
+    def test_login_invalid_payload(self, api_client, data, error_field):
+        """Invalid or incomplete credentials are rejected with 400 (no user needed)."""
         response = api_client.post(self.url, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'password' in response.data
+        if error_field:
+            assert error_field in response.data
     
-    def test_login_empty_credentials(self, api_client):
-        """Test login with empty credentials."""
-        data = {'email': '', 'password': ''}
-        
-        response = api_client.post(self.url, data, format='json')
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-    
-    def test_login_case_sensitive_email(self, api_client):
+    def test_login_case_sensitive_email(self, api_client, shared_user):
         """Test that email login is case-insensitive (if implemented)."""
-        UserFactory(email='test@example.com')
-        
         data = {
-            'email': 'TEST@EXAMPLE.COM',
+            'email': shared_user.email.upper(),
             'password': 'TestPassword123!'
         }
         
@@ -9,7 +9,6 @@ Tests cover:
 
 import pytest
 from rest_framework import status
-from apps.users.tests.factories.user_factory import UserFactory
 
 pytestmark = [pytest.mark.api, pytest.mark.django_db]
 
@@ -19,14 +18,22 @@ class TestProfileEndpoint:
     
     url = '/api/auth/profile/'
     
-    def test_get_profile_success(self, authenticated_client, user):
+    def test_get_profile_success(self, shared_client, shared_user):
         """Test retrieving user profile."""
-        response = authenticated_client.get(self.url)
+        response = shared_client.get(self.url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['id'] == shared_user.id
+        assert response.data['email'] == shared_user.email
+        assert 'password' not in response.data
+    
+    def test_get_profile_with_jwt(self, api_client_with_token, user):
+        """Profile through a real Bearer token (CustomJWTAuthentication.get_user)."""
+        response = api_client_with_token.get(self.url)
         
         assert response.status_code == status.HTTP_200_OK
         assert response.data['id'] == user.id
         assert response.data['email'] == user.email
-        assert 'password' not in response.data
     
     def test_get_profile_without_authentication(self, api_client):
         """Test that profile requires authentication."""
@@ -115,9 +122,9 @@ class TestProfileEndpoint:
         assert response.status_code == status.HTTP_200_OK
         assert response.data['full_name'] == 'John Doe'
     
-    def test_profile_includes_timestamps(self, authenticated_client):
+    def test_profile_includes_timestamps(self, shared_client):
         """Test that profile includes created_at and updated_at."""
-        response = authenticated_client.get(self.url)
+        response = shared_client.get(self.url)
         
         assert response.status_code == status.HTTP_200_OK
         assert 'created_at' in response.data
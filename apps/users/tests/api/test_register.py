@@ -88,21 +88,6 @@ class TestRegisterEndpoint:
         assert user_data['full_name'] == 'Test User'
         assert 'password' not in user_data
     
-    def test_register_password_mismatch(self, api_client):
-        """Test registration with mismatched passwords."""
-        data = {
-            'email': 'test@example.com',
-            'first_name': 'Test',
-            'last_name': 'User',
-            'password': 'SecurePassword123!',
-            'password_confirm': 'DifferentPassword123!'
-        }
-        
-        response = api_client.post(self.url, data, format='json')
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'password_confirm' in response.data
-    
     def test_register_duplicate_email(self, api_client):
         """Test registration with existing email."""
         UserFactory(email='existing@example.com')
@@ -143,45 +128,37 @@ class TestRegisterEndpoint:
         }, format='json')
         assert resp2.status_code == status.HTTP_201_CREATED
     
-    def test_register_missing_required_fields(self, api_client):
-        """Test registration with missing required fields."""
-        data = {
-            'email': 'test@example.com'
-        }
-        
-        response = api_client.post(self.url, data, format='json')
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'first_name' in response.data
-        assert 'last_name' in response.data
-        assert 'password' in response.data
-    
-    def test_register_weak_password(self, api_client):
-        """Test registration with weak password."""
+    @pytest.mark.parametrize('overrides, error_fields', [
+        ({'password_confirm': 'DifferentPassword123!'}, ['password_confirm']),
+        ({'password': '123', 'password_confirm': '123'}, ['password']),  # NOSONAR
+        ({'email': 'invalid-email'}, ['email']),
+    ], ids=['password_mismatch', 'weak_password', 'invalid_email'])
+    def test_register_invalid_payload(self, api_client, overrides, error_fields):
+        """Invalid registration data is rejected with 400 on the offending field."""
         data = {
             'email': 'test@example.com',
             'first_name': 'Test',
             'last_name': 'User',
-            'password': '123',  # NOSONAR
-            'password_confirm': '123'  # NOSONAR
+            'password': 'SecurePassword123!',
+            'password_confirm': 'SecurePassword123!',
+            **overrides,
         }
         
         response = api_client.post(self.url, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'password' in response.data
+        for field in error_fields:
+            assert field in response.data
     
-    def test_register_invalid_email(self, api_client):
-        """Test registration with invalid email format."""
+    def test_register_missing_required_fields(self, api_client):
+        """Test registration with missing required fields."""
         data = {
-            'email': 'invalid-email',
-            'first_name': 'Test',
-            'last_name': 'User',
-            'password': 'SecurePassword123!',
-            'password_confirm': 'SecurePassword123!'
+            'email': 'test@example.com'
         }
         
         response = api_client.post(self.url, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'email' in response.data
+        assert 'first_name' in response.data
+        assert 'last_name' in response.data
+        assert 'password' in response.data
@@ -11,6 +11,8 @@ from django.test import Client
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.users.tests.factories.user_factory import DEFAULT_PASSWORD, UserFactory, password_hash
+
 User = get_user_model()
 
 
@@ -41,7 +43,7 @@ def django_client():
 @pytest.fixture
 def test_password():
     """Common password for test users."""
-    return "TestPassword123!"
+    return DEFAULT_PASSWORD
 
 
 @pytest.fixture
@@ -49,6 +51,9 @@ def create_user(db, test_password):
     """
     Factory fixture to create users with default or custom data.
     
+    The password hash is precomputed per distinct password and stored with
+    the INSERT, so creating a user costs one query and no hashing.
+    
     Usage:
         def test_something(create_user):
             user = create_user(username='testuser')
@@ -61,11 +66,8 @@ def create_user(db, test_password):
         kwargs.setdefault('first_name', 'Test')
         kwargs.setdefault('last_name', 'User')
         
-        password = kwargs.pop('password')
-        user = User.objects.create(**kwargs)
-        user.set_password(password)
-        user.save()
-        return user
+        kwargs['password'] = password_hash(kwargs['password'])
+        return User.objects.create(**kwargs)
     
     return make_user
 
@@ -82,6 +84,47 @@ def user(create_user):
     return create_user()
 
 
+@pytest.fixture(scope='module')
+def shared_user(request, django_db_setup, django_db_blocker):
+    """
+    User shared by the read-only tests of a module.
+    
+    Created once outside the per-test transaction and deleted when the
+    module finishes, so it never leaks into other modules. Its email is
+    derived from the module name under a reserved domain, so it cannot
+    collide with the emails tests create themselves. Tests that modify the
+    user must keep using the function-scoped `user` fixture.
+    
+    Usage:
+        def test_something(shared_user):
+            assert shared_user.check_password('TestPassword123!')
+    """
+    with django_db_blocker.unblock():
+        module = request.module.__name__.rsplit('.', 1)[-1]
+        user = UserFactory(
+            email=f'{module}@shared.invalid', first_name='Test', last_name='User'
+        )
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
+
+
+@pytest.fixture
+def shared_client(api_client, shared_user):
+    """
+    API client authenticated as `shared_user` (no JWT signing).
+    
+    force_authenticate skips CustomJWTAuthentication; keep at least one
+    test per endpoint on `api_client_with_token` to cover the real path.
+    
+    Usage:
+        def test_something(shared_client):
+            response = shared_client.get('/api/auth/profile/')
+    """
+    api_client.force_authenticate(user=shared_user)
+    return api_client
+
+
 @pytest.fixture
 def admin_user(create_user):
     """
@@ -100,9 +143,13 @@ def admin_user(create_user):
 
 
 @pytest.fixture
-def authenticated_client(api_client, user, test_password):
+def authenticated_client(api_client, user):
     """
-    API client with authenticated user (includes JWT token).
+    API client authenticated as `user`.
+    
+    Uses force_authenticate, so no JWT is signed or decoded per test; use
+    `api_client_with_token` when the test exercises the JWT itself. For
+    read-only tests prefer `shared_client`, which also skips creating a user.
     
     Usage:
         def test_something(authenticated_client):
@@ -158,6 +205,21 @@ def multiple_users(create_user):
     return make_users
 
 
+@pytest.fixture(autouse=True)
+def _clear_role_id_cache():
+    """
+    Vacía el cache nombre → PK de roles entre tests.
+
+    El rollback de cada test no dispara las señales de Role, así que un PK
+    cacheado en un test podría apuntar a un rol inexistente en el siguiente.
+    """
+    from apps.authorization.services import get_role_id
+
+    get_role_id.cache_clear()
+    yield
+    get_role_id.cache_clear()
+
+
 # Pytest markers for organizing tests
 def pytest_configure(config):
     """Register custom pytest markers."""
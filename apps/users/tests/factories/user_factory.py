@@ -5,14 +5,30 @@ This module provides factory classes for creating User instances
 with realistic fake data using factory_boy and Faker.
 """
 
+from functools import cache
+
 import factory
 from factory.django import DjangoModelFactory
 from faker import Faker
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
 
 fake = Faker()
 User = get_user_model()
 
+DEFAULT_PASSWORD = 'TestPassword123!'
+
+
+@cache
+def password_hash(raw_password: str) -> str:
+    """
+    Hash of *raw_password*, computed once per test session.
+
+    Every factory user with the same password shares the hash, so the
+    configured hasher runs once per distinct password instead of once per user.
+    """
+    return make_password(raw_password)
+
 
 class UserFactory(DjangoModelFactory):
     """
@@ -33,6 +49,12 @@ class UserFactory(DjangoModelFactory):
         
         # Create a superuser
         admin = UserFactory(is_staff=True, is_superuser=True)
+        
+        # Create a user with a different password (hashed once per session)
+        user = UserFactory(raw_password='Other123!')
+        
+        # A plain `password=` is also treated as the raw password and hashed
+        user = UserFactory(password='Other123!')
     """
     
     class Meta:
@@ -45,8 +67,12 @@ class UserFactory(DjangoModelFactory):
     first_name = factory.LazyAttribute(lambda _: fake.first_name())
     last_name = factory.LazyAttribute(lambda _: fake.last_name())
     
-    # Password (use post_generation to properly hash it)
-    password = factory.PostGenerationMethodCall('set_password', 'TestPassword123!')
+    # Password: the precomputed hash is written with the INSERT itself
+    # (no set_password() + second save after creation).
+    class Params:
+        raw_password = DEFAULT_PASSWORD
+    
+    password = factory.LazyAttribute(lambda o: password_hash(o.raw_password))
     
     # Account status
     is_active = True
@@ -54,6 +80,18 @@ class UserFactory(DjangoModelFactory):
     is_superuser = False
     
     # Timestamps are handled by Django auto_now_add and auto_now
+    
+    @classmethod
+    def _adjust_kwargs(cls, **kwargs):
+        # `password=` overrides the hashed declaration: a raw value would be
+        # stored verbatim as the hash, so it goes through password_hash().
+        password = kwargs.get('password')
+        if password is not None:
+            try:
+                identify_hasher(password)
+            except ValueError:
+                kwargs['password'] = password_hash(password)
+        return kwargs
 
 
 class AdminUserFactory(UserFactory):
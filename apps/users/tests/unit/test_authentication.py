@@ -17,6 +17,7 @@ from rest_framework import exceptions
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 from rest_framework_simplejwt.tokens import RefreshToken
+from apps.authorization.models import Role
 from apps.users.authentication import CustomJWTAuthentication
 from apps.users.tests.factories.user_factory import UserFactory
 
@@ -46,6 +47,25 @@ class TestCustomJWTAuthentication:
         
         assert authenticated_user == user
     
+    @pytest.mark.django_db
+    def test_authenticate_preloads_role(self, django_assert_num_queries):
+        """The user's role is fetched in the same query as the user."""
+        role = Role.objects.create(name='TestRoleAuth')
+        user = UserFactory(role=role)
+        refresh: RefreshToken = RefreshToken.for_user(user)  # type: ignore[assignment]
+        token = str(refresh.access_token)
+        
+        factory = APIRequestFactory()
+        request = factory.get('/api/test/')
+        request.META['HTTP_AUTHORIZATION'] = f'Bearer {token}'
+        
+        auth = CustomJWTAuthentication()
+        with django_assert_num_queries(1):
+            result = auth.authenticate(cast(Request, request))
+            assert result is not None
+            authenticated_user, _ = result
+            assert authenticated_user.role.name == 'TestRoleAuth'
+    
     @pytest.mark.django_db
     def test_authenticate_inactive_user_raises(self):
         """Test that inactive users raise AuthenticationFailed."""
@@ -241,3 +241,12 @@ class TestUserModelWithFactory:
         assert user.password != 'TestPassword123!'
         # Default password should work via check_password
         assert user.check_password('TestPassword123!') is True
+
+    @pytest.mark.django_db
+    def test_user_factory_hashes_raw_password_kwarg(self):
+        """A plain password= kwarg is hashed, not stored verbatim."""
+        user = UserFactory(password='Other123!')
+        
+        assert user.password != 'Other123!'
+        assert user.check_password('Other123!') is True
+
@@ -78,7 +78,38 @@ class TestGetUserList:
 
     def test_prefetches_role(self, django_assert_num_queries):
         """Iterar la lista + acceder a role.name debe ser 1 query (JOIN)."""
-        UserFactory.create_batch(3)
+        from apps.authorization.models import Role
+        UserFactory.create_batch(3, role=Role.objects.create(name='TestRoleList'))
         with django_assert_num_queries(1):
-            for u in get_user_list():
-                _ = u.role_id  # acceso directo al FK id → sin query extra
+            names = {u.role.name for u in get_user_list() if u.role_id is not None}
+        assert names == {'TestRoleList'}
+
+    def test_role_name_follows_bulk_updates(self):
+        """QuerySet.update() sobre User o Role se refleja en el listado."""
+        from apps.authorization.models import Role
+        old = Role.objects.create(name='TestRoleOld')
+        new = Role.objects.create(name='TestRoleNew')
+        user = UserFactory(role=old)
+
+        User.objects.filter(pk=user.pk).update(role=new)
+        Role.objects.filter(pk=new.pk).update(name='TestRoleRenamed')
+
+        listed = next(u for u in get_user_list() if u.pk == user.pk)
+        assert listed.role.name == 'TestRoleRenamed'
+
+    def test_defers_unused_columns(self):
+        """Columnas que el listado no serializa (ej. password) no se cargan."""
+        UserFactory()
+        user = get_user_list().first()
+        assert user is not None
+        deferred = user.get_deferred_fields()
+        assert 'password' in deferred
+        assert 'email' not in deferred
+
+    def test_annotates_full_name(self):
+        """full_name llega calculado por la DB con la misma regla que el modelo."""
+        named = UserFactory(first_name='Ana', last_name='Pérez')
+        unnamed = UserFactory(first_name='', last_name='')
+        by_pk = {u.pk: u for u in get_user_list()}
+        assert by_pk[named.pk]._full_name == 'Ana Pérez' == named.full_name
+        assert by_pk[unnamed.pk].full_name == unnamed.email
@@ -11,6 +11,7 @@ Tests cover:
 
 import pytest
 from typing import Any, cast
+from unittest.mock import patch
 from apps.users.models import User
 from apps.users.serializers import (
     UserSerializer,
@@ -67,6 +68,27 @@ class TestUserSerializer:
         assert user.first_name == 'Updated'
 
 
+class TestCachedFields:
+    """Model field generation is done once per serializer class."""
+
+    def test_fields_are_built_once_per_class(self):
+        from rest_framework.serializers import ModelSerializer
+        UserSerializer().fields  # noqa: B018  # warm the class cache
+
+        with patch.object(ModelSerializer, 'get_fields') as get_fields:
+            fields = UserSerializer().fields
+
+        get_fields.assert_not_called()
+        assert list(fields) == UserSerializer.Meta.fields
+
+    def test_instances_get_their_own_field_copies(self):
+        first = UserSerializer()
+        second = UserSerializer()
+        assert first.fields['email'] is not second.fields['email']
+        assert first.fields['email'].parent is first
+        assert second.fields['email'].parent is second
+
+
 class TestLoginSerializer:
     """Tests for LoginSerializer."""
     
@@ -84,6 +106,31 @@ class TestLoginSerializer:
         assert serializer.is_valid()
         assert cast(dict, serializer.validated_data)['user'] == user
     
+    @pytest.mark.django_db
+    def test_valid_login_runs_single_query(self, django_assert_num_queries):
+        """Login validation and the user payload need a single query."""
+        user = UserFactory(email='test@example.com')
+        
+        serializer = LoginSerializer(data={
+            'email': 'test@example.com',
+            'password': 'TestPassword123!'
+        })
+        with django_assert_num_queries(1):
+            assert serializer.is_valid()
+            validated_user = cast(dict, serializer.validated_data)['user']
+            assert UserSerializer(validated_user).data['email'] == user.email
+    
+    @pytest.mark.django_db
+    def test_nonexistent_email_still_hashes_password(self):
+        """A missing user still pays for one password hash (timing parity)."""
+        serializer = LoginSerializer(data={
+            'email': 'nonexistent@example.com',
+            'password': 'TestPassword123!'
+        })
+        with patch('apps.users.serializers.make_password') as make_password:
+            assert not serializer.is_valid()
+        make_password.assert_called_once_with('TestPassword123!')
+    
     @pytest.mark.django_db
     def test_login_with_wrong_password(self):
         """Test login with incorrect password."""
@@ -201,6 +248,30 @@ class TestRegisterSerializer:
 
         assert user.role is not None
         assert user.role.name == 'Operador'
+        assert User.objects.values_list('role__name', flat=True).get(pk=user.pk) == 'Operador'
+
+    @pytest.mark.django_db
+    def test_create_writes_user_with_single_insert(self):
+        """The user, its password hash and role are persisted by one INSERT."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        data = {
+            'email': 'oneinsert@example.com',
+            'first_name': 'One',
+            'last_name': 'Insert',
+            'password': 'SecurePassword123!',
+            'password_confirm': 'SecurePassword123!'
+        }
+        serializer = RegisterSerializer(data=data)
+        assert serializer.is_valid()
+        with CaptureQueriesContext(connection) as ctx:
+            user = cast(User, serializer.save())
+
+        writes = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith(('INSERT', 'UPDATE'))]
+        assert len(writes) == 1
+        assert writes[0].startswith('INSERT')
+        user.refresh_from_db()
+        assert user.check_password('SecurePassword123!')
 
     @pytest.mark.django_db
     def test_create_user_no_role_when_role_missing(self):
@@ -218,6 +289,43 @@ class TestRegisterSerializer:
 
         assert user.role is None
 
+    @pytest.mark.django_db
+    def test_create_concurrent_same_email_returns_email_error(self):
+        """An email taken after validation is reported as a duplicate email."""
+        from rest_framework.exceptions import ValidationError
+        data = {
+            'email': 'race@example.com',
+            'first_name': 'Race',
+            'last_name': 'User',
+            'password': 'SecurePassword123!',
+            'password_confirm': 'SecurePassword123!'
+        }
+        serializer = RegisterSerializer(data=data)
+        assert serializer.is_valid()
+        UserFactory(email='race@example.com', username='someone-else')
+
+        with pytest.raises(ValidationError) as exc_info:
+            serializer.save()
+        assert 'email' in exc_info.value.detail
+
+    @pytest.mark.django_db
+    def test_create_concurrent_same_username_retries_with_next_suffix(self):
+        """A username taken after validation is re-chosen instead of failing."""
+        data = {
+            'email': 'race@example.com',
+            'first_name': 'Race',
+            'last_name': 'User',
+            'password': 'SecurePassword123!',
+            'password_confirm': 'SecurePassword123!'
+        }
+        serializer = RegisterSerializer(data=data)
+        assert serializer.is_valid()
+        UserFactory(email='other@example.com', username='race')
+
+        user = cast(User, serializer.save())
+        assert user.username == 'race1'
+        assert user.email == 'race@example.com'
+
     @pytest.mark.django_db
     def test_registration_password_mismatch(self):
         """Test registration with mismatched passwords."""
@@ -274,6 +382,42 @@ class TestRegisterSerializer:
         # Collision resolved: username becomes 'newuser1'
         assert user.username == 'newuser1'
     
+    @pytest.mark.django_db
+    def test_registration_validation_runs_single_query(self, django_assert_num_queries):
+        """Email uniqueness and username collisions are resolved in one query."""
+        data = {
+            'email': 'single@example.com',
+            'first_name': 'Single',
+            'last_name': 'Query',
+            'password': 'SecurePassword123!',
+            'password_confirm': 'SecurePassword123!'
+        }
+        serializer = RegisterSerializer(data=data)
+        with django_assert_num_queries(1):
+            assert serializer.is_valid(), serializer.errors
+    
+    @pytest.mark.django_db
+    def test_registration_skips_all_taken_suffixes(self):
+        """Several taken usernames are skipped using a single lookup query."""
+        for index, username in enumerate(['dup', 'dup1', 'dup2']):
+            User.objects.create_user(
+                username=username,
+                email=f'dup-{index}@example.com',
+                password='pass',  # noqa: S106  # NOSONAR
+            )
+
+        data = {
+            'email': 'dup@example.com',
+            'first_name': 'Dup',
+            'last_name': 'User',
+            'password': 'SecurePassword123!',
+            'password_confirm': 'SecurePassword123!'
+        }
+        serializer = RegisterSerializer(data=data)
+        assert serializer.is_valid(), serializer.errors
+        user = cast(User, serializer.save())
+        assert user.username == 'dup3'
+    
     @pytest.mark.django_db
     def test_registration_weak_password(self):
         """Test registration with weak password."""
@@ -397,3 +541,26 @@ class TestChangePasswordSerializer:
         
         assert not serializer.is_valid()
         assert 'new_password' in serializer.errors
+    
+    @pytest.mark.django_db
+    def test_password_change_to_same_password_is_rejected(self, user):
+        """Changing to the current password is a 400 on new_password, not a no-op."""
+        data = {
+            'old_password': 'TestPassword123!',
+            'new_password': 'TestPassword123!',
+            'new_password_confirm': 'TestPassword123!'
+        }
+        
+        class MockRequest:
+            user: Any
+        
+        request = MockRequest()
+        request.user = user
+        
+        serializer = ChangePasswordSerializer(
+            data=data,
+            context={'request': request}
+        )
+        
+        assert not serializer.is_valid()
+        assert 'new_password' in serializer.errors
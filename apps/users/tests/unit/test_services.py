@@ -10,7 +10,13 @@ from django.core.exceptions import ValidationError
 
 from apps.authorization.models import Permission, Role
 from apps.users.models import User
-from apps.users.services import create_user, deactivate_user, reset_password, update_user
+from apps.users.services import (
+    create_user,
+    deactivate_user,
+    deactivate_users,
+    reset_password,
+    update_user,
+)
 from apps.users.tests.factories.user_factory import UserFactory
 
 pytestmark = [pytest.mark.unit, pytest.mark.django_db]
@@ -65,6 +71,17 @@ class TestCreateUser:
         )
         assert user.username.startswith('juanperez')
 
+    def test_username_collisions_take_next_free_suffix(self):
+        UserFactory(email='colision@a.com', username='colision')
+        UserFactory(email='colision@b.com', username='colision1')
+        user = create_user(
+            email='colision@c.com',
+            first_name='C',
+            last_name='C',
+            password='SecurePass123!',  # noqa: S106 # NOSONAR
+        )
+        assert user.username == 'colision2'
+
     def test_duplicate_email_raises(self):
         UserFactory(email='dup@example.com')
         with pytest.raises(ValidationError, match='email'):
@@ -75,15 +92,6 @@ class TestCreateUser:
                 password='SecurePass123!',  # noqa: S106 # NOSONAR
             )
 
-    def test_weak_password_raises(self):
-        with pytest.raises(ValidationError):
-            create_user(
-                email='weak@example.com',
-                first_name='W',
-                last_name='P',
-                password='123',  # noqa: S106 # NOSONAR
-            )
-
     def test_can_set_role(self, role_operador):
         user = create_user(
             email='withrole@example.com',
@@ -165,6 +173,16 @@ class TestUpdateUser:
         assert user.first_name == 'Same'
         assert user.token_version == token_v
 
+    def test_unchanged_values_skip_write(self, django_assert_num_queries):
+        user = UserFactory(first_name='Same', last_name='Name')
+        with django_assert_num_queries(0):
+            update_user(user=user, first_name='Same', last_name='Name')
+
+    def test_empty_update_runs_no_queries(self, django_assert_num_queries):
+        user = UserFactory()
+        with django_assert_num_queries(0):
+            update_user(user=user)
+
 
 # ---------------------------------------------------------------------------
 # deactivate_user
@@ -195,6 +213,41 @@ class TestDeactivateUser:
 # reset_password
 # ---------------------------------------------------------------------------
 
+class TestDeactivateUsers:
+    def test_deactivates_all_in_one_query(self, django_assert_num_queries):
+        users = UserFactory.create_batch(3)
+        with django_assert_num_queries(1):
+            count = deactivate_users(user_ids=[u.pk for u in users])
+        assert count == 3
+        for user in users:
+            original_version = user.token_version
+            user.refresh_from_db()
+            assert user.is_active is False
+            assert user.token_version == original_version + 1
+
+    def test_skips_inactive_users(self):
+        from apps.users.tests.factories.user_factory import InactiveUserFactory
+        inactive = InactiveUserFactory()
+        original_version = inactive.token_version
+        assert deactivate_users(user_ids=[inactive.pk]) == 0
+        inactive.refresh_from_db()
+        assert inactive.token_version == original_version
+
+
+class TestTokenVersionBump:
+    def test_increment_is_done_by_the_db(self):
+        """Una instancia desactualizada no pisa el incremento de otra."""
+        user = UserFactory()
+        original_version = user.token_version
+        stale = User.objects.get(pk=user.pk)
+
+        deactivate_user(user=user)
+        reset_password(user=stale)
+
+        user.refresh_from_db()
+        assert user.token_version == original_version + 2
+
+
 class TestResetPassword:
     def test_returns_string(self):
         user = UserFactory()
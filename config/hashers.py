@@ -0,0 +1,23 @@
+"""
+config.hashers
+==============
+Hasher de contraseñas del proyecto.
+
+Los valores por defecto de Django para Argon2 (100 MiB, 8 lanes) hacen que
+cada login reserve mucha memoria. Esta variante usa los parámetros de
+Argon2id recomendados por OWASP (19 MiB, 2 iteraciones, 1 lane),
+configurables por settings. Conserva el algoritmo ``argon2``: los hashes
+existentes siguen verificando y Django los recalcula con los parámetros
+nuevos en el siguiente login.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    time_cost = getattr(settings, "ARGON2_TIME_COST", 2)
+    memory_cost = getattr(settings, "ARGON2_MEMORY_COST", 19456)
+    parallelism = getattr(settings, "ARGON2_PARALLELISM", 1)
@@ -0,0 +1,25 @@
+"""
+config.openapi
+==============
+Helpers compartidos para la metadata OpenAPI (drf-spectacular) de las apps.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from django.conf import settings
+from drf_spectacular.utils import extend_schema
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def documented(schema: Callable[[], dict[str, Any]]) -> Callable[[_F], _F]:
+    """
+    Equivalente a ``extend_schema(**schema())`` cuando el schema OpenAPI está
+    habilitado; decorador identidad (sin construir nada) en caso contrario.
+    """
+    if not getattr(settings, "OPENAPI_SCHEMA_ENABLED", True):
+        return lambda view_method: view_method
+    return extend_schema(**schema())
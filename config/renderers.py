@@ -0,0 +1,39 @@
+"""
+config.renderers
+================
+Renderers DRF compartidos por todas las apps.
+
+`ORJSONRenderer` reemplaza al `JSONRenderer` de DRF: misma salida (UTF-8
+compacto, fechas ISO 8601 con sufijo `Z`), pero serializada en C por orjson.
+Los tipos que orjson no conoce (Decimal, lazy strings, QuerySet, ...) se
+delegan al encoder de DRF, así el contrato de las respuestas no cambia.
+Las claves no string (int, UUID, ...) se convierten a string como hace el
+módulo json, en lugar de fallar.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from rest_framework.encoders import JSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+_drf_default = JSONEncoder().default
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict[str, Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=_drf_default, option=_OPTIONS)
@@ -0,0 +1,31 @@
+"""
+config.serializers
+==================
+Serializers DRF base compartidos por todas las apps.
+
+`CachedFieldsModelSerializer` genera los campos de un ModelSerializer una sola
+vez por clase. DRF repite en cada instancia la introspección del modelo
+(`get_fields` → `build_field` por columna); como `Meta` no cambia en runtime,
+el resultado es siempre el mismo. Cada instancia recibe copias superficiales
+de los campos cacheados, porque `bind()` les asigna estado (`parent`,
+`field_name`, `source_attrs`).
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, ClassVar
+
+from rest_framework import serializers
+from rest_framework.fields import Field
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    _fields_cache: ClassVar[dict[type, dict[str, Field]]] = {}
+
+    def get_fields(self) -> dict[str, Any]:
+        cls = type(self)
+        fields = self._fields_cache.get(cls)
+        if fields is None:
+            fields = self._fields_cache[cls] = super().get_fields()
+        return {name: copy.copy(field) for name, field in fields.items()}
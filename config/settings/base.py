@@ -48,6 +48,7 @@ INSTALLED_APPS = [
     'apps.trading',
     'apps.playground',
     'rest_framework',
+    'adrf',
     'rest_framework_simplejwt',
     'rest_framework_simplejwt.token_blacklist',
     'corsheaders',
@@ -119,11 +120,15 @@ AUTH_PASSWORD_VALIDATORS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.CustomJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'config.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
         'rest_framework.filters.SearchFilter',
@@ -134,6 +139,27 @@ REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
+# Si False, las views que usan `documented()` (ej. apps.authorization.schemas)
+# no construyen su metadata OpenAPI al importarse. Útil en workers que no
+# sirven /api/schema/.
+OPENAPI_SCHEMA_ENABLED = os.getenv('OPENAPI_SCHEMA_ENABLED', 'True') == 'True'
+
+# Máximo de segundos que un worker puede servir permisos RBAC cacheados tras
+# un cambio hecho en otro proceso (en el propio proceso el efecto es
+# inmediato; ver apps.authorization.services). 0 desactiva la expiración.
+RBAC_PERMISSIONS_TTL = int(os.getenv('RBAC_PERMISSIONS_TTL', '30'))
+
+# Segundos que se cachea la respuesta de /api/schema/. El esquema solo cambia
+# con un deploy, así que se genera una vez por proceso/ventana en lugar de en
+# cada request. 0 desactiva el cache.
+OPENAPI_SCHEMA_CACHE_SECONDS = int(os.getenv('OPENAPI_SCHEMA_CACHE_SECONDS', '3600'))
+
+# Si True, `GET /trading/assets/` precarga en background el listado de
+# clientes en el cache (clave por versión del listado), ya que la UI suele
+# pedir ambos juntos. Desactivado por defecto: cada precarga usa un thread y
+# una conexión a la DB extra; activar con TRADING_PREFETCH_CLIENTS=True.
+TRADING_PREFETCH_CLIENTS = os.getenv('TRADING_PREFETCH_CLIENTS', 'False') == 'True'
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'KaizenUTN API',
     'DESCRIPTION': (
@@ -216,8 +242,13 @@ SIMPLE_JWT = {
 }
 
 # Password Hashing - Argon2 (más seguro)
+# Parámetros de Argon2id (ver config.hashers). memory_cost en KiB.
+ARGON2_TIME_COST = int(os.getenv('ARGON2_TIME_COST', '2'))
+ARGON2_MEMORY_COST = int(os.getenv('ARGON2_MEMORY_COST', '19456'))
+ARGON2_PARALLELISM = int(os.getenv('ARGON2_PARALLELISM', '1'))
+
 PASSWORD_HASHERS = [
-    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'config.hashers.TunedArgon2PasswordHasher',
     'django.contrib.auth.hashers.PBKDF2PasswordHasher',
     'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
     'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
@@ -19,6 +19,9 @@ class DisableMigrations:
 
 MIGRATION_MODULES = DisableMigrations()
 
+# La precarga corre en otro thread/conexión, que no ve la DB en memoria del test.
+TRADING_PREFETCH_CLIENTS = False
+
 # Simplify password hashing for faster tests
 PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.MD5PasswordHasher',
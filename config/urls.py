@@ -14,21 +14,30 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path
 from django.urls import include
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularSwaggerView,
     SpectacularRedocView,
 )
 
+# El esquema es público (SERVE_PUBLIC) e igual para todos los usuarios; solo
+# varía según el formato negociado por Accept (YAML / JSON).
+_schema_view = vary_on_headers('Accept')(SpectacularAPIView.as_view())
+if settings.OPENAPI_SCHEMA_CACHE_SECONDS:
+    _schema_view = cache_page(settings.OPENAPI_SCHEMA_CACHE_SECONDS)(_schema_view)
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('config.api_urls')),
 
     # API Schema & Documentation
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('api/schema/', _schema_view, name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
 ]
@@ -27,10 +27,11 @@ python manage.py seed_authorization
 echo "[4/5] Collecting static files..."
 python manage.py collectstatic --noinput
 
-# ── 5. Gunicorn ────────────────────────────────────────────────────────────
-echo "[5/5] Starting Gunicorn..."
+# ── 5. Gunicorn + workers Uvicorn (ASGI, uvloop + httptools) ────────────────
+echo "[5/5] Starting Gunicorn (Uvicorn workers)..."
 echo "========================================"
-exec gunicorn config.wsgi:application \
+exec gunicorn config.asgi:application \
+  --worker-class uvicorn_worker.UvicornWorker \
   --bind 0.0.0.0:8000 \
   --workers 3 \
   --timeout 60 \